@@ -11,6 +11,13 @@ with open("README.md", "r", encoding="utf-8") as fh:
 with open("requirements.txt", "r", encoding="utf-8") as fh:
     requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
 
+# Optionally compile the template engine's hot-path kernels with mypyc
+# (IBN_COMPILE_KERNELS=1); the pure-Python module is used otherwise
+ext_modules = []
+if os.environ.get("IBN_COMPILE_KERNELS") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify(["--follow-imports=skip", "src/Intents_Generators/Template_Kernels.py"])
+
 setup(
     name="intent-based-network-generation-augmentation",
     version="2.0.0",
@@ -28,15 +35,13 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Topic :: Scientific/Engineering :: Artificial Intelligence",
         "Topic :: Software Development :: Libraries :: Python Modules",
         "Topic :: System :: Networking",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     install_requires=requirements,
     extras_require={
         "dev": [
@@ -54,6 +59,7 @@ setup(
             "ibn-generate=src.main:main",
         ],
     },
+    ext_modules=ext_modules,
     include_package_data=True,
     package_data={
         "": ["*.md", "*.txt", "*.yml", "*.yaml"],
@@ -80,13 +80,16 @@ def tfidf_similarity(texts, sample=800):
     }
 
 # ---- Basic Grammar Heuristic ----
+REPEATED_WORD_RE = re.compile(r'\b(\w+)\s+\1\b')
+PASSIVE_VOICE_RE = re.compile(r'\b(is|was|were|are|been|being|be) \w+ed\b')
+
 def grammar_and_syntax(texts, sample=500):
     samples = list(texts[:sample])
     grammar_stats = []
     for s in samples:
         errors = 0
         if not s.endswith(('.', '?', '!')): errors += 1
-        if re.search(r'\b(\w+)\s+\1\b', s): errors += 1  # repeated word
+        if REPEATED_WORD_RE.search(s): errors += 1  # repeated word
         if len(s.split()) < 3: errors += 1
         grammar_stats.append(errors)
 
@@ -95,7 +98,7 @@ def grammar_and_syntax(texts, sample=500):
     return {
         "avg_grammar_errors": np.mean(grammar_stats),
         "median_grammar_errors": np.median(grammar_stats),
-        "passive_voice_ratio": sum(1 for s in samples if re.search(r'\b(is|was|were|are|been|being|be) \w+ed\b', s)) / len(samples),
+        "passive_voice_ratio": sum(1 for s in samples if PASSIVE_VOICE_RE.search(s)) / len(samples),
         "pos_diversity": len(pos_dist),
         "most_common_pos": pos_dist.most_common(5)
     }
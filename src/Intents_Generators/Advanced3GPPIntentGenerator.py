@@ -7,7 +7,7 @@ from dataclasses import asdict
 from datetime import datetime
 from typing import List, Dict, Any
 
-from .Constants_Enums import IntentType, Priority, ADVANCED_LOCATIONS, ADVANCED_SLICE_TYPES, COMPLIANCE_STANDARDS, RESEARCH_CONTEXTS
+from .Constants_Enums import IntentType, Priority, ADVANCED_LOCATIONS, ADVANCED_SLICE_TYPES, COMPLIANCE_STANDARDS, RESEARCH_CONTEXTS, CRITICAL_PRIORITIES, ELEVATED_PRIORITIES
 from .Data_Structures import NetworkIntent
 from .utils_generator import generate_unique_id, random_choice, random_int, random_float, current_timestamp
 from .Template_Engine import AdvancedTemplateEngine, TemplateContext
@@ -28,6 +28,23 @@ except ImportError:
         DataEvaluator = None
 
 
+# Quality score bonuses, looked up per generated record
+PRIORITY_QUALITY_BONUS = {
+    'EMERGENCY': 1.0,
+    'CRITICAL': 0.8,
+    'HIGH': 0.5,
+    'MEDIUM': 0.2,
+    'LOW': 0.0
+}
+
+SLICE_QUALITY_BONUS = {
+    'V2X': 0.8,
+    'URLLC': 0.6,
+    'eMBB': 0.4,
+    'mMTC': 0.2
+}
+
+
 class Advanced3GPPIntentGenerator:
     """Main class for generating advanced 3GPP intent records."""
     
@@ -237,30 +254,19 @@ class Advanced3GPPIntentGenerator:
         
         complexity_bonus = (complexity / 10) * 2.0  # 0 to 2.0
         
-        priority_bonus = {
-            'EMERGENCY': 1.0,
-            'CRITICAL': 0.8,
-            'HIGH': 0.5,
-            'MEDIUM': 0.2,
-            'LOW': 0.0
-        }.get(priority, 0.0)
+        priority_bonus = PRIORITY_QUALITY_BONUS.get(priority, 0.0)
         
         slice_category = self.constraint_engine.categorize_slice_type(slice_type)
-        slice_bonus = {
-            'V2X': 0.8,
-            'URLLC': 0.6,
-            'eMBB': 0.4,
-            'mMTC': 0.2
-        }.get(slice_category, 0.0)
+        slice_bonus = SLICE_QUALITY_BONUS.get(slice_category, 0.0)
         
         total_score = base_score + complexity_bonus + priority_bonus + slice_bonus
         return min(10.0, total_score)
     
     def _determine_research_relevance(self, complexity: int, priority: str) -> str:
         """Determine research relevance based on parameters."""
-        if complexity >= 8 and priority in ['CRITICAL', 'EMERGENCY']:
+        if complexity >= 8 and priority in CRITICAL_PRIORITIES:
             return 'HIGH'
-        elif complexity >= 6 or priority in ['HIGH', 'CRITICAL']:
+        elif complexity >= 6 or priority in ELEVATED_PRIORITIES:
             return 'MEDIUM'
         else:
             return 'LOW'
@@ -17,6 +17,11 @@ class Priority(Enum):
     CRITICAL = "CRITICAL"
     EMERGENCY = "EMERGENCY"
 
+# Priority and slice groupings used in membership checks
+CRITICAL_PRIORITIES = frozenset({'CRITICAL', 'EMERGENCY'})
+ELEVATED_PRIORITIES = frozenset({'HIGH', 'CRITICAL'})
+LOW_LATENCY_SLICES = frozenset({'URLLC', 'V2X'})
+
 NETWORK_FUNCTIONS = [
     'AMF', 'SMF', 'UPF', 'PCF', 'UDM', 'AUSF', 'NRF', 'NSSF', 'NEF', 'AF',
     'gNB', 'eNB', 'ng-eNB', 'UE', 'N3IWF', 'TNGF', 'TWIF', 'W-AGF',
@@ -6,10 +6,11 @@ from typing import Dict, Any
 from .Constants_Enums import (
     NETWORK_FUNCTIONS, TELECOM_VENDORS, CLOUD_PROVIDERS, 
     CONTAINER_RUNTIMES, IMAGE_REGISTRIES, SERVICE_MESHES,
-    ORCHESTRATION_TOOLS, CONFIG_MANAGEMENT_TOOLS
+    ORCHESTRATION_TOOLS, CONFIG_MANAGEMENT_TOOLS,
+    CRITICAL_PRIORITIES, ELEVATED_PRIORITIES, LOW_LATENCY_SLICES
 )
 from .Parameter_Generator import ParameterGenerator
-from .utils_generator import current_timestamp, generate_unique_id, random_choice, random_int, random_float
+from .utils_generator import current_timestamp, generate_unique_id, random_choice, random_int, random_float, get_nested
 
 class DeploymentIntentGenerator:
     """Generator for deployment intent records."""
@@ -389,9 +390,9 @@ class DeploymentIntentGenerator:
     
     def _determine_service_level(self, priority: str, complexity: int) -> str:
         """Determine service level based on priority and complexity."""
-        if priority in ['EMERGENCY', 'CRITICAL'] and complexity >= 8:
+        if priority in CRITICAL_PRIORITIES and complexity >= 8:
             return 'PLATINUM_PLUS'
-        elif priority in ['CRITICAL', 'HIGH'] and complexity >= 6:
+        elif priority in ELEVATED_PRIORITIES and complexity >= 6:
             return 'PLATINUM'
         elif priority == 'HIGH' or complexity >= 7:
             return 'GOLD_PREMIUM'
@@ -408,7 +409,7 @@ class DeploymentIntentGenerator:
         location_category = self._categorize_location(location)
         
         # Select appropriate architecture
-        if slice_category in ['URLLC', 'V2X']:
+        if slice_category in LOW_LATENCY_SLICES:
             architecture = 'Standalone_5G'  # SA for low latency
         elif location_category == 'rural':
             architecture = 'Non_Standalone_5G'  # NSA for coverage
@@ -457,7 +458,7 @@ class DeploymentIntentGenerator:
     
     def _select_spectrum_bands(self, slice_category: str) -> Dict[str, str]:
         """Select appropriate spectrum bands for slice category."""
-        if slice_category in ['URLLC', 'V2X']:
+        if slice_category in LOW_LATENCY_SLICES:
             # Prefer mid-band for balance of coverage and capacity
             return {
                 "low_band": random.choice(['700MHz', '800MHz']),
@@ -481,7 +482,7 @@ class DeploymentIntentGenerator:
     
     def _select_antenna_config(self, slice_category: str, location_category: str) -> Dict[str, str]:
         """Select appropriate antenna configuration."""
-        if slice_category in ['URLLC', 'V2X'] or location_category == 'industrial':
+        if slice_category in LOW_LATENCY_SLICES or location_category == 'industrial':
             # High-performance antennas for critical applications
             return {
                 "type": random.choice(['Massive_MIMO_64T64R', 'Massive_MIMO_32T32R']),
@@ -501,7 +502,7 @@ class DeploymentIntentGenerator:
             backhaul_type = random.choice(['Microwave', 'Satellite', 'Hybrid_Fiber_Wireless'])
             capacity = f"{random_int(1, 10)}Gbps"
             latency = f"{random_float(2, 10)}ms"
-        elif slice_category in ['URLLC', 'V2X']:
+        elif slice_category in LOW_LATENCY_SLICES:
             backhaul_type = 'Fiber_Optic'  # Lowest latency
             capacity = f"{random_int(10, 100)}Gbps"
             latency = f"{random_float(0.1, 1)}ms"
@@ -514,7 +515,7 @@ class DeploymentIntentGenerator:
             "type": backhaul_type,
             "capacity": capacity,
             "latency": latency,
-            "redundancy": "Active_Active" if slice_category in ['URLLC', 'V2X'] else random.choice(['Active_Active', 'Active_Standby'])
+            "redundancy": "Active_Active" if slice_category in LOW_LATENCY_SLICES else random.choice(['Active_Active', 'Active_Standby'])
         }
     
     def _select_appropriate_nf(self, slice_type: str) -> str:
@@ -539,7 +540,7 @@ class DeploymentIntentGenerator:
         version_patch = random_int(0, 99)
         
         providers = TELECOM_VENDORS
-        if priority in ['CRITICAL', 'EMERGENCY']:
+        if priority in CRITICAL_PRIORITIES:
             # Prefer established vendors for critical deployments
             providers = ['Ericsson', 'Nokia', 'Cisco']
         
@@ -557,7 +558,7 @@ class DeploymentIntentGenerator:
         slice_category = self._categorize_slice_type(slice_type)
         
         # Determine optimization focus
-        if slice_category in ['URLLC', 'V2X']:
+        if slice_category in LOW_LATENCY_SLICES:
             optimization = 'Network'  # Low latency focus
         elif slice_category == 'eMBB':
             optimization = 'Compute'  # High throughput focus
@@ -584,8 +585,8 @@ class DeploymentIntentGenerator:
         base_timeout = 300 + (complexity * 60)  # 300-900 seconds
         
         # Critical priorities get more conservative settings
-        rollback_on_failure = priority in ['CRITICAL', 'EMERGENCY']
-        skip_verification = priority not in ['CRITICAL', 'EMERGENCY'] and complexity < 5
+        rollback_on_failure = priority in CRITICAL_PRIORITIES
+        skip_verification = priority not in CRITICAL_PRIORITIES and complexity < 5
         
         return {
             "lcm_operations_configuration": {
@@ -596,16 +597,16 @@ class DeploymentIntentGenerator:
                 },
                 "scale": {
                     "timeout": f"{base_timeout // 5}seconds",
-                    "scale_type": random.choice(['SCALE_OUT', 'SCALE_UP'] if priority in ['HIGH', 'CRITICAL'] else ['SCALE_OUT', 'SCALE_IN', 'SCALE_UP', 'SCALE_DOWN'])
+                    "scale_type": random.choice(['SCALE_OUT', 'SCALE_UP'] if priority in ELEVATED_PRIORITIES else ['SCALE_OUT', 'SCALE_IN', 'SCALE_UP', 'SCALE_DOWN'])
                 },
                 "heal": {
                     "timeout": f"{base_timeout // 3}seconds",
-                    "heal_type": 'RESTART' if priority in ['CRITICAL', 'EMERGENCY'] else random.choice(['RESTART', 'REBUILD', 'MIGRATE'])
+                    "heal_type": 'RESTART' if priority in CRITICAL_PRIORITIES else random.choice(['RESTART', 'REBUILD', 'MIGRATE'])
                 }
             },
             "affinity_rules": {
-                "anti_affinity": 'HOST' if priority in ['CRITICAL', 'EMERGENCY'] else random.choice(['HOST', 'ZONE', 'REGION']),
-                "affinity": 'HARD' if priority in ['CRITICAL', 'EMERGENCY'] else random.choice(['SOFT', 'HARD', 'PREFERRED'])
+                "anti_affinity": 'HOST' if priority in CRITICAL_PRIORITIES else random.choice(['HOST', 'ZONE', 'REGION']),
+                "affinity": 'HARD' if priority in CRITICAL_PRIORITIES else random.choice(['SOFT', 'HARD', 'PREFERRED'])
             }
         }
     
@@ -677,7 +678,7 @@ class DeploymentIntentGenerator:
         reliability = min(99.999, random.uniform(*reqs['reliability']) * (1 + (priority_multiplier - 1) * 0.001))
         
         # Scaling requirements
-        if priority in ['CRITICAL', 'EMERGENCY']:
+        if priority in CRITICAL_PRIORITIES:
             scaling_policy = 'CPU_BASED'  # Most responsive
             max_instances = random_int(100, 1000)
         else:
@@ -701,7 +702,7 @@ class DeploymentIntentGenerator:
         slice_category = self._categorize_slice_type(slice_type)
         
         # Critical slices and high priority get stronger security
-        if slice_category in ['URLLC', 'V2X'] or priority in ['CRITICAL', 'EMERGENCY']:
+        if slice_category in LOW_LATENCY_SLICES or priority in CRITICAL_PRIORITIES:
             encryption = random.choice(['256_NEA1', '256_NEA2'])
             integrity = random.choice(['256_NIA1', '256_NIA2'])
             key_length = '256_bit'
@@ -725,14 +726,14 @@ class DeploymentIntentGenerator:
             "privacy_protection": {
                 "supi_concealment": "ENABLED",
                 "temporary_identifiers": random.choice(['5G_GUTI', '5G_TMSI']),
-                "location_privacy": "FULL_PROTECTION" if priority in ['CRITICAL', 'EMERGENCY'] else random.choice(['FULL_PROTECTION', 'PARTIAL_PROTECTION'])
+                "location_privacy": "FULL_PROTECTION" if priority in CRITICAL_PRIORITIES else random.choice(['FULL_PROTECTION', 'PARTIAL_PROTECTION'])
             }
         }
     
     def _generate_constrained_monitoring(self, complexity: int, priority: str) -> Dict[str, Any]:
         """Generate monitoring parameters based on complexity and priority."""
         # More complex and critical deployments get more intensive monitoring
-        if complexity >= 8 or priority in ['CRITICAL', 'EMERGENCY']:
+        if complexity >= 8 or priority in CRITICAL_PRIORITIES:
             sampling_rate = random_int(80, 100)
             aggregation_interval = random_int(1, 10)
             retention_period = random_int(90, 365)
@@ -754,9 +755,9 @@ class DeploymentIntentGenerator:
             "alerting_configuration": {
                 "severity_levels": ['CRITICAL', 'MAJOR', 'MINOR', 'WARNING', 'INFO'],
                 "escalation_policy": {
-                    "level1": f"{random_int(1, 3)}minutes" if priority in ['CRITICAL', 'EMERGENCY'] else f"{random_int(1, 5)}minutes",
-                    "level2": f"{random_int(3, 10)}minutes" if priority in ['CRITICAL', 'EMERGENCY'] else f"{random_int(5, 15)}minutes",
-                    "level3": f"{random_int(10, 30)}minutes" if priority in ['CRITICAL', 'EMERGENCY'] else f"{random_int(15, 60)}minutes"
+                    "level1": f"{random_int(1, 3)}minutes" if priority in CRITICAL_PRIORITIES else f"{random_int(1, 5)}minutes",
+                    "level2": f"{random_int(3, 10)}minutes" if priority in CRITICAL_PRIORITIES else f"{random_int(5, 15)}minutes",
+                    "level3": f"{random_int(10, 30)}minutes" if priority in CRITICAL_PRIORITIES else f"{random_int(15, 60)}minutes"
                 }
             },
             "analytics_configuration": {
@@ -775,7 +776,7 @@ class DeploymentIntentGenerator:
         if complexity >= 7:
             base_metrics.extend(['jitter', 'packet_loss', 'resource_utilization'])
         
-        if priority in ['CRITICAL', 'EMERGENCY']:
+        if priority in CRITICAL_PRIORITIES:
             base_metrics.extend(['security_events', 'performance_degradation'])
         
         if complexity >= 8:
@@ -785,8 +786,8 @@ class DeploymentIntentGenerator:
     @staticmethod
     def generate_description(params: Dict[str, Any], location: str, slice_type: str) -> str:
         """Generate sophisticated deployment intent description."""
-        nf = params.get("deployment_specification", {}).get("network_function", random_choice(NETWORK_FUNCTIONS))
-        flavor = params.get("deployment_specification", {}).get("deployment_flavor", {}).get("description", "High_Performance")
+        nf = get_nested(params, ("deployment_specification", "network_function"), random_choice(NETWORK_FUNCTIONS))
+        flavor = get_nested(params, ("deployment_specification", "deployment_flavor", "description"), "High_Performance")
         complexity = random_choice(['sophisticated', 'advanced', 'comprehensive', 'intelligent', 'adaptive'])
         
         return (f"Execute {complexity} deployment of {nf} network function with "
@@ -9,7 +9,10 @@ import random
 import uuid
 from typing import Dict, Any, List, Tuple, Optional
 from dataclasses import dataclass
-from .Constants_Enums import IntentType, Priority, NETWORK_FUNCTIONS, ADVANCED_SLICE_TYPES, ADVANCED_LOCATIONS
+from .Constants_Enums import (
+    IntentType, Priority, NETWORK_FUNCTIONS, ADVANCED_SLICE_TYPES, ADVANCED_LOCATIONS,
+    CRITICAL_PRIORITIES, LOW_LATENCY_SLICES
+)
 
 @dataclass
 class ConstraintRule:
@@ -330,7 +333,7 @@ class EnhancedConstraintEngine:
         throughput = random.randint(*base_throughput_range)
         
         # Priority affects throughput requirements
-        if priority in ['CRITICAL', 'EMERGENCY']:
+        if priority in CRITICAL_PRIORITIES:
             throughput = int(throughput * random.uniform(1.2, 2.0))
         
         # Generate reliability with constraints
@@ -338,7 +341,7 @@ class EnhancedConstraintEngine:
         reliability_boost = location_constraints.get('reliability_boost', 1.0)
         
         reliability = min(99.9999, base_reliability_range[1] * reliability_boost)
-        if priority in ['CRITICAL', 'EMERGENCY']:
+        if priority in CRITICAL_PRIORITIES:
             reliability = min(99.9999, reliability * 1.001)  # Slight boost for critical
         
         # Generate other QoS parameters
@@ -352,9 +355,9 @@ class EnhancedConstraintEngine:
             "packet_delay_budget": f"{latency}ms",
             "packet_error_rate": f"{packet_error_rate}",
             "priority_level": self._get_priority_level(priority),
-            "preemption_capability": "MAY_PREEMPT" if priority in ['CRITICAL', 'EMERGENCY'] else "SHALL_NOT_PREEMPT",
-            "preemption_vulnerability": "NOT_PREEMPTABLE" if priority in ['CRITICAL', 'EMERGENCY'] else "PREEMPTABLE",
-            "reflective_qos": "ENABLED" if slice_category in ['URLLC', 'V2X'] else "DISABLED",
+            "preemption_capability": "MAY_PREEMPT" if priority in CRITICAL_PRIORITIES else "SHALL_NOT_PREEMPT",
+            "preemption_vulnerability": "NOT_PREEMPTABLE" if priority in CRITICAL_PRIORITIES else "PREEMPTABLE",
+            "reflective_qos": "ENABLED" if slice_category in LOW_LATENCY_SLICES else "DISABLED",
             "jitter_tolerance": f"{jitter}ms"
         }
     
@@ -371,7 +374,7 @@ class EnhancedConstraintEngine:
         rate = random.uniform(*rate_range)
         
         # Priority affects error rate requirements
-        if priority in ['CRITICAL', 'EMERGENCY']:
+        if priority in CRITICAL_PRIORITIES:
             rate *= 0.1  # Much lower error rate
         
         return f"{rate:.2e}"
@@ -436,7 +439,7 @@ class EnhancedConstraintEngine:
         storage_gb = int(random.randint(*resources['storage_gb']) * complexity_multiplier)
         
         # Priority affects resource allocation
-        if priority in ['CRITICAL', 'EMERGENCY']:
+        if priority in CRITICAL_PRIORITIES:
             cpu_cores = int(cpu_cores * 1.5)
             memory_gb = int(memory_gb * 1.5)
         
@@ -527,7 +530,7 @@ class EnhancedConstraintEngine:
                        for ctx in contexts]
         
         # Add priority-based modifiers
-        if priority in ['CRITICAL', 'EMERGENCY']:
+        if priority in CRITICAL_PRIORITIES:
             contexts = [ctx.replace('Analysis', 'Critical_Analysis').replace('Study', 'Mission_Critical_Study') 
                        for ctx in contexts]
         
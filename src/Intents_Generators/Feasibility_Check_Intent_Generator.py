@@ -3,7 +3,7 @@ import random
 from datetime import datetime, timedelta
 from typing import Dict, Any
 from .Parameter_Generator import ParameterGenerator
-from .utils_generator import current_timestamp, generate_unique_id, random_choice, random_int, random_float
+from .utils_generator import current_timestamp, generate_unique_id, random_choice, random_int, random_float, get_nested
 
 class FeasibilityCheckIntentGenerator:
     """Generator for feasibility check intent records."""
@@ -169,8 +169,8 @@ class FeasibilityCheckIntentGenerator:
     @staticmethod
     def generate_description(params: Dict[str, Any], location: str, slice_type: str) -> str:
         """Generate sophisticated feasibility check intent description."""
-        assessment_scope = params.get("feasibility_assessment", {}).get("assessment_scope", "COMPREHENSIVE")
-        recommendation = params.get("recommendation_engine", {}).get("recommendation", "PROCEED")
+        assessment_scope = get_nested(params, ("feasibility_assessment", "assessment_scope"), "COMPREHENSIVE")
+        recommendation = get_nested(params, ("recommendation_engine", "recommendation"), "PROCEED")
         complexity = random_choice(['sophisticated', 'advanced', 'comprehensive', 'intelligent', 'adaptive'])
         
         return (f"Conduct {complexity} {assessment_scope.lower()} feasibility analysis for "
@@ -2,7 +2,7 @@ import uuid
 import random
 from typing import Dict, Any
 from .Parameter_Generator import ParameterGenerator
-from .utils_generator import current_timestamp, generate_unique_id, random_choice, random_int, random_timestamp_within_days
+from .utils_generator import current_timestamp, generate_unique_id, random_choice, random_int, random_timestamp_within_days, get_nested
 
 class ModificationIntentGenerator:
     """Generator for modification intent records."""
@@ -127,7 +127,7 @@ class ModificationIntentGenerator:
             return description
         
         # Fallback to simple generation if template engine not available
-        target = params.get("modification_specification", {}).get("target_resource", {}).get("resource_type", "VNF_INSTANCE")
+        target = get_nested(params, ("modification_specification", "target_resource", "resource_type"), "VNF_INSTANCE")
         operation = params.get("modification_specification", {}).get("modification_operations", [{}])[0].get("operation_type", "MODIFY_INFO")
         complexity = random_choice(['sophisticated', 'advanced', 'comprehensive', 'intelligent', 'adaptive'])
         
@@ -3,7 +3,7 @@ import random
 from typing import Dict, Any
 from .Constants_Enums import NETWORK_FUNCTIONS, ADVANCED_SLICE_TYPES, ADVANCED_LOCATIONS
 from .Parameter_Generator import ParameterGenerator
-from .utils_generator import current_timestamp, generate_unique_id, random_choice, random_int, random_timestamp_within_days
+from .utils_generator import current_timestamp, generate_unique_id, random_choice, random_int, random_timestamp_within_days, get_nested
 
 class NotificationRequestIntentGenerator:
     """Generator for notification request intent records."""
@@ -172,8 +172,8 @@ class NotificationRequestIntentGenerator:
     @staticmethod
     def generate_description(params: Dict[str, Any], location: str, slice_type: str) -> str:
         """Generate sophisticated notification request intent description."""
-        subscription_type = params.get("notification_configuration", {}).get("subscription_details", {}).get("subscription_type", "EVENT_BASED")
-        delivery_type = params.get("notification_configuration", {}).get("delivery_mechanism", {}).get("primary_channel", {}).get("type", "WEBHOOK")
+        subscription_type = get_nested(params, ("notification_configuration", "subscription_details", "subscription_type"), "EVENT_BASED")
+        delivery_type = get_nested(params, ("notification_configuration", "delivery_mechanism", "primary_channel", "type"), "WEBHOOK")
         complexity = random_choice(['sophisticated', 'advanced', 'comprehensive', 'intelligent', 'adaptive'])
         
         return (f"Configure {complexity} {subscription_type.lower().replace('_', ' ')} notification "
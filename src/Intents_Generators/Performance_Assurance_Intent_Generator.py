@@ -2,7 +2,7 @@ import uuid
 import random
 from typing import Dict, Any
 from .Parameter_Generator import ParameterGenerator
-from .utils_generator import current_timestamp, generate_unique_id, random_choice, random_int, random_float
+from .utils_generator import current_timestamp, generate_unique_id, random_choice, random_int, random_float, get_nested
 
 class PerformanceAssuranceIntentGenerator:
     """Generator for performance assurance intent records."""
@@ -153,8 +153,8 @@ class PerformanceAssuranceIntentGenerator:
     @staticmethod
     def generate_description(params: Dict[str, Any], location: str, slice_type: str) -> str:
         """Generate sophisticated performance assurance intent description."""
-        sla_type = params.get("performance_objectives", {}).get("service_level", {}).get("sla_type", "GOLD_TIER")
-        availability = params.get("performance_objectives", {}).get("service_level", {}).get("commitments", {}).get("availability", "99.9%")
+        sla_type = get_nested(params, ("performance_objectives", "service_level", "sla_type"), "GOLD_TIER")
+        availability = get_nested(params, ("performance_objectives", "service_level", "commitments", "availability"), "99.9%")
         complexity = random_choice(['sophisticated', 'advanced', 'comprehensive', 'intelligent', 'adaptive'])
         
         return (f"Establish {complexity} performance assurance framework for "
@@ -4,7 +4,7 @@ import random
 from typing import Dict, Any
 from .Constants_Enums import NETWORK_FUNCTIONS, ADVANCED_SLICE_TYPES, PERFORMANCE_METRICS
 from .Parameter_Generator import ParameterGenerator
-from .utils_generator import current_timestamp, generate_unique_id, random_choice, random_int, random_float, random_timestamp_within_days
+from .utils_generator import current_timestamp, generate_unique_id, random_choice, random_int, random_float, random_timestamp_within_days, get_nested
 
 class ReportRequestIntentGenerator:
     """Generator for report request intent records."""
@@ -114,8 +114,8 @@ class ReportRequestIntentGenerator:
     @staticmethod
     def generate_description(params: Dict[str, Any], location: str, slice_type: str) -> str:
         """Generate sophisticated report request intent description."""
-        report_type = params.get("report_specification", {}).get("report_type", "PERFORMANCE_ANALYTICS")
-        scope = params.get("report_specification", {}).get("report_scope", {}).get("functional_scope", {}).get("domains", "CORE")
+        report_type = get_nested(params, ("report_specification", "report_type"), "PERFORMANCE_ANALYTICS")
+        scope = get_nested(params, ("report_specification", "report_scope", "functional_scope", "domains"), "CORE")
         complexity = random_choice(['sophisticated', 'advanced', 'comprehensive', 'intelligent', 'adaptive'])
         
         return (f"Generate {complexity} {report_type.lower().replace('_', ' ')} report covering "
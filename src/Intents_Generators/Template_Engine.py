@@ -24,18 +24,684 @@ This approach ensures maximum utilization of available parameters while
 maintaining realistic and coherent network intent descriptions.
 """
 
+import heapq
 import random
 import re
 import json
-from typing import Dict, Any, List, Tuple, Optional, Union
+import multiprocessing
+import sys
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Hashable, List, Mapping, Tuple, Optional, Sequence, Union
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from itertools import accumulate
 import logging
+import threading
+from types import MappingProxyType
+
+import numpy as np
+
+from .Template_Kernels import MISSING as _MISSING, dedupe_tokens as _dedupe_tokens, extract_flat, render_template
 
 # Configure logging for template engine operations
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for scrubbing unfilled placeholders and scoring templates
+_PLACEHOLDER_RE = re.compile(r'\{[^}]+\}')
+# Simple {word} placeholders, substituted in one pass and matched against parameter names
+_PLACEHOLDER_NAME_RE = re.compile(r'\{(\w+)\}')
+
+
+# Placeholder-like text treated as missing, compared case-insensitively
+_NULL_LIKE_TEXT = frozenset({'none', 'null', 'undefined'})
+_NULL_LIKE_MAX_LEN = max(map(len, _NULL_LIKE_TEXT))
+
+
+def _format_string_value(value: str) -> str:
+    """Format a string value, mapping empty/null-like text to 'advanced'."""
+    str_value = value.strip()
+    # Only short values can be null-like, so longer text skips lower()
+    if not str_value or (
+        len(str_value) <= _NULL_LIKE_MAX_LEN and str_value.lower() in _NULL_LIKE_TEXT
+    ):
+        return 'advanced'
+    return str_value
+
+
+def _format_text_value(value: Any) -> str:
+    """Format a free-form value as text, mapping empty/null-like text to 'advanced'."""
+    return _format_string_value(str(value))
+
+
+# Exact-type formatters for substitution values; bool needs no special
+# ordering relative to int because lookups use type(value), not isinstance
+_VALUE_FORMATTERS: Dict[type, Callable[[Any], str]] = {
+    type(None): lambda value: 'advanced',
+    bool: lambda value: 'enabled' if value else 'disabled',
+    int: str,
+    float: str,
+    list: lambda value: ', '.join(map(str, value)),
+    dict: str,
+    str: _format_string_value
+}
+
+
+# Human-readable descriptions for context categories (read-only, shared by
+# all engine instances)
+LOCATION_DESCRIPTIONS = MappingProxyType({
+    'urban': 'high-density metropolitan zone with complex RF environment',
+    'rural': 'extended coverage rural area with challenging propagation conditions',
+    'highway': 'high-mobility corridor requiring seamless handover capabilities',
+    'industrial': 'industrial automation facility with deterministic communication needs',
+    'campus': 'enterprise campus environment with diverse service requirements',
+    'stadium': 'high-capacity venue supporting massive user density',
+    'airport': 'critical transport hub with stringent reliability requirements',
+    'smart_city': 'intelligent urban ecosystem with integrated IoT infrastructure',
+    'port': 'maritime logistics facility with specialized connectivity needs',
+    'mining': 'remote mining operation requiring robust and reliable connectivity',
+    'healthcare': 'medical facility with ultra-reliable communication requirements',
+    'education': 'educational institution supporting diverse digital learning needs'
+})
+
+SLICE_DESCRIPTIONS = MappingProxyType({
+    'eMBB': 'enhanced mobile broadband with high-throughput data services',
+    'URLLC': 'ultra-reliable low-latency communications for mission-critical applications',
+    'mMTC': 'massive machine-type communications supporting IoT ecosystems',
+    'V2X': 'vehicle-to-everything connectivity enabling autonomous transportation',
+    'AR_VR': 'immersive reality services requiring ultra-low latency and high bandwidth',
+    'IoT': 'internet of things connectivity with diverse device requirements',
+    'Mission_Critical': 'mission-critical services with stringent reliability requirements',
+    'Private_Network': 'private network slice with dedicated resources and security',
+    'Edge_Computing': 'edge computing slice with distributed processing capabilities',
+    'Smart_Manufacturing': 'smart manufacturing slice supporting Industry 4.0 applications',
+    'Public_Safety': 'public safety communications with priority access and reliability',
+    'Energy_Utilities': 'energy and utilities slice supporting smart grid applications'
+})
+
+# Complexity descriptions indexed by complexity level (1-10); index 0 is unused
+COMPLEXITY_DESCRIPTIONS: Tuple[str, ...] = (
+    '',
+    'basic streamlined with fundamental capabilities',
+    'basic streamlined with minimal complexity',
+    'basic streamlined with essential monitoring',
+    'standard optimized with basic automation features',
+    'standard optimized with enhanced monitoring capabilities',
+    'production-ready comprehensive with standard automation',
+    'production-ready comprehensive with intelligent optimization',
+    'enterprise-class advanced with comprehensive automation',
+    'research-grade sophisticated with advanced AI integration',
+    'research-grade sophisticated with cutting-edge innovations'
+)
+
+
+@lru_cache(maxsize=64)
+def _get_location_description(location_key: str) -> str:
+    """
+    Get enhanced location description with comprehensive mapping.
+    
+    Args:
+        location_key: Lowercased location category (TemplateContext.location_key)
+        
+    Returns:
+        str: Enhanced location description
+    """
+    return LOCATION_DESCRIPTIONS.get(
+        location_key, 
+        f'advanced deployment location ({location_key})'
+    )
+
+
+@lru_cache(maxsize=64)
+def _get_slice_description(slice_category: str) -> str:
+    """
+    Get enhanced slice description with comprehensive characteristics.
+    
+    Args:
+        slice_category: Network slice category
+        
+    Returns:
+        str: Enhanced slice description
+    """
+    return SLICE_DESCRIPTIONS.get(
+        slice_category, 
+        f'advanced network slice ({slice_category})'
+    )
+
+
+def _get_complexity_description(complexity: int) -> str:
+    """
+    Get enhanced complexity description with detailed characterization.
+    
+    Args:
+        complexity: Complexity level (1-10)
+        
+    Returns:
+        str: Enhanced complexity description
+    """
+    if 1 <= complexity <= 10 and complexity == int(complexity):
+        return COMPLEXITY_DESCRIPTIONS[int(complexity)]
+    return f'complexity-level-{complexity} optimized'
+
+
+# Complexity-specific wording applied during post-processing, indexed by
+# the clamped complexity level (1-10); index 0 is unused
+_RESEARCH_GRADE_ENHANCEMENTS = MappingProxyType({
+    'advanced': 'research-grade sophisticated',
+    'standard': 'cutting-edge'
+})
+_ENTERPRISE_ENHANCEMENTS = MappingProxyType({
+    'advanced': 'enterprise-class advanced',
+    'standard': 'production-grade'
+})
+_PRODUCTION_ENHANCEMENTS = MappingProxyType({
+    'advanced': 'production-ready comprehensive'
+})
+COMPLEXITY_ENHANCEMENTS: Tuple[Mapping[str, str], ...] = (MappingProxyType({}),) * 7 + (
+    _PRODUCTION_ENHANCEMENTS,
+    _ENTERPRISE_ENHANCEMENTS,
+    _RESEARCH_GRADE_ENHANCEMENTS,
+    _RESEARCH_GRADE_ENHANCEMENTS
+)
+
+# Priority-specific wording applied during post-processing
+_CRITICAL_PRIORITY_ENHANCEMENTS = MappingProxyType({
+    'with': 'with mission-critical',
+    'using': 'using fault-tolerant'
+})
+PRIORITY_ENHANCEMENTS = MappingProxyType({
+    'EMERGENCY': _CRITICAL_PRIORITY_ENHANCEMENTS,
+    'CRITICAL': _CRITICAL_PRIORITY_ENHANCEMENTS,
+    'HIGH': MappingProxyType({'with': 'with high-priority'})
+})
+
+# Slice-specific wording applied during post-processing
+SLICE_ENHANCEMENTS = MappingProxyType({
+    'URLLC': MappingProxyType({
+        'latency': 'ultra-low latency',
+        'reliable': 'ultra-reliable',
+        'performance': 'deterministic performance'
+    }),
+    'eMBB': MappingProxyType({
+        'throughput': 'high-throughput',
+        'capacity': 'high-capacity',
+        'bandwidth': 'broadband'
+    }),
+    'mMTC': MappingProxyType({
+        'connectivity': 'massive connectivity',
+        'density': 'high-density',
+        'iot': 'massive IoT'
+    }),
+    'V2X': MappingProxyType({
+        'mobility': 'vehicular mobility',
+        'latency': 'automotive-grade latency',
+        'safety': 'safety-critical'
+    })
+})
+
+
+def _guarded_word(rewrite: Tuple[str, str]) -> str:
+    """
+    Build the regex alternative for one word rewrite.
+    
+    When the replacement merely wraps the original word, with a space or a
+    hyphen (e.g. 'with' -> 'with mission-critical', 'reliable' ->
+    'ultra-reliable'), lookarounds skip occurrences that already carry the
+    added text, so rewriting is idempotent.
+    
+    Args:
+        rewrite: (original word, replacement phrase) pair
+        
+    Returns:
+        str: Regex alternative matching the original word
+    """
+    word, phrase = rewrite
+    alternative = re.escape(word)
+    match = re.search(r'(?:^|(?<=[ -]))' + alternative + r'(?=[ -]|$)', phrase)
+    if match is None:
+        return alternative
+    prefix, suffix = phrase[:match.start()], phrase[match.end():]
+    if prefix:
+        alternative = '(?<!' + re.escape(prefix) + ')' + alternative
+    if suffix:
+        alternative += '(?!' + re.escape(suffix) + r'\b)'
+    return alternative
+
+
+@lru_cache(maxsize=1024)
+def _build_rewriter(complexity: int, priority: str, slice_category: str) -> Callable[[str], str]:
+    """
+    Build the context-specific rewrite applied to a populated description.
+    
+    Complexity, priority and slice-category rewrites are merged into one
+    mapping matched by a single word-bounded alternation (see _guarded_word),
+    followed by the whitespace and repeated-word cleanup. Contexts come
+    from small enum-like domains, so the assembled rewriter is cached per
+    combination.
+    
+    Args:
+        complexity: Context complexity level (1-10, may be fractional)
+        priority: Normalized context priority
+        slice_category: Network slice category
+        
+    Returns:
+        Callable taking a description and returning the rewritten description
+    """
+    # Complexity-specific enhancements; truncating a clamped level to an int
+    # index keeps the >= 7/8/9 thresholds for fractional complexities
+    replacements = dict(COMPLEXITY_ENHANCEMENTS[min(10, max(0, int(complexity)))])
+    
+    # Priority-specific language enhancements
+    replacements.update(PRIORITY_ENHANCEMENTS.get(priority, {}))
+    
+    # Slice-specific enhancements
+    replacements.update(SLICE_ENHANCEMENTS.get(slice_category, {}))
+    
+    if not replacements:
+        return _dedupe_tokens
+    
+    # Try longer keys first so that, if multi-word keys are ever added, a key
+    # is never shadowed by a shorter key it starts with
+    rewrites = sorted(replacements.items(), key=lambda rewrite: len(rewrite[0]), reverse=True)
+    pattern = re.compile(r'\b(' + '|'.join(map(_guarded_word, rewrites)) + r')\b')
+    
+    def replace(match: "re.Match[str]") -> str:
+        return replacements[match.group(1)]
+    
+    def rewrite(description: str) -> str:
+        return _dedupe_tokens(pattern.sub(replace, description))
+    return rewrite
+
+
+@lru_cache(maxsize=1024)
+def _compile_template(template: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Split a template into literal text and the placeholders between it.
+    
+    Templates are static, so each is parsed once and rendered by joining
+    its literals with the placeholder values instead of rescanning it.
+    
+    Args:
+        template: Template string with {name} placeholders
+        
+    Returns:
+        tuple: (literal segments, placeholders including braces), where the
+               literals are one longer and interleave with the placeholders
+    """
+    parts = _PLACEHOLDER_NAME_RE.split(template)
+    return tuple(parts[0::2]), tuple(sys.intern('{' + name + '}') for name in parts[1::2])
+
+
+# Numeric weight of each priority level for scoring
+PRIORITY_WEIGHTS = MappingProxyType({
+    'EMERGENCY': 1.0,
+    'CRITICAL': 0.9,
+    'HIGH': 0.7,
+    'MEDIUM': 0.5,
+    'LOW': 0.3
+})
+
+# Complexity tier of each clamped complexity level (1-10); index 0 is unused
+COMPLEXITY_TIERS = (
+    'BASIC', 'BASIC', 'BASIC', 'BASIC', 'BASIC',
+    'STANDARD', 'STANDARD',
+    'PRODUCTION_READY',
+    'ENTERPRISE_CLASS',
+    'RESEARCH_GRADE', 'RESEARCH_GRADE'
+)
+
+# Keyword tables used to score template alignment with a context
+PRIORITY_KEYWORDS = {
+    'EMERGENCY': ['emergency', 'critical', 'urgent', 'immediate'],
+    'CRITICAL': ['critical', 'mission', 'essential', 'vital'],
+    'HIGH': ['high', 'priority', 'important', 'advanced'],
+    'MEDIUM': ['standard', 'normal', 'regular', 'typical'],
+    'LOW': ['basic', 'simple', 'minimal', 'standard']
+}
+
+SLICE_KEYWORDS = {
+    'eMBB': ['broadband', 'throughput', 'capacity', 'bandwidth'],
+    'URLLC': ['reliable', 'latency', 'critical', 'deterministic'],
+    'mMTC': ['massive', 'iot', 'density', 'connectivity'],
+    'V2X': ['vehicle', 'mobility', 'automotive', 'transport']
+}
+
+INTENT_KEYWORDS = {
+    'Deployment Intent': ['deploy', 'provision', 'instantiate', 'launch'],
+    'Modification Intent': ['modify', 'update', 'adjust', 'reconfigure'],
+    'Performance Assurance Intent': ['performance', 'assurance', 'optimize', 'monitor'],
+    'Intent Report Request': ['report', 'analyze', 'generate', 'compile'],
+    'Intent Feasibility Check': ['feasibility', 'assess', 'evaluate', 'analyze'],
+    'Regular Notification Request': ['notification', 'alert', 'monitor', 'notify']
+}
+
+COMPLEXITY_TIER_KEYWORDS = {
+    'RESEARCH_GRADE': ['research', 'sophisticated', 'advanced', 'cognitive'],
+    'ENTERPRISE_CLASS': ['enterprise', 'production', 'comprehensive'],
+    'PRODUCTION_READY': ['production', 'ready', 'optimized'],
+    'STANDARD': ['standard', 'typical', 'normal'],
+    'BASIC': ['basic', 'simple', 'minimal']
+}
+
+# One bit per (dimension, key) keyword group, so template/context alignment
+# reduces to a popcount of the AND of two masks
+CONTEXT_KEYWORD_TABLES = {
+    'priority': PRIORITY_KEYWORDS,
+    'slice': SLICE_KEYWORDS,
+    'intent': INTENT_KEYWORDS,
+    'complexity_tier': COMPLEXITY_TIER_KEYWORDS
+}
+CONTEXT_KEYWORD_BITS = {
+    (dimension, key): 1 << index
+    for index, (dimension, key) in enumerate(
+        (dimension, key)
+        for dimension, table in CONTEXT_KEYWORD_TABLES.items()
+        for key in table
+    )
+}
+
+# Keyword stems signalling that a template covers each parameter category
+PARAMETER_CATEGORY_KEYWORDS = {
+    'network': ['network', 'topology', 'architecture', 'spectrum', 'antenna'],
+    'qos': ['qos', 'quality', 'bitrate', 'latency', 'delay'],
+    'security': ['security', 'auth', 'encryption', 'privacy', 'trust'],
+    'resource': ['resource', 'compute', 'memory', 'storage', 'cpu'],
+    'monitoring': ['monitor', 'analytics', 'anomaly', 'alert', 'trace'],
+    'orchestration': ['orchestrat', 'workflow', 'vnf', 'nfv', 'deploy'],
+    'performance': ['performance', 'sla', 'throughput', 'availability'],
+    'advanced': ['ai', 'intelligent', 'cognitive', 'autonomous', 'mesh']
+}
+
+
+# Parameter extraction patterns: category -> extraction paths
+PARAMETER_PATTERNS = MappingProxyType({
+    'network_topology': (
+        'network_topology.network_architecture',
+        'network_topology.deployment_scenario',
+        'network_topology.spectrum_bands.*',
+        'network_topology.antenna_configuration.*',
+        'network_topology.backhaul.*'
+    ),
+    'qos_parameters': (
+        'qos_parameters.qos_flow_identifier',
+        'qos_parameters.*_bit_rate',
+        'qos_parameters.packet_delay_budget',
+        'qos_parameters.packet_error_rate',
+        'qos_parameters.priority_level',
+        'qos_parameters.preemption_capability',
+        'qos_parameters.reflective_qos'
+    ),
+    'security_parameters': (
+        'security_parameters.authentication_method',
+        'security_parameters.encryption_algorithm',
+        'security_parameters.integrity_protection',
+        'security_parameters.key_management.*',
+        'security_parameters.privacy_protection.*',
+        'security_parameters.zero_trust_architecture.*'
+    ),
+    'resource_allocation': (
+        'resource_allocation.compute_resources.*',
+        'resource_allocation.network_resources.*',
+        'resource_allocation.virtualization_parameters.*',
+        'resource_allocation.ai_driven_resource_allocation.*'
+    ),
+    'monitoring_parameters': (
+        'monitoring_parameters.analytics_configuration.*',
+        'monitoring_parameters.alerting_configuration.*'
+    ),
+    'orchestration_parameters': (
+        'orchestration_parameters.*',
+        'deployment_specification.*'
+    ),
+    'performance_requirements': (
+        'performance_requirements.*',
+        'performance_objectives.*'
+    ),
+    'advanced_parameters': (
+        'advanced_orchestration_parameters.*',
+        'advanced_deployment_specification.*'
+    )
+})
+
+# Template scoring weights for optimization algorithms
+SCORING_WEIGHTS = MappingProxyType({
+    'parameter_utilization': 0.4,
+    'context_alignment': 0.35,
+    'complexity_match': 0.25,
+    'priority_bonus': 0.1,
+    'slice_specificity': 0.1,
+    'advanced_features': 0.05
+})
+
+# Total score weights, read once for the template scoring loops
+PARAMETER_WEIGHT = SCORING_WEIGHTS['parameter_utilization']
+CONTEXT_WEIGHT = SCORING_WEIGHTS['context_alignment']
+COMPLEXITY_WEIGHT = SCORING_WEIGHTS['complexity_match']
+
+# Intent parameter paths: extraction category -> (key, dotted path, default)
+PARAMETER_PATHS = MappingProxyType({
+    'network_params': (
+        # Core network architecture configuration
+        ('architecture', 'network_topology.network_architecture', 'Standalone_5G'),
+        ('deployment_scenario', 'network_topology.deployment_scenario', 'Urban_Macro'),
+
+        # Spectrum band allocation across frequency ranges
+        ('low_band', 'network_topology.spectrum_bands.low_band', '700MHz'),
+        ('mid_band', 'network_topology.spectrum_bands.mid_band', '3.5GHz'),
+        ('high_band', 'network_topology.spectrum_bands.high_band', '28GHz'),
+
+        # Advanced antenna system configuration
+        ('antenna_type', 'network_topology.antenna_configuration.type', 'Massive_MIMO_64T64R'),
+        ('beamforming', 'network_topology.antenna_configuration.beamforming_capability', '3D_Beamforming'),
+        ('sectorization', 'network_topology.antenna_configuration.sectorization', '6_Sector'),
+
+        # Backhaul network infrastructure
+        ('backhaul_type', 'network_topology.backhaul.type', 'Fiber_Optic'),
+        ('backhaul_capacity', 'network_topology.backhaul.capacity', '10Gbps'),
+        ('backhaul_latency', 'network_topology.backhaul.latency', '1ms'),
+        ('redundancy', 'network_topology.backhaul.redundancy', 'Active_Active')
+    ),
+    'qos_params': (
+        # QoS flow identification and classification
+        ('flow_id', 'qos_parameters.qos_flow_identifier', '5QI_1_Conversational_Voice'),
+
+        # Bitrate guarantees and limits
+        ('guaranteed_bitrate', 'qos_parameters.guaranteed_bit_rate', '100Mbps'),
+        ('maximum_bitrate', 'qos_parameters.maximum_bit_rate', '1000Mbps'),
+
+        # Latency and error rate requirements
+        ('packet_delay', 'qos_parameters.packet_delay_budget', '10ms'),
+        ('packet_error_rate', 'qos_parameters.packet_error_rate', '0.001'),
+
+        # Priority and preemption configuration
+        ('priority_level', 'qos_parameters.priority_level', 15),
+        ('preemption_capability', 'qos_parameters.preemption_capability', 'MAY_PREEMPT'),
+
+        # Advanced QoS features
+        ('reflective_qos', 'qos_parameters.reflective_qos', 'ENABLED'),
+        ('jitter_tolerance', 'qos_parameters.jitter_tolerance', '2ms'),
+        ('averaging_window', 'qos_parameters.averaging_window', '5000ms')
+    ),
+    'security_params': (
+        # Authentication and access control
+        ('auth_method', 'security_parameters.authentication_method', '5G_AKA'),
+        ('encryption', 'security_parameters.encryption_algorithm', '256_NEA1'),
+        ('integrity', 'security_parameters.integrity_protection', '256_NIA1'),
+
+        # Cryptographic key management
+        ('kdf', 'security_parameters.key_management.kdf', 'HMAC_SHA256'),
+        ('key_length', 'security_parameters.key_management.key_length', '256_bit'),
+        ('key_rotation', 'security_parameters.key_management.key_rotation_interval', '6hours'),
+
+        # Privacy protection mechanisms
+        ('supi_concealment', 'security_parameters.privacy_protection.supi_concealment', 'ENABLED'),
+        ('location_privacy', 'security_parameters.privacy_protection.location_privacy', 'FULL_PROTECTION'),
+
+        # Zero trust architecture components
+        ('zero_trust_identity', 'security_parameters.zero_trust_architecture.identity_verification', 'continuous_behavioral_authentication'),
+        ('device_trust', 'security_parameters.zero_trust_architecture.device_trust', 'hardware_based_attestation')
+    ),
+    'resource_params': (
+        # Compute resource specifications
+        ('cpu_arch', 'resource_allocation.compute_resources.cpu_architecture', 'x86_64'),
+        ('cpu_cores', 'resource_allocation.compute_resources.cpu_cores', 8),
+        ('cpu_frequency', 'resource_allocation.compute_resources.cpu_frequency', '3.0GHz'),
+
+        # Memory subsystem configuration
+        ('memory_size', 'resource_allocation.compute_resources.memory_size', '32GB'),
+        ('memory_type', 'resource_allocation.compute_resources.memory_type', 'DDR4'),
+
+        # Storage subsystem specifications
+        ('storage_capacity', 'resource_allocation.compute_resources.storage_capacity', '1000GB'),
+        ('storage_type', 'resource_allocation.compute_resources.storage_type', 'NVMe_SSD'),
+
+        # Network resource allocation
+        ('bandwidth_allocation', 'resource_allocation.network_resources.bandwidth_allocation', '1000Mbps'),
+        ('latency_requirement', 'resource_allocation.network_resources.latency_requirement', '5ms'),
+        ('connection_density', 'resource_allocation.network_resources.connection_density', '100000_devices_per_km2'),
+
+        # Virtualization platform configuration
+        ('hypervisor', 'resource_allocation.virtualization_parameters.hypervisor', 'KVM'),
+        ('container_runtime', 'resource_allocation.virtualization_parameters.container_runtime', 'Docker'),
+        ('orchestration_platform', 'resource_allocation.virtualization_parameters.orchestration_platform', 'Kubernetes'),
+
+        # AI-driven resource optimization
+        ('ai_prediction_model', 'resource_allocation.ai_driven_resource_allocation.prediction_model', 'lstm_with_attention_mechanism'),
+        ('optimization_algorithm', 'resource_allocation.ai_driven_resource_allocation.optimization_algorithm', 'multi_objective_genetic_algorithm'),
+        ('adaptation_speed', 'resource_allocation.ai_driven_resource_allocation.adaptation_speed', '500ms'),
+        ('accuracy_level', 'resource_allocation.ai_driven_resource_allocation.accuracy_level', '95%')
+    ),
+    'monitoring_params': (
+        # Data collection and aggregation configuration
+        ('sampling_rate', 'monitoring_parameters.analytics_configuration.data_collection.sampling_rate', '50%'),
+        ('aggregation_interval', 'monitoring_parameters.analytics_configuration.data_collection.aggregation_interval', '30seconds'),
+        ('retention_period', 'monitoring_parameters.analytics_configuration.data_collection.retention_period', '90days'),
+        ('compression_ratio', 'monitoring_parameters.analytics_configuration.data_collection.compression_ratio', '5:1'),
+
+        # Machine learning and AI analytics models
+        ('anomaly_detection', 'monitoring_parameters.analytics_configuration.ml_models.anomaly_detection', 'Isolation_Forest'),
+        ('predictive_analytics', 'monitoring_parameters.analytics_configuration.ml_models.predictive_analytics', 'LSTM_Autoencoder'),
+        ('optimization_algo', 'monitoring_parameters.analytics_configuration.ml_models.optimization_algorithm', 'Genetic_Algorithm'),
+
+        # Alert escalation and notification policies
+        ('escalation_l1', 'monitoring_parameters.alerting_configuration.escalation_policy.level1', '2minutes'),
+        ('escalation_l2', 'monitoring_parameters.alerting_configuration.escalation_policy.level2', '10minutes'),
+        ('escalation_l3', 'monitoring_parameters.alerting_configuration.escalation_policy.level3', '30minutes'),
+        ('notification_channels', 'monitoring_parameters.alerting_configuration.notification_channels', 'REST_API')
+    ),
+    'orchestration_params': (
+        # ETSI NFV MANO component identifiers
+        ('nfvo_id', 'orchestration_parameters.nfvo_id', 'nfvo_default'),
+        ('vnfm_id', 'orchestration_parameters.vnfm_id', 'vnfm_default'),
+        ('vim_id', 'orchestration_parameters.vim_id', 'vim_default'),
+
+        # Workflow orchestration configuration
+        ('workflow_id', 'orchestration_parameters.orchestration_workflow.workflow_id', 'workflow_default'),
+        ('workflow_version', 'orchestration_parameters.orchestration_workflow.workflow_version', '1.0'),
+        ('execution_timeout', 'orchestration_parameters.orchestration_workflow.execution_timeout', '1800seconds'),
+        ('rollback_strategy', 'orchestration_parameters.orchestration_workflow.rollback_strategy', 'AUTOMATIC'),
+
+        # VNF descriptor and deployment specifications
+        ('vnf_provider', 'deployment_specification.vnf_descriptor.vnf_provider', 'Ericsson'),
+        ('vnf_version', 'deployment_specification.vnf_descriptor.vnf_software_version', 'SW_1.0.0'),
+        ('deployment_flavor', 'deployment_specification.deployment_flavor.description', 'High_Performance_Compute_Optimized'),
+
+        # Instance scaling configuration
+        ('min_instances', 'deployment_specification.deployment_flavor.vdu_profile.min_number_of_instances', 2),
+        ('max_instances', 'deployment_specification.deployment_flavor.vdu_profile.max_number_of_instances', 20),
+        ('network_function', 'deployment_specification.network_function', 'AMF')
+    ),
+    'performance_params': (
+        # Core performance requirements
+        ('throughput_req', 'performance_requirements.throughput_requirement', '1000Mbps'),
+        ('latency_req', 'performance_requirements.latency_requirement', '5ms'),
+        ('availability_req', 'performance_requirements.availability_requirement', '99.99%'),
+        ('reliability_req', 'performance_requirements.reliability_requirement', '99.9%'),
+
+        # Scalability and elasticity requirements
+        ('horizontal_scaling', 'performance_requirements.scalability_requirement.horizontal_scaling', '100instances'),
+        ('vertical_scaling', 'performance_requirements.scalability_requirement.vertical_scaling', '32cores'),
+        ('auto_scaling_policy', 'performance_requirements.scalability_requirement.auto_scaling_policy', 'CPU_BASED'),
+
+        # Service level agreement specifications
+        ('sla_type', 'performance_objectives.service_level.sla_type', 'GOLD_TIER'),
+        ('mttr', 'performance_objectives.service_level.commitments.mean_time_to_repair', '60minutes'),
+        ('mtbf', 'performance_objectives.service_level.commitments.mean_time_between_failures', '2160hours')
+    ),
+    'deployment_params': (
+        # Service and tenant identification
+        ('service_level', 'service_level', 'PLATINUM'),
+        ('tenant_id', 'tenant_id', 'TENANT_12345'),
+        ('correlation_id', 'correlation_id', 'CORR_default'),
+
+        # Lifecycle management operation configuration
+        ('instantiation_timeout', 'deployment_specification.additional_params.lcm_operations_configuration.instantiate.timeout', '600seconds'),
+        ('rollback_on_failure', 'deployment_specification.additional_params.lcm_operations_configuration.instantiate.rollback_on_failure', 'true'),
+
+        # Placement and affinity rules
+        ('anti_affinity', 'deployment_specification.additional_params.affinity_rules.anti_affinity', 'HOST'),
+        ('affinity', 'deployment_specification.additional_params.affinity_rules.affinity', 'HARD')
+    ),
+    'advanced_params': (
+        # Multi-cloud orchestration configuration
+        ('cloud_providers', 'advanced_orchestration_parameters.multi_cloud_orchestration.cloud_providers', ['AWS', 'Azure']),
+        ('hybrid_strategy', 'advanced_orchestration_parameters.multi_cloud_orchestration.hybrid_cloud_strategy', 'CLOUD_FIRST'),
+
+        # Edge computing deployment strategy
+        ('edge_strategy', 'advanced_orchestration_parameters.edge_orchestration.edge_deployment_strategy', 'DISTRIBUTED'),
+        ('workflow_engine', 'advanced_orchestration_parameters.workflow_orchestration.workflow_engine', 'Airflow'),
+
+        # Cloud-native service mesh configuration
+        ('mesh_technology', 'advanced_deployment_specification.cloud_native_features.service_mesh.mesh_technology', 'Istio'),
+        ('load_balancing', 'advanced_deployment_specification.cloud_native_features.service_mesh.traffic_management.load_balancing', 'ROUND_ROBIN'),
+        ('circuit_breaker', 'advanced_deployment_specification.cloud_native_features.service_mesh.traffic_management.circuit_breaker', 'ENABLED'),
+
+        # Observability and tracing configuration
+        ('distributed_tracing', 'advanced_deployment_specification.cloud_native_features.service_mesh.observability.distributed_tracing', 'Jaeger'),
+
+        # Infrastructure automation configuration
+        ('automation_level', 'advanced_deployment_specification.deployment_automation.automation_level', 'FULLY_AUTOMATED'),
+        ('iac_tool', 'advanced_deployment_specification.deployment_automation.infrastructure_as_code.iac_tool', 'Terraform')
+    )
+})
+
+# Parameter names in each extraction category; names are unique across categories
+PARAMETER_CATEGORY_KEYS = MappingProxyType({
+    category: tuple(key for key, _, _ in specs) for category, specs in PARAMETER_PATHS.items()
+})
+
+# Dotted paths pre-split once so extraction only walks key tuples
+_PARAMETER_PATH_SPECS = tuple(
+    (key, path, tuple(path.split('.')), default)
+    for specs in PARAMETER_PATHS.values()
+    for key, path, default in specs
+)
+
+# Parameters drawn from small categorical vocabularies; their string values
+# are interned at extraction so repeated values share one object
+INTERNED_PARAMETER_KEYS = frozenset({
+    'architecture', 'deployment_scenario', 'antenna_type', 'beamforming', 'backhaul_type', 'redundancy',
+    'flow_id', 'preemption_capability', 'reflective_qos',
+    'auth_method', 'encryption', 'integrity', 'kdf', 'supi_concealment', 'location_privacy',
+    'cpu_arch', 'memory_type', 'storage_type', 'hypervisor', 'container_runtime', 'orchestration_platform',
+    'anomaly_detection', 'predictive_analytics',
+    'rollback_strategy', 'vnf_provider', 'deployment_flavor', 'network_function',
+    'auto_scaling_policy', 'sla_type',
+    'service_level', 'anti_affinity', 'affinity',
+    'hybrid_strategy', 'edge_strategy', 'workflow_engine', 'mesh_technology', 'load_balancing',
+    'circuit_breaker', 'distributed_tracing', 'automation_level', 'iac_tool',
+})
+
+# Maximum number of extractions whose formatted values are kept per engine
+EXTRACTION_CACHE_SIZE = 512
+
+# Maximum number of memoized rendered descriptions per engine
+RENDER_CACHE_SIZE = 4096
+
+# Contexts handed to a worker at a time by generate_descriptions_parallel
+PARALLEL_CHUNK_SIZE = 1000
+
 class TemplateStrategy(Enum):
     """Enumeration of available template generation strategies."""
     DEPLOYMENT_FOCUSED = "deployment_focused"
@@ -60,7 +726,7 @@ class TemplateStrategy(Enum):
     COMPREHENSIVE = "comprehensive"
     RESEARCH_GRADE = "research_grade"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TemplateContext:
     """
     Enhanced context for template generation with comprehensive parameter integration.
@@ -68,29 +734,37 @@ class TemplateContext:
     This class encapsulates all contextual information needed for intelligent
     template selection and generation, including intent classification,
     complexity assessment, and priority determination.
+    
+    Instances are slotted and frozen so they are cheap to create in bulk and
+    can be used as cache keys. The dict-valued fields are excluded from the
+    hash (they are still compared for equality).
     """
     intent_type: str
     complexity: int  # Scale of 1-10, where 10 is most complex
     priority: str    # CRITICAL, HIGH, MEDIUM, LOW, EMERGENCY
     slice_category: str  # eMBB, URLLC, mMTC, V2X, etc.
     location_category: str  # urban, rural, highway, industrial, etc.
-    parameters: Dict[str, Any]
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    parameters: Dict[str, Any] = field(hash=False)
+    metadata: Dict[str, Any] = field(default_factory=dict, hash=False)
+    
+    # Lowercased location_category, canonicalized once for description lookups
+    location_key: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Post-initialization validation and enhancement."""
+        object.__setattr__(self, 'location_key', self.location_category.lower())
+        
         # Validate complexity range
         if not 1 <= self.complexity <= 10:
             logger.warning(f"Complexity {self.complexity} out of range, clamping to [1,10]")
-            self.complexity = max(1, min(10, self.complexity))
+            object.__setattr__(self, 'complexity', max(1, min(10, self.complexity)))
         
-        # Normalize priority
-        valid_priorities = ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW', 'EMERGENCY']
-        if self.priority.upper() not in valid_priorities:
+        # Normalize priority (valid priorities are the keys of PRIORITY_WEIGHTS)
+        priority = self.priority.upper()
+        if priority not in PRIORITY_WEIGHTS:
             logger.warning(f"Invalid priority {self.priority}, defaulting to MEDIUM")
-            self.priority = 'MEDIUM'
-        else:
-            self.priority = self.priority.upper()
+            priority = 'MEDIUM'
+        object.__setattr__(self, 'priority', priority)
         
         # Add derived metadata
         self.metadata.update({
@@ -101,27 +775,11 @@ class TemplateContext:
     
     def _get_complexity_tier(self) -> str:
         """Determine complexity tier based on numeric complexity."""
-        if self.complexity >= 9:
-            return 'RESEARCH_GRADE'
-        elif self.complexity >= 8:
-            return 'ENTERPRISE_CLASS'
-        elif self.complexity >= 7:
-            return 'PRODUCTION_READY'
-        elif self.complexity >= 5:
-            return 'STANDARD'
-        else:
-            return 'BASIC'
+        return COMPLEXITY_TIERS[int(self.complexity)]
     
     def _get_priority_weight(self) -> float:
         """Convert priority to numeric weight for scoring."""
-        priority_weights = {
-            'EMERGENCY': 1.0,
-            'CRITICAL': 0.9,
-            'HIGH': 0.7,
-            'MEDIUM': 0.5,
-            'LOW': 0.3
-        }
-        return priority_weights.get(self.priority, 0.5)
+        return PRIORITY_WEIGHTS.get(self.priority, 0.5)
     
     def _get_slice_characteristics(self) -> Dict[str, Any]:
         """Extract characteristics based on slice category."""
@@ -158,83 +816,475 @@ class TemplateContext:
             'typical_reliability': '99.9%'
         })
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class ParameterExtraction:
     """
     Extracted and processed parameters for template generation.
     
-    This class organizes all extracted parameters into logical categories
-    for efficient access and utilization during template generation.
-    Each category represents a different aspect of network configuration.
+    All extracted parameters live in one flat dictionary keyed by parameter
+    name, while category membership (network, QoS, security, ...) is kept
+    as tuples of names. Each category represents a different aspect of
+    network configuration and is exposed as a read-only view, e.g.
+    ``extraction.network_params``.
+    
+    Extractions are frozen and compare/hash by identity. Caches of text
+    rendered from an extraction key on ``render_key`` instead, so separate
+    extractions with the same content share cached text.
     """
-    # Core network infrastructure parameters
-    network_params: Dict[str, Any] = field(default_factory=dict)
+    # All extracted parameters keyed by parameter name
+    flat: Dict[str, Any] = field(default_factory=dict)
     
-    # Quality of Service configuration parameters
-    qos_params: Dict[str, Any] = field(default_factory=dict)
+    # Category name (e.g. 'network_params') -> parameter names in that category
+    category_keys: Mapping[str, Tuple[str, ...]] = field(default_factory=lambda: PARAMETER_CATEGORY_KEYS)
     
-    # Security and privacy protection parameters
-    security_params: Dict[str, Any] = field(default_factory=dict)
+    # Snapshot of the extracted values and their types, or None when a value
+    # is unhashable or the extraction was not built by the engine
+    content_key: Optional[Hashable] = None
     
-    # Compute and storage resource parameters
-    resource_params: Dict[str, Any] = field(default_factory=dict)
+    @property
+    def render_key(self) -> Hashable:
+        """Key for caches of text rendered from this extraction."""
+        return self if self.content_key is None else self.content_key
     
-    # Monitoring and analytics parameters
-    monitoring_params: Dict[str, Any] = field(default_factory=dict)
+    @classmethod
+    def from_categories(cls, **categories: Dict[str, Any]) -> 'ParameterExtraction':
+        """
+        Build an extraction from per-category parameter dictionaries.
+        
+        Args:
+            **categories: Category name (e.g. network_params) to parameters
+            
+        Returns:
+            ParameterExtraction: Extraction holding the merged parameters
+        """
+        flat: Dict[str, Any] = {}
+        category_keys: Dict[str, Tuple[str, ...]] = dict.fromkeys(PARAMETER_CATEGORY_KEYS, ())
+        for category, params in categories.items():
+            flat.update(params)
+            category_keys[category] = tuple(params)
+        return cls(flat=flat, category_keys=category_keys)
     
-    # Orchestration and lifecycle management parameters
-    orchestration_params: Dict[str, Any] = field(default_factory=dict)
+    def get_category(self, category: str) -> Dict[str, Any]:
+        """
+        Get the parameters of one category.
+        
+        Args:
+            category: Category name (e.g. network_params)
+            
+        Returns:
+            Dict of the category's parameters, built from the flat storage
+        """
+        flat = self.flat
+        return {key: flat[key] for key in self.category_keys.get(category, ()) if key in flat}
     
-    # Performance requirements and SLA parameters
-    performance_params: Dict[str, Any] = field(default_factory=dict)
+    @property
+    def network_params(self) -> Dict[str, Any]:
+        """Core network infrastructure parameters."""
+        return self.get_category('network_params')
     
-    # Deployment-specific configuration parameters
-    deployment_params: Dict[str, Any] = field(default_factory=dict)
+    @property
+    def qos_params(self) -> Dict[str, Any]:
+        """Quality of Service configuration parameters."""
+        return self.get_category('qos_params')
     
-    # Advanced features and emerging technology parameters
-    advanced_params: Dict[str, Any] = field(default_factory=dict)
+    @property
+    def security_params(self) -> Dict[str, Any]:
+        """Security and privacy protection parameters."""
+        return self.get_category('security_params')
+    
+    @property
+    def resource_params(self) -> Dict[str, Any]:
+        """Compute and storage resource parameters."""
+        return self.get_category('resource_params')
+    
+    @property
+    def monitoring_params(self) -> Dict[str, Any]:
+        """Monitoring and analytics parameters."""
+        return self.get_category('monitoring_params')
+    
+    @property
+    def orchestration_params(self) -> Dict[str, Any]:
+        """Orchestration and lifecycle management parameters."""
+        return self.get_category('orchestration_params')
+    
+    @property
+    def performance_params(self) -> Dict[str, Any]:
+        """Performance requirements and SLA parameters."""
+        return self.get_category('performance_params')
+    
+    @property
+    def deployment_params(self) -> Dict[str, Any]:
+        """Deployment-specific configuration parameters."""
+        return self.get_category('deployment_params')
+    
+    @property
+    def advanced_params(self) -> Dict[str, Any]:
+        """Advanced features and emerging technology parameters."""
+        return self.get_category('advanced_params')
     
     def get_all_parameters(self) -> Dict[str, Any]:
         """
-        Combine all parameter categories into a single dictionary.
+        Get all parameters across categories as a single dictionary.
+        
+        This is the flat storage itself, so no merging or copying happens;
+        callers must not mutate the result.
         
         Returns:
             Dict containing all parameters from all categories
         """
-        all_params = {}
-        for param_dict in [
-            self.network_params,
-            self.qos_params,
-            self.security_params,
-            self.resource_params,
-            self.monitoring_params,
-            self.orchestration_params,
-            self.performance_params,
-            self.deployment_params,
-            self.advanced_params
-        ]:
-            all_params.update(param_dict)
-        return all_params
+        return self.flat
     
     def get_parameter_count(self) -> Dict[str, int]:
         """
         Get count of parameters in each category.
         
         Returns:
-            Dict mapping category names to parameter counts
+            Dict mapping category names (without the _params suffix) to parameter counts
         """
+        flat = self.flat
         return {
-            'network': len(self.network_params),
-            'qos': len(self.qos_params),
-            'security': len(self.security_params),
-            'resource': len(self.resource_params),
-            'monitoring': len(self.monitoring_params),
-            'orchestration': len(self.orchestration_params),
-            'performance': len(self.performance_params),
-            'deployment': len(self.deployment_params),
-            'advanced': len(self.advanced_params)
+            category[:-len('_params')]: sum(key in flat for key in keys)
+            for category, keys in self.category_keys.items()
         }
 
+
+@dataclass(slots=True, frozen=True)
+class CompiledTemplateArray:
+    """
+    Scoring inputs for one intent type's templates, stored column-wise.
+    
+    Each field is a tuple parallel to ``texts``, so template selection walks
+    a few flat sequences instead of looking every template up in the
+    per-template caches.
+    """
+    # Template strings in registry order
+    texts: Tuple[str, ...]
+    
+    # Placeholder names used by each template
+    placeholders: Tuple[frozenset, ...]
+    
+    # Fraction of parameter categories each template covers
+    category_scores: Tuple[float, ...]
+    
+    # Context keyword bitmask of each template
+    masks: Tuple[int, ...]
+    
+    # Complexity match scores, one column per low/medium/high bucket
+    bucket_scores: Tuple[Tuple[float, ...], Tuple[float, ...], Tuple[float, ...]]
+
+
+def _join_cloud_providers(params: Dict[str, Any]) -> str:
+    """Render the cloud provider list parameter as comma-separated text."""
+    cloud_providers = params.get('cloud_providers', ['AWS', 'Azure'])
+    if isinstance(cloud_providers, list):
+        return ', '.join(map(str, cloud_providers))
+    return str(cloud_providers)
+
+
+# Template corpus for each intent category, built once at import and
+# shared by every engine instance
+INTENT_TEMPLATES = MappingProxyType({
+    "Deployment": (
+        "This intent specifies the instantiation of a User Plane Function (UPF) for a {slice_category} network slice, as per the architecture defined in 3GPP TS 23.501 §6.2.2. The {nfvo_id} orchestrator must deploy the {network_function} VNF from provider {vnf_provider} version {vnf_version} using the {deployment_flavor} that allocates {cpu_cores} {cpu_arch} cores and {memory_size} of {memory_type} memory. The system must adhere to an {auto_scaling_policy} to dynamically scale between {min_instances} and {max_instances} based on real-time throughput demands (TS 28.531 §5.4.4). In case of instantiation failure within the {instantiation_timeout} period, a {rollback_strategy} must be triggered automatically.",
+        "Execute orchestration workflow {workflow_id} via {nfvo_id} to deploy the {network_function} across multiple VIMs, including {vim_id}. This cross-VIM deployment is designed to achieve high availability and load distribution as per ETSI NFV MANO principles referenced in 3GPP TS 28.530 §4.2. The workflow must ensure that network connectivity between VNF components has a maximum latency of {backhaul_latency}.",
+        "This intent is to trigger an automated update of the {network_function} from version {vnf_version} to a newer version using the {workflow_engine}. The process must follow a canary deployment model, initially directing 10% of traffic to the new version. The {auto_scaling_policy} must be temporarily adjusted during the upgrade to prevent resource conflicts. A full {rollback_strategy} to the previous version is required if the packet error rate exceeds {packet_error_rate}.",
+        "Deploy a virtualized Evolved Packet Core (vEPC) for an LTE private network, ensuring the MME and SGW components have a strong {affinity} policy. This co-location is intended to minimize control plane latency, aligning with performance goals in TS 23.401. Resources must be provisioned on the {orchestration_platform} with {min_instances} of each component, each having {cpu_cores} cores and {memory_size} memory.",
+        "Instantiate the {network_function} with a security-hardened profile. The deployment must enforce {encryption} with {key_length} bits for all external interfaces and use {auth_method} for management access. As per security assurance specifications (TS 33.501 §6.1), the VNF image must be scanned for vulnerabilities before deployment is allowed to proceed. The {zero_trust_identity} framework must be applied to all service-to-service communication.",
+        "Deploy a UPF at {location_category} edge data centers to support an ultra-reliable low-latency communications (uRLLC) slice for V2X services (3GPP TS 23.288 §5.2). This deployment must guarantee a user plane latency not exceeding {latency_req} (e.g., 1ms) and a {reliability_req} of 99.999%. The RAN configuration must use {high_band} spectrum with {beamforming} enabled to achieve this performance. A {backhaul_type} of dedicated fiber with a capacity of {backhaul_capacity} is mandated.",
+        "Instantiate a Multi-access Edge Computing (MEC) application, {network_function}, on the {orchestration_platform} located at the network edge. The intent is to process video streams locally, requiring {cpu_cores} {cpu_arch} cores with GPU acceleration and a {packet_delay} of less than 5ms. The SMF must be configured to steer traffic for {flow_id} to this local UPF, as per TS 23.501 §5.13 on edge computing support.",
+        "This is a policy-driven intent. If the end-to-end {latency_req} for the {slice_category} slice exceeds 10ms for more than the {averaging_window}, the {nfvo_id} must automatically trigger workflow {workflow_id}. This workflow will instantiate a new instance of {network_function} at a {location_category} edge site and update routing rules to minimize latency, reflecting the dynamic nature of edge deployments (TS 28.541 §A.15).",
+        "For tenant {tenant_id}, configure a local data breakout at the enterprise edge. Deploy a lightweight UPF and an enterprise firewall VNF ({network_function}) at the customer premises. This setup requires minimal resources: {cpu_cores} cores and {memory_size} RAM. The intent ensures that enterprise traffic does not traverse the core network, enhancing {location_privacy} and reducing {backhaul_latency}.",
+        "To support an augmented reality service, allocate compute resources at the far edge with an {adaptation_speed} of under 50ms. The {vim_id} must provision {cpu_cores} cores and {memory_size} RAM on demand. The QoS profile must enforce a strict {jitter_tolerance} of 1ms to prevent disruptions in the user experience, as latency spikes are critical for this {slice_category}.",
+        "Deploy a Security Edge Protection Proxy (SEPP) at the {location_category} edge to secure roaming interconnects locally (TS 33.501 §13). The SEPP VNF must enforce {encryption} using {kdf} for key derivation and mandate {integrity} protection for all signaling. This localized security enforcement reduces latency compared to routing traffic to a central security gateway.",
+        "Given the limited resources at {location_category} edge sites, deploy the {network_function} using a containerized flavor on {container_runtime}. The deployment must prioritize resource efficiency, utilizing {cpu_cores} ARM-based {cpu_arch} cores. If memory utilization exceeds 85%, the {optimization_algorithm} should be triggered to consolidate workloads without violating the {sla_type} agreement.",
+        "Configure the RAN with a specific {sectorization} strategy to maximize coverage and capacity at the {location_category} event venue. Use {low_band} for coverage and {mid_band} for capacity, managed by a SON algorithm. The goal is to support {connection_density} while ensuring {availability_req} for all users.",
+        "Upon detection of a large public event (e.g., via an external API call), the {nfvo_id} must automatically execute workflow {workflow_id} to deploy a mobile broadband capacity enhancement solution at the nearest {location_category} edge. This includes instantiating a local UPF and DU/CU resources, pre-configured to handle a surge in {connection_density}.",
+        "Deploy the {network_function} as a collection of cloud-native functions (CNFs) on the {orchestration_platform} Kubernetes cluster, using {container_runtime}. Service-to-service communication must be managed by a {mesh_technology} like Istio, enforcing mTLS for security. This aligns with the 5G service-based architecture (SBA) principles outlined in TS 23.501 §4.2.6.",
+        "The desired state of the {network_function} CNF is defined using the {iac_tool} (e.g., Helm, Kustomize) in a Git repository. The orchestration platform must continuously reconcile the running state with the Git repository, achieving a Level {automation_level} of automation. Any configuration drift must trigger an alert via {notification_channels}.",
+        "Enable {distributed_tracing} across all microservices comprising the {network_function}. Traces must be collected and forwarded to a central observability platform to diagnose performance bottlenecks and ensure the end-to-end {latency_req} is met. This is crucial for debugging complex interactions in an SBA environment (TS 28.532 §A.5).",
+        "Enforce a {zero_trust_identity} security model for all CNFs within the {tenant_id} namespace. Each microservice must present a valid SPIFFE/SPIRE identity token for any communication. Network policies must be configured to deny all traffic by default, only allowing explicit connections defined for the service-based interface.",
+        "Upon a new commit to the source code repository for {network_function}, the CI/CD pipeline, managed by {workflow_engine}, must automatically spin up an ephemeral test environment. This environment will run a suite of conformance and load tests, ensuring the new CNF version meets the {throughput_req} and {reliability_req} before being promoted.",
+        "Deploy the UDM (Unified Data Management) as a stateful CNF. The deployment must utilize a distributed {storage_type} solution (e.g., Ceph) with a capacity of {storage_capacity} to store subscriber data persistently, as per data storage principles in TS 23.501 §6.2.5. The storage solution must provide {redundancy} to prevent data loss.",
+        "Orchestrate an end-to-end network slice for tenant {tenant_id} with {correlation_id}. The {nfvo_id} will coordinate with the RAN controller, transport SDN controller, and core {vim_id}. The intent is to deliver a {sla_type} service with a guaranteed {throughput_req} from the UE to the data network, as envisioned by the network slice management functions in TS 28.541 §5.2.",
+        "Implement a {hybrid_strategy} for the {slice_category} eMBB slice. The baseline capacity for the UPF will be hosted on the on-premise {vim_id}. If traffic demand exceeds 80% of the on-premise capacity, the {nfvo_id} must burst additional UPF instances onto {cloud_providers} (e.g., AWS, Azure) to handle the overflow.",
+        "Apply a uniform security policy across the on-premise private cloud and the public {cloud_providers}. This includes enforcing {encryption} with a consistent {key_rotation} policy of 24 hours and using {auth_method} for all management plane access, regardless of where the {network_function} is hosted.",
+        "Ensure that the 5QI (5G QoS Identifier) value {priority_level_num} in the 5G core is correctly mapped to the corresponding QoS markings (e.g., DSCP) in the transport network. This cross-domain mapping is critical to maintain the end-to-end {packet_delay} and {packet_error_rate} characteristics defined in TS 23.501 §5.7.",
+        "Implement a cross-domain monitoring solution that uses {correlation_id} to track service performance from RAN to Core. If the {sla_type} is breached, the system must perform automated root cause analysis to identify if the fault lies in the radio, transport, or core domain and trigger the appropriate {escalation_l1} procedure.",
+        "The end-to-end instantiation of the service for {tenant_id}, including resource provisioning in the RAN, transport path setup, and core NF deployment, must complete within the {instantiation_timeout}. If it fails, a full {rollback_strategy} across all domains must be executed by {nfvo_id}.",
+        "Utilize the {ai_prediction_model} to forecast traffic demand for the {slice_category} slice based on historical data collected by NWDAF (TS 23.501 §5.27). Proactively execute a {horizontal_scaling} operation on the UPF 30 minutes before the predicted traffic peak to ensure the {guaranteed_bitrate} is always available and prevent congestion. The model must achieve an {accuracy_level} of 95%.",
+        "Continuously monitor QoS parameters such as {packet_delay} and {jitter_tolerance} using an {anomaly_detection} algorithm. If the AI model detects a deviation from the established baseline that could lead to an SLA violation, it must automatically create a trouble ticket and notify the {escalation_l1} team via {notification_channels} (TS 28.533 §5.2).",
+        "Implement a closed-loop automation system where the NWDAF provides analytics to the PCF and NSSF. If the AI model ({optimization_algorithm}) determines that network resources for a slice are over-provisioned, it will instruct the {nfvo_id} to downscale the resources ({vertical_scaling} or {horizontal_scaling}) without impacting the {sla_type} agreement, thus improving resource efficiency (TS 28.541 §6.4).",
+        "Using {predictive_analytics}, monitor the health metrics of the {network_function}. The {ai_prediction_model} will predict potential failures based on subtle changes in CPU, memory, and network I/O patterns. Upon predicting a failure with {accuracy_level} confidence, the system will automatically trigger a healing workflow to migrate services to a healthy instance, aiming to improve {mtbf}.",
+        "Leverage an AI model to determine the optimal placement of the {network_function}. The model, {optimization_algorithm}, will consider multiple factors including {latency_requirement}, compute resource availability across different {location_category} sites, and energy costs to select the most efficient VIM ({vim_id}) for instantiation.",
+        "Deploy an AI-based security system that analyzes signaling traffic (e.g., at the SEPP) for anomalous patterns indicative of a security threat. The {anomaly_detection} model is trained to identify zero-day attacks that signature-based systems would miss. Upon detection, it will automatically apply a firewall rule to block the malicious source.",
+        "This intent enables an AI-driven QoS adaptation mechanism. If the {predictive_analytics} model forecasts network congestion, the PCF will dynamically adjust the QoS parameters for non-critical flows, such as lowering the {maximum_bitrate} for {flow_id}, to protect the {guaranteed_bitrate} of high-priority services like {slice_category}.",
+        "Run a weekly {ai_prediction_model} to forecast long-term resource requirements ({cpu_cores}, {memory_size}, {storage_capacity}) for the next quarter. This forecast, based on NWDAF analytics, will be used for capacity planning to ensure that the infrastructure can meet future {throughput_req} and {connection_density} growth.",
+        "In the event of a service degradation alarm, trigger an ML-based root cause analysis workflow. The {optimization_algo} will analyze logs and metrics from multiple domains (collected with {sampling_rate}) to pinpoint the root cause, distinguishing between RAN, transport, or core issues with a specified {accuracy_level}. The finding is then routed to the correct {escalation_l2} team, drastically reducing the {mttr}."
+    ),
+
+    "Feasibility Check": (
+        "Evaluate the end-to-end feasibility of launching a {service_level} service for {tenant_id} using the {network_function}. Assess if the combined requirements for {guaranteed_bitrate}, {latency_requirement}, and {availability_req} can be met concurrently on the target {architecture}. This check is a prerequisite for slice allocation as per 3GPP TS 28.541 §5.3.1. Confirm that the {orchestration_platform} is capable of deploying this service within the {instantiation_timeout}. If any core KPI is unachievable, the intent must be flagged as infeasible.",
+        "Determine if a {slice_category} slice is feasible in the target deployment area. Verify that the underlying infrastructure can support the expected {connection_density} and the associated signaling load, a key consideration for slice design mentioned in 3GPP TS 23.501 §5.15.2.2. Can the specified {backhaul_type} support the aggregate bandwidth demands? The intent should be rejected if the resource pool is insufficient for even the {min_instances} of the required network functions.",
+        "Assess the feasibility of meeting a {sla_type} agreement for the {vnf_provider}'s {network_function}. Can the system guarantee {reliability_req}% reliability and {availability_req}% availability simultaneously? This check relates to the service requirements that form the basis for a Network Slice as a Service (NSaaS) model, conceptually covered in 3GPP TS 28.530 §4.3.5. Evaluate whether the {rollback_on_failure} policy can be executed without violating the SLA's Mean Time to Repair (MTTR) constraints. If not, propose an alternative {rollback_strategy}.",
+        "Verify that the infrastructure is ready to onboard {tenant_id} with their requested {service_level}. Check for sufficient multi-tenancy support in the {orchestration_platform}, as implied by the management framework in 3GPP TS 28.530 §4.2. Is it possible to enforce strict resource isolation using the current {hypervisor} or {container_runtime}? Confirm that the {auth_method} meets the tenant's security requirements. The intent is infeasible if tenant-specific policies cannot be enforced.",
+        "Evaluate the feasibility of a {hybrid_strategy} deployment that integrates on-premise resources with {cloud_providers}. Can the proposed {architecture} maintain the required {latency_requirement} for cross-domain traffic? This feasibility check pertains to orchestrating services across multiple administrative domains, a concept discussed in 3GPP TS 28.531 §5.5. Assess if the {workflow_engine} can manage dependencies between cloud-native and legacy network functions. The plan is not viable if a unified {distributed_tracing} system cannot be implemented.",
+        "Confirm the technical feasibility of a URLLC service by assessing if a {latency_requirement} (e.g., <1ms) and {reliability_req} (e.g., 99.999%) can be co-guaranteed. This aligns with the URLLC requirements specified in 3GPP TS 22.261 §6.5. Is the selected {cpu_arch} with {cpu_frequency} capable of processing data within the allocated time budget? Verify that the {backhaul_latency} does not exceed its allocated portion of the end-to-end latency budget. If predictive analytics from {ai_prediction_model} indicates a high probability of jitter, flag the intent as high-risk.",
+        "Validate if a {guaranteed_bitrate} for an eMBB {slice_category} can be sustained under a {connection_density} of active users. This check ensures the QoS flow for GFBR can be supported, as defined in 3GPP TS 23.501 §5.7.3. Assess if the {storage_type} (e.g., NVMe) has sufficient I/O throughput to avoid bottlenecks for content caching NFs. The intent is not feasible if the {load_balancing} strategy cannot distribute traffic effectively to maintain the bitrate for all users.",
+        "Assess the feasibility of enforcing the required security context for the {network_function}. Can the system support the specified {encryption} and {auth_method} algorithms for all control and user plane traffic? This validation is based on the security architecture outlined in 3GPP TS 33.501 §6. Furthermore, is it technically possible to implement a {zero_trust_identity} policy by validating {device_trust} at every connection attempt? The deployment is infeasible if the security gateways lack the processing power to handle the cryptographic load without impacting latency.",
+        "Evaluate the feasibility of configuring the Radio Access Network for a specific {slice_category}. Does the RAN support resource partitioning to provide a dedicated {guaranteed_bitrate}? This aligns with the RAN-related aspects of network slicing detailed in 3GPP TS 38.300 §16. Can the specified {backhaul_capacity} handle the traffic from the cell sites for this slice in addition to others? The configuration is infeasible if the RAN scheduler cannot prioritize traffic according to the slice requirements.",
+        "Determine the technical feasibility of a V2X {slice_category} service. Can the network achieve the required end-to-end {latency_requirement} for safety-critical messages? This is a core requirement for V2X services as per 3GPP TS 23.287 §5.2. Verify that edge nodes have sufficient {cpu_cores} to run the V2X application server locally. Is it possible to guarantee resource availability and preemption for V2X traffic over other services? If not, the intent is technically infeasible.",
+        "Check for sufficient compute resources at the edge for deploying {network_function}. Are there {cpu_cores} of type {cpu_arch} and {memory_size} of {memory_type} available? This aligns with the NFVI resource management principles in 3GPP TS 28.541 §A.4. Assess if the existing {storage_capacity} of {storage_type} is adequate. The intent must be rejected if the {latency_requirement} cannot be met due to resource oversubscription at the edge location.",
+        "Evaluate if the existing {backhaul_type} has the required {backhaul_capacity} and {backhaul_latency} to support a new eMBB {slice_category}. This is a critical prerequisite for fulfilling the PDU Session QoS, as described in 3GPP TS 23.502 §4.3.2.2. Does the backhaul have QoS marking and queuing capabilities? If the backhaul is shared, confirm that this new slice will not degrade the performance of existing high-priority services.",
+        "Assess if the available {storage_type} provides sufficient performance for the {network_function}. Is the IOPS (Input/Output Operations Per Second) rating of the {storage_capacity} adequate for the expected transaction load? This detailed resource check is part of the VNF Descriptor (VNFD) information model referenced in 3GPP TS 28.531 §6.3.2. For a stateful application, verify that the storage system's reliability meets the service's {reliability_req}. The intent is infeasible if storage latency contributes significantly to exceeding the overall {latency_requirement}.",
+        "Verify that there are enough resources to support the {auto_scaling_policy} for {network_function}, from {min_instances} to {max_instances}. This preemptive check is crucial for the LCM scaling operations defined in 3GPP TS 28.531 §8.2. Are there enough floating CPU and memory resources in the cluster to accommodate {max_instances} during a peak event? Assess if the power and cooling systems at the data center can handle the maximum load. The scaling policy is infeasible if resource reservation cannot be guaranteed.",
+        "Determine if the proposed {affinity} and {anti_affinity} rules for the {network_function} components are satisfiable on the current infrastructure. This is a key aspect of VNF placement described in management standards like 3GPP TS 28.531 §6.2. For example, can two VNF components be placed on separate physical hosts to meet the {anti_affinity} rule for high availability? The intent is infeasible if the number of available compute hosts or racks is insufficient to satisfy the placement constraints.",
+        "Check if the selected {orchestration_platform} is compatible with the {workflow_version} required to deploy the {network_function} from {vnf_provider}. This verification aligns with the LCM orchestration principles in 3GPP TS 28.531 §6.2.3. Can the orchestrator communicate with the target {container_runtime} or {hypervisor}? The deployment is infeasible if the required management APIs are not exposed by the underlying virtualization platform.",
+        "Assess the viability of the proposed {rollback_strategy}. Can the system state be captured and restored within the service's MTTR target if {rollback_on_failure} is triggered? The ability to manage and terminate NFs is a core LCM function specified in 3GPP TS 28.531 §6.2.5. For a stateful {network_function}, verify that a data backup and restore mechanism exists and is reliable. The strategy is infeasible if a rollback would lead to data inconsistency or extended downtime.",
+        "Determine if the {network_function} can be reliably deployed within the specified {instantiation_timeout}. This check validates the performance of the entire orchestration chain, a key operational aspect of the LCM process from 3GPP TS 28.531 §6.2.3. Analyze historical deployment times for similar VNFs. Does the image download time from the registry plus the boot time fall comfortably within the timeout period? If not, the intent is at high risk of failure.",
+        "Verify that the designated {container_runtime} (e.g., containerd, CRI-O) supports all the features required by the cloud-native {network_function}. Does it support the necessary networking CNI plugins and storage CSI drivers? This detailed check is an implementation aspect of deploying VNFs on a container infrastructure, as abstracted in 3GPP TS 28.541 §A.4. Is the runtime version compatible with the {orchestration_platform} (e.g., Kubernetes)? The deployment is infeasible if the runtime cannot enforce the required CPU/memory limits.",
+        "Assess the feasibility of integrating the {network_function} into the existing {mesh_technology}. Can the service mesh sidecar be injected without compromising the VNF's performance or stability? This is an advanced deployment scenario for cloud-native functions, whose management aligns with the principles of 3GPP TS 28.531. Does the mesh support the required traffic routing, {load_balancing}, and {circuit_breaker} patterns? The integration is not feasible if the mesh's MTLS encryption introduces latency that violates the {latency_requirement}.",
+        "Evaluate if the selected {ai_prediction_model} has a sufficient {accuracy_level} to be used for a proactive {auto_scaling_policy}. This is a forward-looking application of the scaling management functions in 3GPP TS 28.531 §8.2. Will the model's predictions allow for resource allocation with enough lead time to meet the {adaptation_speed}? The model is considered infeasible if its false positive rate for scaling predictions would lead to excessive resource costs.",
+        "Assess if the {optimization_algorithm} can dynamically allocate resources to meet the {sla_type} more efficiently than static allocation. Can this algorithm reduce the required {cpu_cores} or {memory_size} while still guaranteeing the {latency_requirement}? This aligns with the goal of efficient resource utilization in NFV, a core principle behind 3GPP TS 28.530. The algorithm is not feasible if its computational overhead negates the resource savings.",
+        "Determine the feasibility of monitoring a {slice_category} slice using an AI-based anomaly detection model. Can the model process telemetry data at the required rate to detect deviations in {guaranteed_bitrate} or {latency_requirement} in near real-time? This relates to the performance monitoring data that can be collected for a slice, as mentioned in 3GPP TS 28.552 §5.2. The approach is infeasible if the model cannot distinguish between normal traffic fluctuations and genuine service degradations.",
+        "Evaluate if the {ai_prediction_model} can be used to preemptively identify security threats to the {network_function}. Does the model have access to the necessary logs and network flows to achieve a high {accuracy_level} in threat detection? This is an advanced security assurance mechanism that builds upon the foundational security architecture of 3GPP TS 33.501. The intent is infeasible if the AI model's response time is slower than the speed of common automated attacks.",
+        "Assess the feasibility of the proposed {edge_strategy} which uses an {ai_prediction_model} to decide traffic offload to {cloud_providers}. Can the model make decisions fast enough to maintain the session continuity and {latency_requirement} for the user? This complex orchestration is a future-facing implementation of the principles in 3GPP TS 28.530. The strategy is infeasible if the cost of data transfer to the cloud for analysis outweighs the benefits of offloading the compute.",
+        "Validate if the end-to-end {latency_requirement} can be met for a service traversing the core, transport, and RAN domains. Can each domain commit to its allocated portion of the latency budget? This is a fundamental check for services defined in 3GPP TS 23.501 §5.7. The intent is infeasible if the {backhaul_latency} alone consumes an unacceptable percentage of the total budget. Assess if distributed_tracing is possible across all domains to monitor compliance.",
+        "Assess the feasibility of a service chain composing multiple VNFs from different {vnf_provider}s. Can the {orchestration_platform} manage the lifecycle dependencies and health checks for the entire chain? This complex orchestration is governed by the principles of Network Service (NS) management in 3GPP TS 28.531 §6. The chain is infeasible if the cumulative resource needs ({cpu_cores}, {memory_size}) of all VNFs exceed the capacity of a single availability zone, violating the {affinity} requirements.",
+        "Confirm that the proposed deployment of {network_function} for {tenant_id} can meet regulatory requirements such as Lawful Intercept (LI). Are the necessary interfaces and probes available in the {architecture}? The architectural requirements for LI are specified in 3GPP TS 33.126. The deployment is infeasible if enabling LI functionality compromises the {guaranteed_bitrate} or introduces significant latency.",
+        "Validate the technical feasibility of an mMTC {slice_category} service. Can the core network's AMF and SMF handle the projected {connection_density} without performance degradation? This is a key capability of the 5G core as defined in 3GPP TS 23.501 §5.15.4. Assess if the {storage_type} for the UDM can handle the high rate of registration and authentication requests. The intent fails if the signaling storm from massive device connections cannot be mitigated.",
+        "Determine if Reflective QoS (RQI) can be supported for the intended service on the {network_function} (UPF). This capability is defined in 3GPP TS 23.501 §5.7.5. Can the UPF derive and apply QoS rules for uplink traffic based on the downlink packets? The feature is infeasible if the {cpu_arch} of the UPF cannot perform the required deep packet inspection and rule correlation at line rate without violating the {latency_requirement}.",
+        "Assess the feasibility of implementing SUPI concealment for enhanced user privacy. Are the UDM and UDR in the network configured to support this feature as per 3GPP TS 33.501 §6.12? Can the home network generate and manage public/private key pairs for all subscribers? The intent is infeasible if the {auth_method} used by legacy devices in the network is incompatible with the SUPI concealment mechanism.",
+        "For a high-performance {network_function} like a UPF, assess the feasibility of applying CPU pinning and ensuring NUMA (Non-Uniform Memory Access) awareness. Does the {hypervisor} and {orchestration_platform} expose the controls needed for such fine-grained resource allocation? This is an advanced implementation of the resource management concepts in 3GPP TS 28.541 §A.4. The deployment is infeasible if NUMA node locality cannot be guaranteed, as this would violate the {latency_requirement}.",
+        "Evaluate if there are sufficient resources across multiple clusters to support a geographically redundant deployment of the {network_function}. Can {min_instances} be deployed in at least two separate availability zones to satisfy the {availability_req}? This relates to the high-level management goal of ensuring service continuity (3GPP TS 28.530). The intent is infeasible if the inter-cluster {backhaul_latency} is too high for state replication.",
+        "Assess the feasibility of managing the {network_function} configuration using a GitOps workflow. Is the {orchestration_platform} (e.g., Kubernetes) integrated with a Git repository and a reconciliation agent? This is a modern, declarative approach to the configuration management aspects mentioned in 3GPP TS 28.532. The approach is not viable if the {vnf_provider} packages their application in a format that cannot be managed declaratively.",
+        "Can the {network_function} be updated to a new version in-place without requiring a full re-instantiation? This feasibility check pertains to the VNF software modification LCM procedure in 3GPP TS 28.531 §8.5. Does the {vnf_provider} support rolling updates? The intent is infeasible if the update process would violate the {availability_req} for the service.",
+        "Evaluate if a service chain can be deployed when its constituent network functions are managed by different orchestrators (e.g., a core NF on OpenStack and an edge NF on Kubernetes). Can a higher-level service orchestrator manage the end-to-end {workflow_version}? This scenario addresses the challenge of multi-domain orchestration described in 3GPP TS 28.530 §4.3. The deployment is infeasible if there is no standardized API or integration layer between the orchestration systems.",
+        "Assess the feasibility of creating a digital twin of the {slice_category} slice to test the impact of the {optimization_algorithm} before live deployment. Does the simulation environment have an accurate model of the network {architecture} and resources? This is an advanced assurance technique beyond standard monitoring (3GPP TS 28.552). The digital twin is not viable if it cannot predict the effect of configuration changes on {guaranteed_bitrate} with at least {accuracy_level}% accuracy.",
+        "Determine if an AI model can be used for automated root cause analysis (RCA) when a {sla_type} violation occurs. Does the model have access to the logs and network flows to identify the root cause faster than a human operator's Mean Time to Identify (MTTI)? This is an AI-powered enhancement to the fault management capabilities outlined in 3GPP TS 28.532 §4.8. The AI-RCA is infeasible if it cannot identify the root cause faster than a human operator's Mean Time to Identify (MTTI).",
+        "Evaluate the feasibility of using a reinforcement learning (RL) model as the {optimization_algorithm} for real-time radio resource management. Can the RL agent interface with the RAN scheduler to adjust parameters and improve spectral efficiency? This is a highly advanced application of the RAN management principles in 3GPP TS 38.300. The intent is infeasible if the agent's decision loop ({adaptation_speed}) is slower than the channel state changes.",
+        "Check if the {ai_prediction_model} can be used for predictive maintenance of the underlying physical or virtual infrastructure. Can it analyze hardware telemetry or hypervisor logs to predict failures before they impact the {availability_req}? This AI-driven approach enhances the fault management capabilities described in 3GPP TS 28.532. The model is not feasible if its predictions are not actionable or do not provide enough lead time for maintenance.",
+        "Evaluate the general feasibility of a {hybrid_strategy} for the {network_function} across {cloud_providers} and on-premise. Can the {orchestration_platform} manage a unified resource inventory? This check is a prerequisite for cross-domain management as per 3GPP TS 28.530 §4.3. The strategy is infeasible if security policies, like {zero_trust_identity}, cannot be consistently enforced across all environments.",
+        "Assess the feasibility of a closed-loop automation intent for the {slice_category} slice. Can the monitoring system detect an SLA deviation and trigger the {optimization_algorithm} via the {workflow_engine} without human intervention? This is the ultimate goal of the intent-based networking principles evolving from 3GPP TS 28.530. The loop is infeasible if the {adaptation_speed} from detection to remediation exceeds the service's MTTR target.",
+        "Determine if it's feasible to dynamically instantiate a temporary, high-priority {slice_category} slice for emergency services or a large public event. Can the {orchestration_platform} provision all required resources within a {instantiation_timeout} of 5 minutes? This is an agile application of the slice allocation procedures in 3GPP TS 28.541 §5.3. The intent is infeasible if resources cannot be preempted from lower-priority slices.",
+        "Evaluate the feasibility of an energy-saving policy for the {network_function}. Can instances be scaled down from {max_instances} to {min_instances} during off-peak hours without affecting the {availability_req}? Can the {optimization_algorithm} consolidate workloads onto fewer physical servers? This aligns with the operational efficiency goals inherent in the NFV management framework (3GPP TS 28.530). The policy is infeasible if the power state transition time for servers is too long.",
+        "Assess if the {network_function} provided by {tenant_id} can securely and efficiently interact with the core network via the Network Exposure Function (NEF). Are the required APIs exposed by the NEF, and does the {auth_method} comply with 3GPP standards as per TS 29.522? This is a technical feasibility check of a key 5G capability (TS 23.501 §5.20). The integration is infeasible if the NEF cannot handle the API call rate from the tenant's application.",
+        "For a performance-critical {network_function} like a UPF, is it feasible to deploy it on bare metal servers instead of under a {hypervisor}? Does the {orchestration_platform} support bare metal provisioning? This choice directly impacts the achievable performance, a key consideration for resources in 3GPP TS 28.541 §A.4. The intent is infeasible if the security and isolation guarantees required for the {tenant_id} cannot be met without a hypervisor.",
+        "Validate if the contracted QoS parameters, such as {guaranteed_bitrate}, can be feasibly delivered for roaming users from {tenant_id}. Does the interconnect agreement with the partner network support the necessary QoS markings and traffic handling? This relates to inter-network slice management and the procedures defined in 3GPP TS 23.501 §5.15.6. The service is infeasible if the visited network's backhaul cannot support the required SLA.",
+        "Assess if the new {network_function} from {vnf_provider} can be integrated into the operator's existing CI/CD pipeline for automated testing and deployment. Is the VNF packaged as a container ({container_runtime}) and defined with a declarative configuration (e.g., Helm, Kustomize)? This is a modern operational approach to the VNF lifecycle management described in 3GPP TS 28.531. The integration is infeasible if the VNF requires manual configuration steps that cannot be automated.",
+        "Evaluate the feasibility of using an {ai_prediction_model} to proactively re-route traffic before a predicted network congestion event occurs. Can the {optimization_algorithm} calculate an alternative path and execute the change via the SDN controller without violating the {packet_error_rate}? This proactive traffic management is an intelligent application of the policy and charging control (PCC) framework from 3GPP TS 23.503. The intent is infeasible if the network topology does not offer sufficient path diversity.",
+        "Can a caching {network_function} be dynamically deployed to an edge location based on real-time content popularity analytics? Assess if the {orchestration_platform} can trigger a deployment workflow within the {execution_timeout} when the analytics platform detects a demand surge. This is an agile implementation of placing functions closer to the user to meet latency goals (a principle from 3GPP TS 23.501). The strategy is infeasible if the edge location lacks pre-provisioned {storage_capacity}."
+    ),
+
+    "Report Request": (
+        "Generate a comprehensive performance report for the {network_function} operating within the {slice_category}. The report must detail the {throughput_req} and {latency_req} over the last 24 hours. Correlate these KPIs with the underlying resource utilization, specifically {cpu_cores} and {memory_size}. If {availability_req} drops below the defined threshold, automatically include {mtbf} and {mttr} metrics.",
+        "Produce a security compliance audit for the {slice_category} network slice. This report must verify that configured {encryption} and {integrity} protection policies are consistently enforced. Confirm that the {key_rotation} schedule is being followed as per security guidelines. The report's data must be stored for the specified {retention_period}.",
+        "Initiate a predictive analytics report for {network_function} using the {ai_prediction_model}. Forecast the resource demand for {cpu_cores} and {bandwidth_allocation} based on historical consumption patterns. The model must achieve an {accuracy_level} of 95% or higher. If a resource shortfall is predicted, suggest an alternative {optimization_algorithm} for traffic management.",
+        "Create a daily SLA report for {sla_type} agreements. The report should summarize the {guaranteed_bitrate} and {maximum_bitrate} for {flow_id}. It must also include statistics on {packet_delay} and {packet_error_rate} averaged over a {averaging_window}. Attach all logs where {preemption_capability} was invoked.",
+        "Assess the performance impact of the current {auto_scaling_policy} for the {network_function}. The report should analyze the time taken for {horizontal_scaling} events to complete versus the {execution_timeout} limit. Correlate scaling events with fluctuations in {jitter_tolerance}. Does the current {workflow_engine} meet the {adaptation_speed} required to prevent SLA breaches?",
+        "Generate a report verifying adherence to our {zero_trust_identity} framework for all devices connecting to the {network_function}. The report must list all successful and failed {auth_method} attempts. Additionally, verify that {location_privacy} mechanisms are active for all UEs in the {location_category}.",
+        "Run an anomaly detection report on the {slice_category}. Use {anomaly_detection} algorithms to identify unusual patterns in {packet_error_rate} and {connection_density}. If an anomaly is detected with high confidence, trigger a deeper analysis using {distributed_tracing} to pinpoint the root cause and notify {escalation_l2}.",
+        "Provide a resource utilization summary for the {network_function} instances. The report should detail the average and peak usage of {memory_size} ({memory_type}) and {storage_capacity} ({storage_type}). Compare this utilization against the configured {deployment_flavor} to identify optimization opportunities.",
+        "Create a forecast report predicting potential {backhaul_capacity} bottlenecks in the {location_category}. Use {predictive_analytics} to model traffic growth over the next quarter. If a future bottleneck is identified, evaluate the effectiveness of {load_balancing} as a proactive mitigation strategy.",
+        "Compile a monthly reliability report for the {architecture}. The report must feature {mtbf} and {mttr} statistics for critical network functions. Include a summary of all {circuit_breaker} events and their resulting impact on the overall {availability_req}.",
+        "Generate a data privacy compliance report. Confirm that {location_privacy} is enabled for all relevant services as per policy. The report must also verify that the {retention_period} for user-specific data complies with regulatory requirements.",
+        "Develop a report that uses {predictive_analytics} to identify subscribers experiencing degraded Quality of Experience. The model should analyze {packet_error_rate} and {throughput_req} deviations. If a group of users is affected, escalate to {escalation_l1} with a list of potential causes.",
+        "Create a report analyzing the end-to-end latency for the {slice_category}. Use data from {distributed_tracing} to break down latency contributions from different network segments. This report must verify compliance with the overall {latency_req} defined in the {sla_type}.",
+        "Audit the {affinity} and {anti_affinity} rules for all deployed instances of {network_function}. The report must confirm that these rules are correctly enforced by the orchestrator to ensure high availability. Flag any violations found during the audit period.",
+        "Initiate a report to determine the optimal {sampling_rate} and {aggregation_interval} for monitoring the {network_function}. Use an {optimization_algorithm} to balance monitoring granularity against resource overhead. The goal is to detect anomalies without overburdening the system.",
+        "Provide a high-level executive summary of network slice performance for the {slice_category}. The report should visualize key metrics like {availability_req} and {reliability_req} against targets. Include a section on major incidents and their resolution times.",
+        "Report on the correlation between {backhaul_capacity} and the {maximum_bitrate} achievable in the {location_category}. If {backhaul_capacity} is found to be a limiting factor, append a simulation of the expected performance gains from a potential capacity upgrade.",
+        "Generate a report to verify that all VNF/CNF images currently in use match their expected and approved versions. This report must cross-reference the running instances against the management system's catalog. Include a check on {integrity} hashes where available.",
+        "Use {ai_prediction_model} to report on the likelihood of SLA violations for {sla_type} in the next 7 days. The prediction should be based on current trends in resource usage and network congestion. If the likelihood exceeds 75%, trigger a proactive resource {vertical_scaling} recommendation.",
+        "Request a report detailing all manual interventions performed on the network infrastructure over the past quarter. The report should categorize these interventions and identify prime candidates for future automation using {iac_tool}.",
+        "Generate a comparative report on resource efficiency between {memory_type} DD4 and DDR5 for the {network_function}. The report should analyze if the upgrade to DDR5 resulted in a measurable improvement in {latency_req} under heavy load conditions.",
+        "Create a compliance report that confirms all network traffic within the {slice_category} is properly isolated from other slices. The report should include verification of network policies, VLANs, and routing tables to ensure separation.",
+        "Report on the primary causes of {mttr} for the {network_function}. Use {anomaly_detection} on logs and metrics to correlate failures with specific events (e.g., software updates, traffic spikes). Suggest improvements to the {rollback_strategy} based on these findings.",
+        "Produce a report summarizing all active QoS flows with a {priority_level_num} of 1. For each flow, list the associated service and its currently configured {guaranteed_bitrate}.",
+        "Initiate a report to find silent failures within the {architecture}. Use {predictive_analytics} to analyze subtle performance degradations that do not trigger standard alarms but could indicate an impending {mtbf} event. Escalate these findings to {escalation_l3}.",
+        "Compile a capacity planning report for {storage_type} resources. Project the storage needs for the next 12 months based on current data growth trends. The report should factor in the {retention_period} for all collected monitoring and log data.",
+        "Create a report analyzing the efficiency of the {auto_scaling_policy}. The report should answer: Are we scaling out too aggressively or too late? Compare the timing of {horizontal_scaling} events with the actual load on {cpu_cores}.",
+        "Document all instances where {preemption_capability} was used to de-allocate resources from lower-priority flows. The report must verify that this action was justified and followed the predefined policies for the {slice_category}.",
+        "Run a report using the {optimization_algorithm} to identify underutilized resources in our cloud-native environment. The report should suggest specific {vertical_scaling} actions (e.g., reducing {memory_size}) for idle instances of {network_function} to save costs.",
+        "I need a detailed report on {jitter_tolerance} performance for real-time services in the {slice_category}. If jitter exceeds the SLA threshold, the report must include a snapshot of the network state captured via {distributed_tracing} at the time of the event.",
+        "Produce a report verifying that all deployed network functions are running on infrastructure that meets the {architecture} specifications (e.g., CPU instruction sets). Flag any function running on non-compliant or deprecated hardware.",
+        "Create a report that predicts the impact of a potential {backhaul_capacity} failure at {location_category}. Use the {ai_prediction_model} to simulate the re-routing of traffic and forecast the resulting increase in {latency_req} for affected services.",
+        "Assess the {packet_error_rate} for the {slice_category}. If the rate is above the acceptable threshold, the report must include an analysis correlating the errors with specific network segments or functions.",
+        "Please provide a report confirming that all management interfaces for the {network_function} are secured using the approved {auth_method} and {encryption} protocols. Any exceptions must be highlighted.",
+        "Use {predictive_analytics} to report on the \"health score\" of each network slice. The score should be a composite metric derived from {availability_req}, {latency_req}, {throughput_req}, and user-reported issues, indicating overall service quality.",
+        "I need a report listing all configured {sla_type} contracts and their primary parameters ({guaranteed_bitrate}, {latency_req}).",
+        "Can you generate a report showing the impact of {horizontal_scaling} events on {memory_type} consumption patterns? I want to see if scaling out causes unexpected memory pressure on the underlying hypervisors.",
+        "Run a report to verify that the {anti_affinity} rules are preventing critical and redundant instances of {network_function} from being placed on the same physical host.",
+        "Generate a report identifying the root cause of intermittent {jitter_tolerance} violations. Use {distributed_tracing} combined with {anomaly_detection} to find correlations that are not obvious from standard metrics.",
+        "Report on the end-to-end {packet_delay} for {flow_id}. The report must use an {averaging_window} of 5 minutes and highlight any spikes that exceed the {sla_type} definition."
+    ),
+
+    "Modification": (
+        "Initiate a vertical scaling modification for {network_function} of {vnf_version}. Augment the existing {deployment_flavor} by increasing compute resources to {cpu_cores} cores and {memory_size} of {memory_type} RAM. This modification is intended to maintain the {availability_req}% SLA under projected load increases. The {rollback_strategy} must be pre-configured to revert changes if monitoring detects a breach of the {mttr} objective.",
+        "Modify the QoS profile for {flow_id} to meet stringent URLLC requirements. Adjust the QoS Flow to enforce a maximum {packet_delay} and a {packet_error_rate} of 10-5. This change must be compliant with the 5QI characteristics for low latency services. Validate that the {preemption_capability} is enabled to prioritize this flow over non-critical traffic.",
+        "Update the orchestration policy for {network_function} to implement a new {auto_scaling_policy}. The scaling limits are to be adjusted to a range of {min_instances} to {max_instances}. Scaling actions will be triggered by the {optimization_algorithm} when {connection_density} metrics exceed predefined thresholds. All scaling operations must adhere to the {anti_affinity} rules specified for this service.",
+        "Reconfigure the gNBs in the {deployment_scenario} to utilize advanced {beamforming} techniques. This modification applies to the {mid_band} frequency range and aims to improve spectral efficiency. The change should be coordinated by the orchestration platform to minimize service disruption. Monitor the impact on cell edge performance and overall sector throughput.",
+        "Implement a cross-domain service modification to optimize the data path between the RAN and the data network. Increase {backhaul_capacity} and re-route traffic to ensure the end-to-end {latency_requirement} is met. This requires coordinated changes in both transport network and the core {network_function} (e.g., UPF). Ensure the {reliability_req} is not compromised during this transition.",
+        "Update the security context for the {slice_category} slice by enforcing a new {key_rotation} policy. Modify the NFs to use {auth_method} for all internal communications. This security enhancement must be rolled out without impacting the {availability_req} of the service. Log all configuration changes for audit purposes.",
+        "Modify the existing horizontal scaling policy for {network_function} to be predictive. Use the {ai_prediction_model} to forecast traffic patterns and preemptively trigger {horizontal_scaling} actions. The model must achieve an {accuracy_level} of 95% to avoid resource over-provisioning. The {adaptation_speed} of the scaling mechanism should be less than the predicted traffic ramp-up time.",
+        "Adjust the SLA for tenant {tenant_id} by modifying the {guaranteed_bitrate} for {flow_id}. The new GBR should be set to {guaranteed_bitrate}, with a peak of {maximum_bitrate}. The Policy Control Function (PCF) should enforce this change. Monitor the flow to ensure compliance and use {reflective_qos} where applicable.",
+        "Execute a VNF modification by changing the {deployment_flavor} for all instances of {network_function}. This involves a planned migration to instances with {storage_capacity} of {storage_type} to support increased logging and state storage. The process must be executed within the {execution_timeout} window and use the {rollback_strategy} upon failure.",
+        "Adapt the deployment of {network_function} to a {hybrid_strategy}, distributing new instances across on-premise VIM and {cloud_providers}. This modification requires updating the {workflow_engine} with {workflow_version} to manage multi-cloud resources. Use {load_balancing} to distribute traffic according to the defined policy.",
+        "Modify the monitoring policy by adjusting the {sampling_rate} and {aggregation_interval} for performance metrics related to {network_function}. Enable {anomaly_detection} with a higher sensitivity to track jitter. The data {retention_period} for these high-granularity metrics should be set to {retention_period}.",
+        "Refine the QoS profile for a real-time communication service by setting the {jitter_tolerance} parameter. This modification is critical for maintaining voice and video quality for the {slice_category}. The network must ensure that packet delay variation remains within this new bound.",
+        "Initiate a rolling upgrade of {network_function} to {vnf_version}. The upgrade shall be managed by the {workflow_engine} using a blue-green deployment to ensure zero downtime. The new version must maintain or improve upon the existing {reliability_req}. If post-deployment checks fail, trigger an automated rollback to the previous version.",
+        "Increase the dedicated {bandwidth_allocation} for the network slice serving {tenant_id}. This is to support a higher {connection_density} and ensure the {guaranteed_bitrate} can be met during peak hours. The modification should be applied at both the transport and core network layers.",
+        "Modify the RAN configuration to implement a new {sectorization} strategy, increasing the number of sectors per cell site. This change is aimed at increasing capacity in a dense {deployment_scenario}. Concurrently, ensure the {backhaul_capacity} is sufficient to handle the increased aggregated traffic from the new sectors.",
+        "Adjust the {circuit_breaker} parameters for the microservices within {network_function}. The intent is to make the function more resilient to transient downstream failures. Modify the failure threshold and reset timeout to align with the target {mtbf} for the service.",
+        "Update the security policy to mandate the use of a new {integrity} protection algorithm for user plane traffic within the {slice_category} slice. This change must be propagated to all relevant NFs (e.g., UPF, gNB). This is a compliance requirement to protect against data tampering.",
+        "Enable {reflective_qos} for specific services to allow the UE to mirror downlink QoS for uplink traffic. This modification simplifies QoS management for symmetric services. The change must be authorized by the PCF and applied at the UPF.",
+        "Expand the {storage_capacity} for {network_function} to accommodate a longer data {retention_period} for analytics. The new {storage_type} should be optimized for high-throughput reads. The expansion should be performed live without impacting the function's operation.",
+        "Trigger a re-evaluation and potential modification of the resources allocated to a network slice. If {predictive_analytics} indicates a sustained increase in demand, automatically adjust {cpu_cores}, {memory_size}, and {bandwidth_allocation} to meet the {sla_type}.",
+        "Modify the RAN configuration to activate the {low_band} spectrum for wide-area coverage. This change is intended to improve indoor penetration and cell-edge performance. Ensure UEs capable of carrier aggregation can utilize this new band in conjunction with existing {mid_band} carriers.",
+        "Modify the {execution_timeout} for orchestration workflows related to {network_function} scaling. The current timeout is too aggressive and causes false positives. A longer timeout will improve the reliability of scaling operations during high load. The {rollback_on_failure} policy remains in effect.",
+        "Modify the security configuration to enhance {location_privacy} for subscribers. This involves tighter controls on how location information is exposed to third-party applications via the NEF. The change must align with regulatory requirements.",
+        "Change the active {optimization_algorithm} used for RAN resource management. The new algorithm leverages an {ai_prediction_model} to dynamically allocate resources, aiming to reduce inter-cell interference. The goal is to improve the overall {throughput_req} across the network.",
+        "Adjust the {auto_scaling_policy} for {network_function} by increasing the {max_instances} parameter. This modification will provide greater elasticity to handle unexpected traffic surges. Ensure the underlying {orchestration_platform} has sufficient resource headroom to support this new upper limit.",
+        "Change the {load_balancing} algorithm for traffic entering the {network_function} service mesh from round-robin to least-connections. This modification is intended to provide a more even distribution of load across instances. Monitor instance CPU utilization to verify the effectiveness of the change.",
+        "Update the service commitment for a slice by modifying its {availability_req} and {reliability_req} parameters. This reflects a new {sla_type} agreement. The orchestrator must verify that the current resource allocation and resilience mechanisms can support these new, stricter targets.",
+        "Modify the inventory database to reflect an upgrade of {antenna_type} at specific cell sites. This information is critical for the accuracy of network planning and optimization tools. The change should trigger a re-evaluation of beamforming patterns for the affected cells.",
+        "Initiate a modification to rebalance instances of {network_function} across multiple VIMs, including {cloud_providers}. The goal is to optimize for geographic latency and improve resilience. This requires a {workflow_engine} capable of cross-site orchestration and state management.",
+        "Modify the QoS configuration to make {flow_id} subject to preemption by higher-priority traffic by disabling its {preemption_capability}. This change is intended to free up resources for critical services like emergency calls during network congestion.",
+        "Update the lifecycle management {workflow_version} to support the deployment and configuration of {vnf_version} of {network_function}. The new workflow must include updated configuration steps and health checks specific to the new version. The old workflow should be deprecated but retained for rollback purposes.",
+        "Trigger a {vertical_scaling} operation on {network_function} to increase its {memory_size}. This is in response to monitoring alerts indicating high memory pressure that could impact performance. The change should be applied with minimal service impact.",
+        "Modify the RAN configuration to activate {high_band} (mmWave) spectrum for a Fixed Wireless Access (FWA) {deployment_scenario}. This requires enabling specific {beamforming} procedures for stationary users. Ensure the core network's UPF has the capacity to handle the resulting {maximum_bitrate}.",
+        "Modify the monitoring configuration to use a different {compression_ratio} for performance data sent to the analytics engine. The goal is to reduce the load on the management network without losing essential information needed by the {anomaly_detection} system.",
+        "Change the {rollback_strategy} for {network_function} from a full revert to a stateful, canary-based rollback. This allows for more granular failure recovery during phased rollouts. The new strategy should be tested in a staging environment before being applied to production.",
+        "Modify an existing network slice to align with a new service profile, which mandates a lower {latency_requirement} and a higher {guaranteed_bitrate}. This will likely trigger a full re-evaluation of the slice's resource allocation and configuration by the orchestrator.",
+        "Create and apply a new {deployment_flavor} for {network_function} instances at the network edge. This flavor will be optimized for low resource consumption ({cpu_cores}, {memory_size}) to fit edge hardware constraints, supporting the operator's {edge_strategy}.",
+        "Modify the network access policies to support {auth_method} as a new primary authentication mechanism. This requires configuration changes on the AUSF and UDM ({network_function}). The change should be rolled out progressively to different subscriber groups.",
+        "Alter the service function chain for a specific data flow by inserting a new VNF for traffic inspection. This requires the orchestrator to update the network forwarding paths and ensure the new chain does not violate the end-to-end {latency_requirement}.",
+        "Update the resilience objectives for the {slice_category} slice by modifying the target {mtbf} (Mean Time Between Failures) and {mttr} (Mean Time To Repair). The orchestrator must confirm that the current {redundancy} model and {rollback_strategy} can meet these new targets.",
+        "Decommission and re-provision {network_function} to migrate it to a new {storage_type} (e.g., from HDD to SSD). This modification is intended to resolve an I/O bottleneck that is impacting service performance. The migration must be performed within a scheduled maintenance window.",
+        "Modify the NFVO/VIM configuration to add a new public {cloud_providers} as a valid resource pool. This involves updating the {workflow_engine} with the appropriate APIs and image repositories. The intent is to enable a {hybrid_strategy} for bursting capacity.",
+        "Fine-tune the {auto_scaling_policy} by adjusting the {horizontal_scaling} step size and cooldown period. The intent is to make the scaling response more aggressive to quickly adapt to flash crowd scenarios, while avoiding flapping.",
+        "Modify the QoS target for a massive IoT service by relaxing the {packet_error_rate} requirement. This allows for more efficient radio resource utilization for devices that are tolerant to some data loss.",
+        "Push a runtime configuration change to all instances of {network_function}. The change involves updating an internal application parameter (e.g., cache size) to improve performance. This modification should be applied via the VNFM without requiring a full restart of the instances.",
+        "Enhance the resilience of a cell site by provisioning a secondary, diverse {backhaul_type} path. The modification should ensure that failover between the primary and secondary paths is automatic and occurs within the service's {mttr} objective.",
+        "Replace the current {ai_prediction_model} used for network slice load forecasting with an updated version. The new model promises a higher {accuracy_level} and better handling of seasonal traffic variations. The NWDAF ({network_function}) should be updated to use this new model for its analytics services."
+    ),
+
+    "Performance Assurance": (
+        "Continuously assure that the service maintains a {throughput_req} and stays below a {latency_req} threshold. This performance assurance intent is critical for maintaining the {sla_type}. Activate {anomaly_detection} to identify deviations in real-time. Should performance degrade, automatically adjust the {load_balancing} strategy to reroute traffic and maintain stability.",
+        "Enforce a strict {sla_type} by monitoring for {availability_req}% uptime and a {reliability_req}% success rate. Track {mttr} and {mtbf} metrics continuously over a {retention_period}. Use {predictive_analytics} to forecast potential SLA breaches. If a breach is predicted with {accuracy_level}% confidence, trigger the {auto_scaling_policy} to preemptively add resources.",
+        "This intent focuses on ultra-low latency optimization, targeting a maximum {latency_req} and a minimal {jitter_tolerance}. Implement a high-frequency {sampling_rate} for packet delay measurements. Engage {distributed_tracing} to pinpoint sources of latency across the service chain. Any packet delay exceeding the {packet_delay} threshold must trigger an immediate re-optimization of the network path.",
+        "Maximize service throughput by assuring a {guaranteed_bitrate} and allowing bursts up to {maximum_bitrate}. Monitor the data flow over a defined {averaging_window} to ensure compliance. If the guaranteed bitrate is not met, dynamically re-allocate network resources. The {preemption_capability} for this flow is set to {priority_level_num} to ensure resource availability.",
+        "Implement an AI-driven assurance loop for this service. Use {predictive_analytics} to forecast throughput demand and potential latency spikes with {accuracy_level}% accuracy. The model should have an {adaptation_speed} capable of responding to real-time changes. If a degradation is predicted, the system must automatically initiate a corrective workflow.",
+        "Assure performance by maintaining a {throughput_req} and {packet_error_rate} below the specified limits. The {monitoring_interval} shall be set to {aggregation_interval}. Any detected anomaly via {anomaly_detection} should trigger an alert and a data capture for root cause analysis. This is essential for maintaining the core {sla_type} agreement.",
+        "This intent is to guarantee the {sla_type} for a mission-critical service, focusing on an {availability_req}% target. Continuously verify that {mtbf} is high and {mttr} is low. The system must automatically failover in case of a component failure. All performance data will be stored for a {retention_period} for compliance auditing.",
+        "Optimize for consistent low latency by ensuring the end-to-end {packet_delay} does not exceed {latency_req}. Monitor {jitter_tolerance} to guarantee smooth real-time communication. If jitter exceeds the threshold, prioritize the traffic flow to {priority_level_num}. This is crucial for interactive services like cloud gaming or AR/VR.",
+        "Ensure the service can consistently achieve a {maximum_bitrate} during peak demand by monitoring traffic patterns. Apply an aggressive {auto_scaling_policy} to rapidly scale resources when throughput demand nears the {throughput_req} ceiling. Use {load_balancing} to distribute the increased load efficiently across all available instances.",
+        "Deploy an AI-powered performance assurance model, {predictive_analytics}, to maintain the service's health. The model must predict {packet_error_rate} trends with {accuracy_level}% accuracy. Based on predictions, the system should dynamically adjust resource allocation with a high {adaptation_speed}. This ensures proactive, closed-loop service assurance.",
+        "Maintain a constant watch on the {guaranteed_bitrate} for this flow, ensuring it never drops below the specified {sla_type} value. Data will be measured using a {sampling_rate} of 1 per second. If performance degrades, {anomaly_detection} must trigger a workflow to investigate the cause, referencing the required {reliability_req}.",
+        "The primary goal is to assure the {availability_req}% SLA commitment. The system's performance will be evaluated against {mtbf} and {mttr} goals. In the event of an outage, the recovery process must be completed within the {mttr} window. All assurance data is subject to a {retention_period} for review.",
+        "This intent is to minimize latency fluctuations by enforcing a strict {jitter_tolerance}. Monitor the network path continuously for any increase in delay variation. If the {averaging_window} shows a negative trend, re-route the traffic through a more stable path. This is vital for high-quality voice and video services.",
+        "Assure that the aggregated service throughput consistently meets or exceeds {throughput_req}. Use {load_balancing} across multiple instances to achieve this goal. If the total throughput drops, the {auto_scaling_policy} should be invoked to horizontally scale the service and meet demand.",
+        "Leverage {predictive_analytics} to proactively manage QoS. The AI model will forecast potential {jitter_tolerance} violations based on current network conditions. If a violation is predicted with {accuracy_level}% confidence, the system will apply corrective measures with a defined {adaptation_speed} before the user experience is impacted.",
+        "The performance assurance intent is to monitor the {packet_delay} for a specific flow with {priority_level_num}. If the delay exceeds the target, activate {distributed_tracing} to identify the bottleneck. This granular level of observability is required to meet the stringent {sla_type}.",
+        "This SLA assurance intent mandates a {reliability_req}% for the service. The system must adhere to the agreed {mtbf} and {mttr} values. The monitoring system will aggregate data every {aggregation_interval} and will trigger alerts if the reliability metric trends downwards.",
+        "To ensure a superior real-time experience, this intent targets a {latency_req} and a low {packet_error_rate}. The network must be configured to prioritize this traffic. If contention occurs, the {preemption_capability} will be used to secure the necessary resources.",
+        "Assure that the service can handle burst traffic up to {maximum_bitrate} without performance degradation. The {auto_scaling_policy} must be sensitive enough to react to sudden spikes in demand. Monitor resource utilization and throughput to ensure the scaling actions are effective.",
+        "In case of a link failure scenario, this intent ensures service continuity with a minimal {mttr}. The {mesh_technology} should provide at least two redundant paths. The system must automatically switch to the backup path and report the failover event, ensuring the {availability_req} is not compromised.",
+        "Utilize an AI model for intelligent service assurance. The {predictive_analytics} engine will analyze monitoring data to predict impending failures that could impact the {reliability_req}. The system's {adaptation_speed} must be fast enough to take corrective action, such as migrating a service, before the failure occurs.",
+        "Assure performance by ensuring the {guaranteed_bitrate} is always met, measured over a sliding {averaging_window}. The {anomaly_detection} system will check for any prolonged dips in performance. A sustained dip will trigger a resource evaluation and potential vertical scaling.",
+        "The SLA for this service requires {availability_req}% uptime. To achieve this, the assurance system will monitor health checks at a high {sampling_rate}. In case of failure, the {mttr} must be strictly adhered to, with automated recovery scripts in place.",
+        "This intent is focused on optimizing latency for edge computing applications, targeting a {latency_req}. Use {distributed_tracing} to monitor the service mesh performance. If latency increases, adjust the {load_balancing} to favor edge nodes closer to the user.",
+        "Guarantee sufficient bandwidth by monitoring the {throughput_req}. If traffic demand consistently exceeds 80% of the allocated capacity, the {auto_scaling_policy} will be triggered to provision additional resources. This proactive scaling ensures the {maximum_bitrate} is always achievable.",
+        "Simulate a network congestion scenario and verify that the service maintains its QoS. The {priority_level_num} traffic must still meet its {guaranteed_bitrate} and {latency_req}. The {preemption_capability} must function correctly to shed lower-priority traffic.",
+        "This AI-driven intent is to minimize service downtime. The {predictive_analytics} model will forecast hardware failures that could impact {mtbf}. If a failure is predicted with {accuracy_level}% confidence, the system will automatically trigger a migration of services off the at-risk hardware.",
+        "Monitor and assure the end-to-end {packet_delay} and {packet_error_rate} for the specified flow. This is critical for meeting the {sla_type}. Data will be collected with a {compression_ratio} to optimize storage over the {retention_period}.",
+        "This intent is to enforce the {reliability_req}% target defined in the {sla_type}. The assurance system will track all service-affecting incidents to calculate {mtbf} and {mttr} accurately. Any deviation from the agreed reliability metrics will result in a compliance violation report.",
+        "For this latency-sensitive service, maintain a {jitter_tolerance} of less than 2ms. The monitoring system will use a high {sampling_rate} to detect micro-bursts and jitter. If jitter increases, the network fabric will be instructed to prioritize these packets.",
+        "The primary assurance goal is to ensure the {throughput_req} is consistently met. The system will use an {auto_scaling_policy} based on CPU and memory utilization to scale horizontally. This ensures that as user load increases, throughput performance remains stable.",
+        "Implement an AI assurance loop with a fast {adaptation_speed}. The system will use {predictive_analytics} to foresee SLA violations related to {latency_req}. Upon prediction, it will automatically adjust QoS parameters to prevent the violation from occurring, ensuring a consistent user experience.",
+        "Assure a {guaranteed_bitrate} and {maximum_bitrate} as per the service agreement. The performance will be monitored over a {aggregation_interval} of 5 minutes. If the guaranteed rate is not met, an alert will be raised to the network operations center.",
+        "This SLA assurance intent focuses on minimizing downtime by enforcing a strict {mttr}. Upon failure detection, automated recovery workflows must be initiated immediately. The success of these workflows is measured against the {availability_req} target.",
+        "The intent is to provide a stable, low-latency connection by limiting {packet_delay}. Use {distributed_tracing} to continuously monitor every hop in the service chain. If any component introduces excessive latency, it will be flagged for investigation.",
+        "To assure high throughput, this intent activates an aggressive {auto_scaling_policy}. The system will scale out when traffic exceeds 75% of {throughput_req}. This ensures that the service can always handle loads up to the {maximum_bitrate} without packet loss.",
+        "Use an AI model to dynamically manage service performance. The {predictive_analytics} engine will forecast user demand and preemptively trigger the {auto_scaling_policy}. This model must maintain an {accuracy_level} of over 95% to be effective.",
+        "Enforce the {availability_req}% SLA by monitoring the health of all service components. The {mtbf} for each component must meet the specified target. The assurance system will use this data to calculate the overall service availability.",
+        "This intent is to optimize for the lowest possible latency by ensuring {packet_delay} stays within the defined threshold. The network will use traffic shaping to prioritize these packets, reflecting their {priority_level_num}. Any increase in delay will be investigated immediately.",
+        "Assure that the service's throughput can scale from a baseline of {guaranteed_bitrate} to a peak of {maximum_bitrate}. The {auto_scaling_policy} will manage the required resources based on real-time demand, ensuring a smooth and responsive user experience.",
+        "In a network slice failover scenario, this intent is to assure that the service is restored within the {mttr} window. The backup slice must meet the same {latency_req} and {throughput_req} as the primary. This ensures seamless service continuity and maintains the {availability_req}.",
+        "This AI-driven intent focuses on proactive reliability assurance. The {predictive_analytics} model will identify patterns that lead to service failures. Based on these predictions, it will recommend or automate actions to prevent the failure from occurring, thereby improving the {mtbf}.",
+        "Continuously monitor the {jitter_tolerance} for a real-time video stream. If jitter exceeds the acceptable level, dynamically increase buffer sizes or re-route the stream over a more stable network path. This is key to maintaining a high-quality, uninterrupted viewing experience.",
+        "Assure the {reliability_req}% of the service by implementing a resilient architecture with {mesh_technology}. The system must tolerate single-component failures without impacting the end-user. The {mttr} for any automated recovery action must be less than 60 seconds."
+    ),
+
+    "Regular Notification": (
+        "Generate a comprehensive performance report for the {network_function} operating within the {slice_category}. The report must detail the {throughput_req} and {latency_req} over the last 24 hours. Correlate these KPIs with the underlying resource utilization, specifically {cpu_cores} and {memory_size}. If {availability_req} drops below the defined threshold, automatically include {mtbf} and {mttr} metrics.",
+        "Produce a security compliance audit for the {slice_category} network slice. This report must verify that configured {encryption} and {integrity} protection policies are consistently enforced. Confirm that the {key_rotation} schedule is being followed as per security guidelines. The report's data must be stored for the specified {retention_period}.",
+        "Initiate a predictive analytics report for {network_function} using the {ai_prediction_model}. Forecast the resource demand for {cpu_cores} and {bandwidth_allocation} based on historical consumption patterns. The model must achieve an {accuracy_level} of 95% or higher. If a resource shortfall is predicted, suggest an alternative {optimization_algorithm} for traffic management.",
+        "Create a daily SLA report for {sla_type} agreements. The report should summarize the {guaranteed_bitrate} and {maximum_bitrate} for {flow_id}. It must also include statistics on {packet_delay} and {packet_error_rate} averaged over a {averaging_window}. Attach all logs where {preemption_capability} was invoked.",
+        "Assess the performance impact of the current {auto_scaling_policy} for the {network_function}. The report should analyze the time taken for {horizontal_scaling} events to complete versus the {execution_timeout} limit. Correlate scaling events with fluctuations in {jitter_tolerance}. Does the current {workflow_engine} meet the {adaptation_speed} required to prevent SLA breaches?",
+        "Generate a report verifying adherence to our {zero_trust_identity} framework for all devices connecting to the {network_function}. The report must list all successful and failed {auth_method} attempts. Additionally, verify that {location_privacy} mechanisms are active for all UEs in the {location_category}.",
+        "Run an anomaly detection report on the {slice_category}. Use {anomaly_detection} algorithms to identify unusual patterns in {packet_error_rate} and {connection_density}. If an anomaly is detected with high confidence, trigger a deeper analysis using {distributed_tracing} to pinpoint the root cause and notify {escalation_l2}.",
+        "Provide a resource utilization summary for the {network_function} instances. The report should detail the average and peak usage of {memory_size} ({memory_type}) and {storage_capacity} ({storage_type}). Compare this utilization against the configured {deployment_flavor} to identify optimization opportunities.",
+        "Generate a Quality of Service (QoS) trend report for {flow_id} over the past month. Track {jitter_tolerance}, {packet_delay}, and {guaranteed_bitrate}. If performance degrades by more than 10%, the report should automatically recommend adjusting the {priority_level_num}.",
+        "Produce a report detailing all orchestration actions executed by {iac_tool} for the {network_function}. The report must verify that every change was authorized and logged. Confirm that any failed deployment correctly triggered the configured {rollback_strategy}.",
+        "Create a forecast report predicting potential {backhaul_capacity} bottlenecks in the {location_category}. Use {predictive_analytics} to model traffic growth over the next quarter. If a future bottleneck is identified, evaluate the effectiveness of {load_balancing} as a proactive mitigation strategy.",
+        "Compile a monthly reliability report for the {architecture}. The report must feature {mtbf} and {mttr} statistics for critical network functions. Include a summary of all {circuit_breaker} events and their resulting impact on the overall {availability_req}.",
+        "Provide a report on the effectiveness of our current {load_balancing} algorithm. The report must show the distribution of traffic and resource load across all active instances. Correlate this with {latency_req} metrics to ensure the algorithm is not introducing unforeseen delays under peak load.",
+        "Generate a data privacy compliance report. Confirm that {location_privacy} is enabled for all relevant services as per policy. The report must also verify that the {retention_period} for user-specific data complies with regulatory requirements.",
+        "Develop a report that uses {predictive_analytics} to identify subscribers experiencing degraded Quality of Experience. The model should analyze {packet_error_rate} and {throughput_req} deviations. If a group of users is affected, escalate to {escalation_l1} with a list of potential causes.",
+        "Generate a report on the efficiency of the {workflow_engine} running {workflow_version}. The report should focus on {execution_timeout} successes and failures. Include the average time-to-execute for common orchestration tasks like {horizontal_scaling}.",
+        "Create a report analyzing the end-to-end latency for the {slice_category}. Use data from {distributed_tracing} to break down latency contributions from different network segments. This report must verify compliance with the overall {latency_req} defined in the {sla_type}.",
+        "Audit the {affinity} and {anti_affinity} rules for all deployed instances of {network_function}. The report must confirm that these rules are correctly enforced by the orchestrator to ensure high availability. Flag any violations found during the audit period.",
+        "Initiate a report to determine the optimal {sampling_rate} and {aggregation_interval} for monitoring the {network_function}. Use an {optimization_algorithm} to balance monitoring granularity against resource overhead. The goal is to detect anomalies without overburdening the system.",
+        "Provide a high-level executive summary of network slice performance for the {slice_category}. The report should visualize key metrics like {availability_req} and {reliability_req} against targets. Include a section on major incidents and their resolution times.",
+        "Report on the correlation between {backhaul_capacity} and the {maximum_bitrate} achievable in the {location_category}. If {backhaul_capacity} is found to be a limiting factor, append a simulation of the expected performance gains from a potential capacity upgrade.",
+        "Generate a report to verify that all VNF/CNF images currently in use match their expected and approved versions. This report must cross-reference the running instances against the management system's catalog. Include a check on {integrity} hashes where available.",
+        "Use {ai_prediction_model} to report on the likelihood of SLA violations for {sla_type} in the next 7 days. The prediction should be based on current trends in resource usage and network congestion. If the likelihood exceeds 75%, trigger a proactive resource {vertical_scaling} recommendation.",
+        "Request a report detailing all manual interventions performed on the network infrastructure over the past quarter. The report should categorize these interventions and identify prime candidates for future automation using {iac_tool}.",
+        "Create a compliance report that confirms all network traffic within the {slice_category} is properly isolated from other slices. The report should include verification of network policies, VLANs, and routing tables to ensure separation.",
+        "Report on the primary causes of {mttr} for the {network_function}. Use {anomaly_detection} on logs and metrics to correlate failures with specific events (e.g., software updates, traffic spikes). Suggest improvements to the {rollback_strategy} based on these findings.",
+        "Produce a report summarizing all active QoS flows with a {priority_level_num} of 1. For each flow, list the associated service and its currently configured {guaranteed_bitrate}.",
+        "I need a report that shows the performance of our {mesh_technology}. Please include metrics on path selection latency and failover time. How does this performance map to our {reliability_req} target of 99.999%?",
+        "Generate an access control report for the orchestration platform. List all users and systems with administrative privileges. The report must verify that the principle of least privilege is being followed, as required by our {zero_trust_identity} policy.",
+        "Initiate a report to find silent failures within the {architecture}. Use {predictive_analytics} to analyze subtle performance degradations that do not trigger standard alarms but could indicate an impending {mtbf} event. Escalate these findings to {escalation_l3}.",
+        "Compile a capacity planning report for {storage_type} resources. Project the storage needs for the next 12 months based on current data growth trends. The report should factor in the {retention_period} for all collected monitoring and log data.",
+        "Create a report analyzing the efficiency of the {auto_scaling_policy}. The report should answer: Are we scaling out too aggressively or too late? Compare the timing of {horizontal_scaling} events with the actual load on {cpu_cores}.",
+        "Document all instances where {preemption_capability} was used to de-allocate resources from lower-priority flows. The report must verify that this action was justified and followed the predefined policies for the {slice_category}.",
+        "Run a report using the {optimization_algorithm} to identify underutilized resources in our cloud-native environment. The report should suggest specific {vertical_scaling} actions (e.g., reducing {memory_size}) for idle instances of {network_function} to save costs.",
+        "Generate a simple daily status report for the {network_function}. It should contain only three key metrics: {availability_req} percentage for the day, number of active instances, and total throughput processed.",
+        "I need a detailed report on {jitter_tolerance} performance for real-time services in the {slice_category}. If jitter exceeds the SLA threshold, the report must include a snapshot of the network state captured via {distributed_tracing} at the time of the event.",
+        "Produce a report verifying that all deployed network functions are running on infrastructure that meets the {architecture} specifications (e.g., CPU instruction sets). Flag any function running on non-compliant or deprecated hardware.",
+        "Create a report that predicts the impact of a potential {backhaul_capacity} failure at {location_category}. Use the {ai_prediction_model} to simulate the re-routing of traffic and forecast the resulting increase in {latency_req} for affected services.",
+        "Generate an orchestration workflow failure report for {workflow_id} ({workflow_version}). For each failure, list the step that failed, the error message, and whether the {rollback_strategy} was executed successfully.",
+        "Assess the {packet_error_rate} for the {slice_category}. If the rate is above the acceptable threshold, the report must include an analysis correlating the errors with specific network segments or functions.",
+        "Please provide a report confirming that all management interfaces for the {network_function} are secured using the approved {auth_method} and {encryption} protocols. Any exceptions must be highlighted.",
+        "Use {predictive_analytics} to report on the \"health score\" of each network slice. The score should be a composite metric derived from {availability_req}, {latency_req}, {throughput_req}, and user-reported issues, indicating overall service quality.",
+        "I need a report listing all configured {sla_type} contracts and their primary parameters ({guaranteed_bitrate}, {latency_req}).",
+        "Can you generate a report showing the impact of {horizontal_scaling} events on {memory_type} consumption patterns? I want to see if scaling out causes unexpected memory pressure on the underlying hypervisors.",
+        "Run a report to verify that the {anti_affinity} rules are preventing critical and redundant instances of {network_function} from being placed on the same physical host.",
+        "Generate a report identifying the root cause of intermittent {jitter_tolerance} violations. Use {distributed_tracing} combined with {anomaly_detection} to find correlations that are not obvious from standard metrics.",
+        "Provide a summary report of all {circuit_breaker} trips in the last 7 days. Include the duration of the open state and the service that was protected.",
+        "Report on the end-to-end {packet_delay} for {flow_id}. The report must use an {averaging_window} of 5 minutes and highlight any spikes that exceed the {sla_type} definition.",
+        "I need a report that demonstrates compliance with our data {integrity} policies. The report should show regular checks have been performed on stored data and configuration files for {network_function}."
+    )
+})
+
+# Candidate templates for each intent type
+INTENT_TYPE_TEMPLATES = MappingProxyType({
+    'Deployment Intent': INTENT_TEMPLATES["Deployment"],
+    'Modification Intent': INTENT_TEMPLATES["Modification"],
+    'Performance Assurance Intent': INTENT_TEMPLATES["Performance Assurance"],
+    'Intent Report Request': INTENT_TEMPLATES["Report Request"],
+    'Intent Feasibility Check': INTENT_TEMPLATES["Feasibility Check"],
+    'Regular Notification Request': INTENT_TEMPLATES["Regular Notification"]
+})
+
+# Pre-split the registry templates once at import, so rendering never parses
+for _templates in INTENT_TEMPLATES.values():
+    for _template in _templates:
+        _compile_template(_template)
+del _templates, _template
+
+
 class AdvancedTemplateEngine:
     """
     Enhanced template engine with comprehensive parameter utilization.
@@ -248,316 +1298,90 @@ class AdvancedTemplateEngine:
     deployment requirements.
     """
     
-    def __init__(self):
+    # Parameter placeholders: placeholder -> (extraction category, parameter key, default).
+    # Derived from PARAMETER_PATHS so defaults live in a single table; keys are
+    # interned so per-call dict updates hash and compare by identity. The QoS
+    # priority level is exposed as {priority_level_num} because {priority_level}
+    # names the context priority, and cloud providers are rendered separately.
+    _PARAMETER_PLACEHOLDERS = {
+        sys.intern('{priority_level_num}' if key == 'priority_level' else f'{{{key}}}'): (category, key, default)
+        for category, specs in PARAMETER_PATHS.items()
+        for key, _, default in specs
+        if key != 'cloud_providers'
+    }
+    
+    # Context-derived placeholders and how to compute each from a context
+    _CONTEXT_RESOLVERS = {
+        sys.intern('{intent_type}'): lambda context: context.intent_type.lower().replace('_', ' '),
+        sys.intern('{complexity_level}'): lambda context: _get_complexity_description(context.complexity),
+        sys.intern('{priority_level}'): lambda context: context.priority.lower(),
+        sys.intern('{slice_category}'): lambda context: _get_slice_description(context.slice_category),
+        sys.intern('{location_category}'): lambda context: _get_location_description(context.location_key)
+    }
+    _CLOUD_PROVIDERS_PLACEHOLDER = sys.intern('{cloud_providers}')
+    
+    # Placeholders whose rendered text depends only on the extraction, so it
+    # can be kept on the extraction and reused across contexts
+    _EXTRACTION_PLACEHOLDERS = frozenset(_PARAMETER_PLACEHOLDERS) | {_CLOUD_PROVIDERS_PLACEHOLDER}
+    
+    # Fallback description formats, rendered by _generate_fallback_description
+    _FALLBACK_FORMATS = (
+        "Execute {complexity_level} {intent_type} for {slice_category} slice with {priority} priority in {location_category} environment.",
+        "Deploy advanced {slice_category} network service with comprehensive orchestration and monitoring capabilities.",
+        "Implement {priority} priority {intent_type} with intelligent resource allocation and security controls.",
+        "Provision {complexity_level} network infrastructure supporting {slice_category} requirements with automated lifecycle management."
+    )
+    
+    def __init__(self, rng: Optional[random.Random] = None):
         """
         Initialize the template engine with all template categories.
         
         This initialization process sets up all template collections,
         parameter extraction patterns, and scoring mechanisms needed
         for intelligent template generation.
+        
+        Args:
+            rng: Random generator used for template and fallback selection.
+                Defaults to the global ``random`` module so that seeding it
+                (as main.py does) keeps runs reproducible; pass a dedicated
+                ``random.Random`` to avoid sharing state across threads.
         """
         logger.info("Initializing Advanced Template Engine")
         
-        templates = {
-            "Deployment": [
-                "This intent specifies the instantiation of a User Plane Function (UPF) for a {slice_category} network slice, as per the architecture defined in 3GPP TS 23.501 §6.2.2. The {nfvo_id} orchestrator must deploy the {network_function} VNF from provider {vnf_provider} version {vnf_version} using the {deployment_flavor} that allocates {cpu_cores} {cpu_arch} cores and {memory_size} of {memory_type} memory. The system must adhere to an {auto_scaling_policy} to dynamically scale between {min_instances} and {max_instances} based on real-time throughput demands (TS 28.531 §5.4.4). In case of instantiation failure within the {instantiation_timeout} period, a {rollback_strategy} must be triggered automatically.",
-                "Execute orchestration workflow {workflow_id} via {nfvo_id} to deploy the {network_function} across multiple VIMs, including {vim_id}. This cross-VIM deployment is designed to achieve high availability and load distribution as per ETSI NFV MANO principles referenced in 3GPP TS 28.530 §4.2. The workflow must ensure that network connectivity between VNF components has a maximum latency of {backhaul_latency}.",
-                "This intent is to trigger an automated update of the {network_function} from version {vnf_version} to a newer version using the {workflow_engine}. The process must follow a canary deployment model, initially directing 10% of traffic to the new version. The {auto_scaling_policy} must be temporarily adjusted during the upgrade to prevent resource conflicts. A full {rollback_strategy} to the previous version is required if the packet error rate exceeds {packet_error_rate}.",
-                "Deploy a virtualized Evolved Packet Core (vEPC) for an LTE private network, ensuring the MME and SGW components have a strong {affinity} policy. This co-location is intended to minimize control plane latency, aligning with performance goals in TS 23.401. Resources must be provisioned on the {orchestration_platform} with {min_instances} of each component, each having {cpu_cores} cores and {memory_size} memory.",
-                "Instantiate the {network_function} with a security-hardened profile. The deployment must enforce {encryption} with {key_length} bits for all external interfaces and use {auth_method} for management access. As per security assurance specifications (TS 33.501 §6.1), the VNF image must be scanned for vulnerabilities before deployment is allowed to proceed. The {zero_trust_identity} framework must be applied to all service-to-service communication.",
-                "Deploy a UPF at {location_category} edge data centers to support an ultra-reliable low-latency communications (uRLLC) slice for V2X services (3GPP TS 23.288 §5.2). This deployment must guarantee a user plane latency not exceeding {latency_req} (e.g., 1ms) and a {reliability_req} of 99.999%. The RAN configuration must use {high_band} spectrum with {beamforming} enabled to achieve this performance. A {backhaul_type} of dedicated fiber with a capacity of {backhaul_capacity} is mandated.",
-                "Instantiate a Multi-access Edge Computing (MEC) application, {network_function}, on the {orchestration_platform} located at the network edge. The intent is to process video streams locally, requiring {cpu_cores} {cpu_arch} cores with GPU acceleration and a {packet_delay} of less than 5ms. The SMF must be configured to steer traffic for {flow_id} to this local UPF, as per TS 23.501 §5.13 on edge computing support.",
-                "This is a policy-driven intent. If the end-to-end {latency_req} for the {slice_category} slice exceeds 10ms for more than the {averaging_window}, the {nfvo_id} must automatically trigger workflow {workflow_id}. This workflow will instantiate a new instance of {network_function} at a {location_category} edge site and update routing rules to minimize latency, reflecting the dynamic nature of edge deployments (TS 28.541 §A.15).",
-                "For tenant {tenant_id}, configure a local data breakout at the enterprise edge. Deploy a lightweight UPF and an enterprise firewall VNF ({network_function}) at the customer premises. This setup requires minimal resources: {cpu_cores} cores and {memory_size} RAM. The intent ensures that enterprise traffic does not traverse the core network, enhancing {location_privacy} and reducing {backhaul_latency}.",
-                "To support an augmented reality service, allocate compute resources at the far edge with an {adaptation_speed} of under 50ms. The {vim_id} must provision {cpu_cores} cores and {memory_size} RAM on demand. The QoS profile must enforce a strict {jitter_tolerance} of 1ms to prevent disruptions in the user experience, as latency spikes are critical for this {slice_category}.",
-                "Deploy a Security Edge Protection Proxy (SEPP) at the {location_category} edge to secure roaming interconnects locally (TS 33.501 §13). The SEPP VNF must enforce {encryption} using {kdf} for key derivation and mandate {integrity} protection for all signaling. This localized security enforcement reduces latency compared to routing traffic to a central security gateway.",
-                "Given the limited resources at {location_category} edge sites, deploy the {network_function} using a containerized flavor on {container_runtime}. The deployment must prioritize resource efficiency, utilizing {cpu_cores} ARM-based {cpu_arch} cores. If memory utilization exceeds 85%, the {optimization_algorithm} should be triggered to consolidate workloads without violating the {sla_type} agreement.",
-                "Configure the RAN with a specific {sectorization} strategy to maximize coverage and capacity at the {location_category} event venue. Use {low_band} for coverage and {mid_band} for capacity, managed by a SON algorithm. The goal is to support {connection_density} while ensuring {availability_req} for all users.",
-                "Upon detection of a large public event (e.g., via an external API call), the {nfvo_id} must automatically execute workflow {workflow_id} to deploy a mobile broadband capacity enhancement solution at the nearest {location_category} edge. This includes instantiating a local UPF and DU/CU resources, pre-configured to handle a surge in {connection_density}.",
-                "Deploy the {network_function} as a collection of cloud-native functions (CNFs) on the {orchestration_platform} Kubernetes cluster, using {container_runtime}. Service-to-service communication must be managed by a {mesh_technology} like Istio, enforcing mTLS for security. This aligns with the 5G service-based architecture (SBA) principles outlined in TS 23.501 §4.2.6.",
-                "The desired state of the {network_function} CNF is defined using the {iac_tool} (e.g., Helm, Kustomize) in a Git repository. The orchestration platform must continuously reconcile the running state with the Git repository, achieving a Level {automation_level} of automation. Any configuration drift must trigger an alert via {notification_channels}.",
-                "Enable {distributed_tracing} across all microservices comprising the {network_function}. Traces must be collected and forwarded to a central observability platform to diagnose performance bottlenecks and ensure the end-to-end {latency_req} is met. This is crucial for debugging complex interactions in an SBA environment (TS 28.532 §A.5).",
-                "Enforce a {zero_trust_identity} security model for all CNFs within the {tenant_id} namespace. Each microservice must present a valid SPIFFE/SPIRE identity token for any communication. Network policies must be configured to deny all traffic by default, only allowing explicit connections defined for the service-based interface.",
-                "Upon a new commit to the source code repository for {network_function}, the CI/CD pipeline, managed by {workflow_engine}, must automatically spin up an ephemeral test environment. This environment will run a suite of conformance and load tests, ensuring the new CNF version meets the {throughput_req} and {reliability_req} before being promoted.",
-                "Deploy the UDM (Unified Data Management) as a stateful CNF. The deployment must utilize a distributed {storage_type} solution (e.g., Ceph) with a capacity of {storage_capacity} to store subscriber data persistently, as per data storage principles in TS 23.501 §6.2.5. The storage solution must provide {redundancy} to prevent data loss.",
-                "Orchestrate an end-to-end network slice for tenant {tenant_id} with {correlation_id}. The {nfvo_id} will coordinate with the RAN controller, transport SDN controller, and core {vim_id}. The intent is to deliver a {sla_type} service with a guaranteed {throughput_req} from the UE to the data network, as envisioned by the network slice management functions in TS 28.541 §5.2.",
-                "Implement a {hybrid_strategy} for the {slice_category} eMBB slice. The baseline capacity for the UPF will be hosted on the on-premise {vim_id}. If traffic demand exceeds 80% of the on-premise capacity, the {nfvo_id} must burst additional UPF instances onto {cloud_providers} (e.g., AWS, Azure) to handle the overflow.",
-                "Apply a uniform security policy across the on-premise private cloud and the public {cloud_providers}. This includes enforcing {encryption} with a consistent {key_rotation} policy of 24 hours and using {auth_method} for all management plane access, regardless of where the {network_function} is hosted.",
-                "Ensure that the 5QI (5G QoS Identifier) value {priority_level_num} in the 5G core is correctly mapped to the corresponding QoS markings (e.g., DSCP) in the transport network. This cross-domain mapping is critical to maintain the end-to-end {packet_delay} and {packet_error_rate} characteristics defined in TS 23.501 §5.7.",
-                "Implement a cross-domain monitoring solution that uses {correlation_id} to track service performance from RAN to Core. If the {sla_type} is breached, the system must perform automated root cause analysis to identify if the fault lies in the radio, transport, or core domain and trigger the appropriate {escalation_l1} procedure.",
-                "The end-to-end instantiation of the service for {tenant_id}, including resource provisioning in the RAN, transport path setup, and core NF deployment, must complete within the {instantiation_timeout}. If it fails, a full {rollback_strategy} across all domains must be executed by {nfvo_id}.",
-                "Utilize the {ai_prediction_model} to forecast traffic demand for the {slice_category} slice based on historical data collected by NWDAF (TS 23.501 §5.27). Proactively execute a {horizontal_scaling} operation on the UPF 30 minutes before the predicted traffic peak to ensure the {guaranteed_bitrate} is always available and prevent congestion. The model must achieve an {accuracy_level} of 95%.",
-                "Continuously monitor QoS parameters such as {packet_delay} and {jitter_tolerance} using an {anomaly_detection} algorithm. If the AI model detects a deviation from the established baseline that could lead to an SLA violation, it must automatically create a trouble ticket and notify the {escalation_l1} team via {notification_channels} (TS 28.533 §5.2).",
-                "Implement a closed-loop automation system where the NWDAF provides analytics to the PCF and NSSF. If the AI model ({optimization_algorithm}) determines that network resources for a slice are over-provisioned, it will instruct the {nfvo_id} to downscale the resources ({vertical_scaling} or {horizontal_scaling}) without impacting the {sla_type} agreement, thus improving resource efficiency (TS 28.541 §6.4).",
-                "Using {predictive_analytics}, monitor the health metrics of the {network_function}. The {ai_prediction_model} will predict potential failures based on subtle changes in CPU, memory, and network I/O patterns. Upon predicting a failure with {accuracy_level} confidence, the system will automatically trigger a healing workflow to migrate services to a healthy instance, aiming to improve {mtbf}.",
-                "Leverage an AI model to determine the optimal placement of the {network_function}. The model, {optimization_algorithm}, will consider multiple factors including {latency_requirement}, compute resource availability across different {location_category} sites, and energy costs to select the most efficient VIM ({vim_id}) for instantiation.",
-                "Deploy an AI-based security system that analyzes signaling traffic (e.g., at the SEPP) for anomalous patterns indicative of a security threat. The {anomaly_detection} model is trained to identify zero-day attacks that signature-based systems would miss. Upon detection, it will automatically apply a firewall rule to block the malicious source.",
-                "This intent enables an AI-driven QoS adaptation mechanism. If the {predictive_analytics} model forecasts network congestion, the PCF will dynamically adjust the QoS parameters for non-critical flows, such as lowering the {maximum_bitrate} for {flow_id}, to protect the {guaranteed_bitrate} of high-priority services like {slice_category}.",
-                "Run a weekly {ai_prediction_model} to forecast long-term resource requirements ({cpu_cores}, {memory_size}, {storage_capacity}) for the next quarter. This forecast, based on NWDAF analytics, will be used for capacity planning to ensure that the infrastructure can meet future {throughput_req} and {connection_density} growth.",
-                "In the event of a service degradation alarm, trigger an ML-based root cause analysis workflow. The {optimization_algo} will analyze logs and metrics from multiple domains (collected with {sampling_rate}) to pinpoint the root cause, distinguishing between RAN, transport, or core issues with a specified {accuracy_level}. The finding is then routed to the correct {escalation_l2} team, drastically reducing the {mttr}."
-            ] , 
-            
-            "Feasibility Check": [
-                "Evaluate the end-to-end feasibility of launching a {service_level} service for {tenant_id} using the {network_function}. Assess if the combined requirements for {guaranteed_bitrate}, {latency_requirement}, and {availability_req} can be met concurrently on the target {architecture}. This check is a prerequisite for slice allocation as per 3GPP TS 28.541 §5.3.1. Confirm that the {orchestration_platform} is capable of deploying this service within the {instantiation_timeout}. If any core KPI is unachievable, the intent must be flagged as infeasible.",
-                "Determine if a {slice_category} slice is feasible in the target deployment area. Verify that the underlying infrastructure can support the expected {connection_density} and the associated signaling load, a key consideration for slice design mentioned in 3GPP TS 23.501 §5.15.2.2. Can the specified {backhaul_type} support the aggregate bandwidth demands? The intent should be rejected if the resource pool is insufficient for even the {min_instances} of the required network functions.",
-                "Assess the feasibility of meeting a {sla_type} agreement for the {vnf_provider}'s {network_function}. Can the system guarantee {reliability_req}% reliability and {availability_req}% availability simultaneously? This check relates to the service requirements that form the basis for a Network Slice as a Service (NSaaS) model, conceptually covered in 3GPP TS 28.530 §4.3.5. Evaluate whether the {rollback_on_failure} policy can be executed without violating the SLA's Mean Time to Repair (MTTR) constraints. If not, propose an alternative {rollback_strategy}.",
-                "Verify that the infrastructure is ready to onboard {tenant_id} with their requested {service_level}. Check for sufficient multi-tenancy support in the {orchestration_platform}, as implied by the management framework in 3GPP TS 28.530 §4.2. Is it possible to enforce strict resource isolation using the current {hypervisor} or {container_runtime}? Confirm that the {auth_method} meets the tenant's security requirements. The intent is infeasible if tenant-specific policies cannot be enforced.",
-                "Evaluate the feasibility of a {hybrid_strategy} deployment that integrates on-premise resources with {cloud_providers}. Can the proposed {architecture} maintain the required {latency_requirement} for cross-domain traffic? This feasibility check pertains to orchestrating services across multiple administrative domains, a concept discussed in 3GPP TS 28.531 §5.5. Assess if the {workflow_engine} can manage dependencies between cloud-native and legacy network functions. The plan is not viable if a unified {distributed_tracing} system cannot be implemented.",
-                "Confirm the technical feasibility of a URLLC service by assessing if a {latency_requirement} (e.g., <1ms) and {reliability_req} (e.g., 99.999%) can be co-guaranteed. This aligns with the URLLC requirements specified in 3GPP TS 22.261 §6.5. Is the selected {cpu_arch} with {cpu_frequency} capable of processing data within the allocated time budget? Verify that the {backhaul_latency} does not exceed its allocated portion of the end-to-end latency budget. If predictive analytics from {ai_prediction_model} indicates a high probability of jitter, flag the intent as high-risk.",
-                "Validate if a {guaranteed_bitrate} for an eMBB {slice_category} can be sustained under a {connection_density} of active users. This check ensures the QoS flow for GFBR can be supported, as defined in 3GPP TS 23.501 §5.7.3. Assess if the {storage_type} (e.g., NVMe) has sufficient I/O throughput to avoid bottlenecks for content caching NFs. The intent is not feasible if the {load_balancing} strategy cannot distribute traffic effectively to maintain the bitrate for all users.",
-                "Assess the feasibility of enforcing the required security context for the {network_function}. Can the system support the specified {encryption} and {auth_method} algorithms for all control and user plane traffic? This validation is based on the security architecture outlined in 3GPP TS 33.501 §6. Furthermore, is it technically possible to implement a {zero_trust_identity} policy by validating {device_trust} at every connection attempt? The deployment is infeasible if the security gateways lack the processing power to handle the cryptographic load without impacting latency.",
-                "Evaluate the feasibility of configuring the Radio Access Network for a specific {slice_category}. Does the RAN support resource partitioning to provide a dedicated {guaranteed_bitrate}? This aligns with the RAN-related aspects of network slicing detailed in 3GPP TS 38.300 §16. Can the specified {backhaul_capacity} handle the traffic from the cell sites for this slice in addition to others? The configuration is infeasible if the RAN scheduler cannot prioritize traffic according to the slice requirements.",
-                "Determine the technical feasibility of a V2X {slice_category} service. Can the network achieve the required end-to-end {latency_requirement} for safety-critical messages? This is a core requirement for V2X services as per 3GPP TS 23.287 §5.2. Verify that edge nodes have sufficient {cpu_cores} to run the V2X application server locally. Is it possible to guarantee resource availability and preemption for V2X traffic over other services? If not, the intent is technically infeasible.",
-                "Check for sufficient compute resources at the edge for deploying {network_function}. Are there {cpu_cores} of type {cpu_arch} and {memory_size} of {memory_type} available? This aligns with the NFVI resource management principles in 3GPP TS 28.541 §A.4. Assess if the existing {storage_capacity} of {storage_type} is adequate. The intent must be rejected if the {latency_requirement} cannot be met due to resource oversubscription at the edge location.",
-                "Evaluate if the existing {backhaul_type} has the required {backhaul_capacity} and {backhaul_latency} to support a new eMBB {slice_category}. This is a critical prerequisite for fulfilling the PDU Session QoS, as described in 3GPP TS 23.502 §4.3.2.2. Does the backhaul have QoS marking and queuing capabilities? If the backhaul is shared, confirm that this new slice will not degrade the performance of existing high-priority services.",
-                "Assess if the available {storage_type} provides sufficient performance for the {network_function}. Is the IOPS (Input/Output Operations Per Second) rating of the {storage_capacity} adequate for the expected transaction load? This detailed resource check is part of the VNF Descriptor (VNFD) information model referenced in 3GPP TS 28.531 §6.3.2. For a stateful application, verify that the storage system's reliability meets the service's {reliability_req}. The intent is infeasible if storage latency contributes significantly to exceeding the overall {latency_requirement}.",
-                "Verify that there are enough resources to support the {auto_scaling_policy} for {network_function}, from {min_instances} to {max_instances}. This preemptive check is crucial for the LCM scaling operations defined in 3GPP TS 28.531 §8.2. Are there enough floating CPU and memory resources in the cluster to accommodate {max_instances} during a peak event? Assess if the power and cooling systems at the data center can handle the maximum load. The scaling policy is infeasible if resource reservation cannot be guaranteed.",
-                "Determine if the proposed {affinity} and {anti_affinity} rules for the {network_function} components are satisfiable on the current infrastructure. This is a key aspect of VNF placement described in management standards like 3GPP TS 28.531 §6.2. For example, can two VNF components be placed on separate physical hosts to meet the {anti_affinity} rule for high availability? The intent is infeasible if the number of available compute hosts or racks is insufficient to satisfy the placement constraints.",
-                "Check if the selected {orchestration_platform} is compatible with the {workflow_version} required to deploy the {network_function} from {vnf_provider}. This verification aligns with the LCM orchestration principles in 3GPP TS 28.531 §6.2.3. Can the orchestrator communicate with the target {container_runtime} or {hypervisor}? The deployment is infeasible if the required management APIs are not exposed by the underlying virtualization platform.",
-                "Assess the viability of the proposed {rollback_strategy}. Can the system state be captured and restored within the service's MTTR target if {rollback_on_failure} is triggered? The ability to manage and terminate NFs is a core LCM function specified in 3GPP TS 28.531 §6.2.5. For a stateful {network_function}, verify that a data backup and restore mechanism exists and is reliable. The strategy is infeasible if a rollback would lead to data inconsistency or extended downtime.",
-                "Determine if the {network_function} can be reliably deployed within the specified {instantiation_timeout}. This check validates the performance of the entire orchestration chain, a key operational aspect of the LCM process from 3GPP TS 28.531 §6.2.3. Analyze historical deployment times for similar VNFs. Does the image download time from the registry plus the boot time fall comfortably within the timeout period? If not, the intent is at high risk of failure.",
-                "Verify that the designated {container_runtime} (e.g., containerd, CRI-O) supports all the features required by the cloud-native {network_function}. Does it support the necessary networking CNI plugins and storage CSI drivers? This detailed check is an implementation aspect of deploying VNFs on a container infrastructure, as abstracted in 3GPP TS 28.541 §A.4. Is the runtime version compatible with the {orchestration_platform} (e.g., Kubernetes)? The deployment is infeasible if the runtime cannot enforce the required CPU/memory limits.",
-                "Assess the feasibility of integrating the {network_function} into the existing {mesh_technology}. Can the service mesh sidecar be injected without compromising the VNF's performance or stability? This is an advanced deployment scenario for cloud-native functions, whose management aligns with the principles of 3GPP TS 28.531. Does the mesh support the required traffic routing, {load_balancing}, and {circuit_breaker} patterns? The integration is not feasible if the mesh's MTLS encryption introduces latency that violates the {latency_requirement}.",
-                "Evaluate if the selected {ai_prediction_model} has a sufficient {accuracy_level} to be used for a proactive {auto_scaling_policy}. This is a forward-looking application of the scaling management functions in 3GPP TS 28.531 §8.2. Will the model's predictions allow for resource allocation with enough lead time to meet the {adaptation_speed}? The model is considered infeasible if its false positive rate for scaling predictions would lead to excessive resource costs.",
-                "Assess if the {optimization_algorithm} can dynamically allocate resources to meet the {sla_type} more efficiently than static allocation. Can this algorithm reduce the required {cpu_cores} or {memory_size} while still guaranteeing the {latency_requirement}? This aligns with the goal of efficient resource utilization in NFV, a core principle behind 3GPP TS 28.530. The algorithm is not feasible if its computational overhead negates the resource savings.",
-                "Determine the feasibility of monitoring a {slice_category} slice using an AI-based anomaly detection model. Can the model process telemetry data at the required rate to detect deviations in {guaranteed_bitrate} or {latency_requirement} in near real-time? This relates to the performance monitoring data that can be collected for a slice, as mentioned in 3GPP TS 28.552 §5.2. The approach is infeasible if the model cannot distinguish between normal traffic fluctuations and genuine service degradations.",
-                "Evaluate if the {ai_prediction_model} can be used to preemptively identify security threats to the {network_function}. Does the model have access to the necessary logs and network flows to achieve a high {accuracy_level} in threat detection? This is an advanced security assurance mechanism that builds upon the foundational security architecture of 3GPP TS 33.501. The intent is infeasible if the AI model's response time is slower than the speed of common automated attacks.",
-                "Assess the feasibility of the proposed {edge_strategy} which uses an {ai_prediction_model} to decide traffic offload to {cloud_providers}. Can the model make decisions fast enough to maintain the session continuity and {latency_requirement} for the user? This complex orchestration is a future-facing implementation of the principles in 3GPP TS 28.530. The strategy is infeasible if the cost of data transfer to the cloud for analysis outweighs the benefits of offloading the compute.",
-                "Validate if the end-to-end {latency_requirement} can be met for a service traversing the core, transport, and RAN domains. Can each domain commit to its allocated portion of the latency budget? This is a fundamental check for services defined in 3GPP TS 23.501 §5.7. The intent is infeasible if the {backhaul_latency} alone consumes an unacceptable percentage of the total budget. Assess if distributed_tracing is possible across all domains to monitor compliance.",
-                "Assess the feasibility of a service chain composing multiple VNFs from different {vnf_provider}s. Can the {orchestration_platform} manage the lifecycle dependencies and health checks for the entire chain? This complex orchestration is governed by the principles of Network Service (NS) management in 3GPP TS 28.531 §6. The chain is infeasible if the cumulative resource needs ({cpu_cores}, {memory_size}) of all VNFs exceed the capacity of a single availability zone, violating the {affinity} requirements.",
-                "Confirm that the proposed deployment of {network_function} for {tenant_id} can meet regulatory requirements such as Lawful Intercept (LI). Are the necessary interfaces and probes available in the {architecture}? The architectural requirements for LI are specified in 3GPP TS 33.126. The deployment is infeasible if enabling LI functionality compromises the {guaranteed_bitrate} or introduces significant latency.",
-                "Validate the technical feasibility of an mMTC {slice_category} service. Can the core network's AMF and SMF handle the projected {connection_density} without performance degradation? This is a key capability of the 5G core as defined in 3GPP TS 23.501 §5.15.4. Assess if the {storage_type} for the UDM can handle the high rate of registration and authentication requests. The intent fails if the signaling storm from massive device connections cannot be mitigated.",
-                "Determine if Reflective QoS (RQI) can be supported for the intended service on the {network_function} (UPF). This capability is defined in 3GPP TS 23.501 §5.7.5. Can the UPF derive and apply QoS rules for uplink traffic based on the downlink packets? The feature is infeasible if the {cpu_arch} of the UPF cannot perform the required deep packet inspection and rule correlation at line rate without violating the {latency_requirement}.",
-                "Assess the feasibility of implementing SUPI concealment for enhanced user privacy. Are the UDM and UDR in the network configured to support this feature as per 3GPP TS 33.501 §6.12? Can the home network generate and manage public/private key pairs for all subscribers? The intent is infeasible if the {auth_method} used by legacy devices in the network is incompatible with the SUPI concealment mechanism.",
-                "For a high-performance {network_function} like a UPF, assess the feasibility of applying CPU pinning and ensuring NUMA (Non-Uniform Memory Access) awareness. Does the {hypervisor} and {orchestration_platform} expose the controls needed for such fine-grained resource allocation? This is an advanced implementation of the resource management concepts in 3GPP TS 28.541 §A.4. The deployment is infeasible if NUMA node locality cannot be guaranteed, as this would violate the {latency_requirement}.",
-                "Evaluate if there are sufficient resources across multiple clusters to support a geographically redundant deployment of the {network_function}. Can {min_instances} be deployed in at least two separate availability zones to satisfy the {availability_req}? This relates to the high-level management goal of ensuring service continuity (3GPP TS 28.530). The intent is infeasible if the inter-cluster {backhaul_latency} is too high for state replication.",
-                "Assess the feasibility of managing the {network_function} configuration using a GitOps workflow. Is the {orchestration_platform} (e.g., Kubernetes) integrated with a Git repository and a reconciliation agent? This is a modern, declarative approach to the configuration management aspects mentioned in 3GPP TS 28.532. The approach is not viable if the {vnf_provider} packages their application in a format that cannot be managed declaratively.",
-                "Can the {network_function} be updated to a new version in-place without requiring a full re-instantiation? This feasibility check pertains to the VNF software modification LCM procedure in 3GPP TS 28.531 §8.5. Does the {vnf_provider} support rolling updates? The intent is infeasible if the update process would violate the {availability_req} for the service.",
-                "Evaluate if a service chain can be deployed when its constituent network functions are managed by different orchestrators (e.g., a core NF on OpenStack and an edge NF on Kubernetes). Can a higher-level service orchestrator manage the end-to-end {workflow_version}? This scenario addresses the challenge of multi-domain orchestration described in 3GPP TS 28.530 §4.3. The deployment is infeasible if there is no standardized API or integration layer between the orchestration systems.",
-                "Assess the feasibility of creating a digital twin of the {slice_category} slice to test the impact of the {optimization_algorithm} before live deployment. Does the simulation environment have an accurate model of the network {architecture} and resources? This is an advanced assurance technique beyond standard monitoring (3GPP TS 28.552). The digital twin is not viable if it cannot predict the effect of configuration changes on {guaranteed_bitrate} with at least {accuracy_level}% accuracy.",
-                "Determine if an AI model can be used for automated root cause analysis (RCA) when a {sla_type} violation occurs. Does the model have access to the logs and network flows to identify the root cause faster than a human operator's Mean Time to Identify (MTTI)? This is an AI-powered enhancement to the fault management capabilities outlined in 3GPP TS 28.532 §4.8. The AI-RCA is infeasible if it cannot identify the root cause faster than a human operator's Mean Time to Identify (MTTI).",
-                "Evaluate the feasibility of using a reinforcement learning (RL) model as the {optimization_algorithm} for real-time radio resource management. Can the RL agent interface with the RAN scheduler to adjust parameters and improve spectral efficiency? This is a highly advanced application of the RAN management principles in 3GPP TS 38.300. The intent is infeasible if the agent's decision loop ({adaptation_speed}) is slower than the channel state changes.",
-                "Check if the {ai_prediction_model} can be used for predictive maintenance of the underlying physical or virtual infrastructure. Can it analyze hardware telemetry or hypervisor logs to predict failures before they impact the {availability_req}? This AI-driven approach enhances the fault management capabilities described in 3GPP TS 28.532. The model is not feasible if its predictions are not actionable or do not provide enough lead time for maintenance.",
-                "Evaluate the general feasibility of a {hybrid_strategy} for the {network_function} across {cloud_providers} and on-premise. Can the {orchestration_platform} manage a unified resource inventory? This check is a prerequisite for cross-domain management as per 3GPP TS 28.530 §4.3. The strategy is infeasible if security policies, like {zero_trust_identity}, cannot be consistently enforced across all environments.",
-                "Assess the feasibility of a closed-loop automation intent for the {slice_category} slice. Can the monitoring system detect an SLA deviation and trigger the {optimization_algorithm} via the {workflow_engine} without human intervention? This is the ultimate goal of the intent-based networking principles evolving from 3GPP TS 28.530. The loop is infeasible if the {adaptation_speed} from detection to remediation exceeds the service's MTTR target.",
-                "Determine if it's feasible to dynamically instantiate a temporary, high-priority {slice_category} slice for emergency services or a large public event. Can the {orchestration_platform} provision all required resources within a {instantiation_timeout} of 5 minutes? This is an agile application of the slice allocation procedures in 3GPP TS 28.541 §5.3. The intent is infeasible if resources cannot be preempted from lower-priority slices.",
-                "Evaluate the feasibility of an energy-saving policy for the {network_function}. Can instances be scaled down from {max_instances} to {min_instances} during off-peak hours without affecting the {availability_req}? Can the {optimization_algorithm} consolidate workloads onto fewer physical servers? This aligns with the operational efficiency goals inherent in the NFV management framework (3GPP TS 28.530). The policy is infeasible if the power state transition time for servers is too long.",
-                "Assess if the {network_function} provided by {tenant_id} can securely and efficiently interact with the core network via the Network Exposure Function (NEF). Are the required APIs exposed by the NEF, and does the {auth_method} comply with 3GPP standards as per TS 29.522? This is a technical feasibility check of a key 5G capability (TS 23.501 §5.20). The integration is infeasible if the NEF cannot handle the API call rate from the tenant's application.",
-                "For a performance-critical {network_function} like a UPF, is it feasible to deploy it on bare metal servers instead of under a {hypervisor}? Does the {orchestration_platform} support bare metal provisioning? This choice directly impacts the achievable performance, a key consideration for resources in 3GPP TS 28.541 §A.4. The intent is infeasible if the security and isolation guarantees required for the {tenant_id} cannot be met without a hypervisor.",
-                "Validate if the contracted QoS parameters, such as {guaranteed_bitrate}, can be feasibly delivered for roaming users from {tenant_id}. Does the interconnect agreement with the partner network support the necessary QoS markings and traffic handling? This relates to inter-network slice management and the procedures defined in 3GPP TS 23.501 §5.15.6. The service is infeasible if the visited network's backhaul cannot support the required SLA.",
-                "Assess if the new {network_function} from {vnf_provider} can be integrated into the operator's existing CI/CD pipeline for automated testing and deployment. Is the VNF packaged as a container ({container_runtime}) and defined with a declarative configuration (e.g., Helm, Kustomize)? This is a modern operational approach to the VNF lifecycle management described in 3GPP TS 28.531. The integration is infeasible if the VNF requires manual configuration steps that cannot be automated.",
-                "Evaluate the feasibility of using an {ai_prediction_model} to proactively re-route traffic before a predicted network congestion event occurs. Can the {optimization_algorithm} calculate an alternative path and execute the change via the SDN controller without violating the {packet_error_rate}? This proactive traffic management is an intelligent application of the policy and charging control (PCC) framework from 3GPP TS 23.503. The intent is infeasible if the network topology does not offer sufficient path diversity.",
-                "Can a caching {network_function} be dynamically deployed to an edge location based on real-time content popularity analytics? Assess if the {orchestration_platform} can trigger a deployment workflow within the {execution_timeout} when the analytics platform detects a demand surge. This is an agile implementation of placing functions closer to the user to meet latency goals (a principle from 3GPP TS 23.501). The strategy is infeasible if the edge location lacks pre-provisioned {storage_capacity}."
-            ] ,
-                
-            "Report Request": [
-                "Generate a comprehensive performance report for the {network_function} operating within the {slice_category}. The report must detail the {throughput_req} and {latency_req} over the last 24 hours. Correlate these KPIs with the underlying resource utilization, specifically {cpu_cores} and {memory_size}. If {availability_req} drops below the defined threshold, automatically include {mtbf} and {mttr} metrics.",
-                "Produce a security compliance audit for the {slice_category} network slice. This report must verify that configured {encryption} and {integrity} protection policies are consistently enforced. Confirm that the {key_rotation} schedule is being followed as per security guidelines. The report's data must be stored for the specified {retention_period}.",
-                "Initiate a predictive analytics report for {network_function} using the {ai_prediction_model}. Forecast the resource demand for {cpu_cores} and {bandwidth_allocation} based on historical consumption patterns. The model must achieve an {accuracy_level} of 95% or higher. If a resource shortfall is predicted, suggest an alternative {optimization_algorithm} for traffic management.",
-                "Create a daily SLA report for {sla_type} agreements. The report should summarize the {guaranteed_bitrate} and {maximum_bitrate} for {flow_id}. It must also include statistics on {packet_delay} and {packet_error_rate} averaged over a {averaging_window}. Attach all logs where {preemption_capability} was invoked.",
-                "Assess the performance impact of the current {auto_scaling_policy} for the {network_function}. The report should analyze the time taken for {horizontal_scaling} events to complete versus the {execution_timeout} limit. Correlate scaling events with fluctuations in {jitter_tolerance}. Does the current {workflow_engine} meet the {adaptation_speed} required to prevent SLA breaches?",
-                "Generate a report verifying adherence to our {zero_trust_identity} framework for all devices connecting to the {network_function}. The report must list all successful and failed {auth_method} attempts. Additionally, verify that {location_privacy} mechanisms are active for all UEs in the {location_category}.",
-                "Run an anomaly detection report on the {slice_category}. Use {anomaly_detection} algorithms to identify unusual patterns in {packet_error_rate} and {connection_density}. If an anomaly is detected with high confidence, trigger a deeper analysis using {distributed_tracing} to pinpoint the root cause and notify {escalation_l2}.",
-                "Provide a resource utilization summary for the {network_function} instances. The report should detail the average and peak usage of {memory_size} ({memory_type}) and {storage_capacity} ({storage_type}). Compare this utilization against the configured {deployment_flavor} to identify optimization opportunities.",
-                "Create a forecast report predicting potential {backhaul_capacity} bottlenecks in the {location_category}. Use {predictive_analytics} to model traffic growth over the next quarter. If a future bottleneck is identified, evaluate the effectiveness of {load_balancing} as a proactive mitigation strategy.",
-                "Compile a monthly reliability report for the {architecture}. The report must feature {mtbf} and {mttr} statistics for critical network functions. Include a summary of all {circuit_breaker} events and their resulting impact on the overall {availability_req}.",
-                "Generate a data privacy compliance report. Confirm that {location_privacy} is enabled for all relevant services as per policy. The report must also verify that the {retention_period} for user-specific data complies with regulatory requirements.",
-                "Develop a report that uses {predictive_analytics} to identify subscribers experiencing degraded Quality of Experience. The model should analyze {packet_error_rate} and {throughput_req} deviations. If a group of users is affected, escalate to {escalation_l1} with a list of potential causes.",
-                "Create a report analyzing the end-to-end latency for the {slice_category}. Use data from {distributed_tracing} to break down latency contributions from different network segments. This report must verify compliance with the overall {latency_req} defined in the {sla_type}.",
-                "Audit the {affinity} and {anti_affinity} rules for all deployed instances of {network_function}. The report must confirm that these rules are correctly enforced by the orchestrator to ensure high availability. Flag any violations found during the audit period.",
-                "Initiate a report to determine the optimal {sampling_rate} and {aggregation_interval} for monitoring the {network_function}. Use an {optimization_algorithm} to balance monitoring granularity against resource overhead. The goal is to detect anomalies without overburdening the system.",
-                "Provide a high-level executive summary of network slice performance for the {slice_category}. The report should visualize key metrics like {availability_req} and {reliability_req} against targets. Include a section on major incidents and their resolution times.",
-                "Report on the correlation between {backhaul_capacity} and the {maximum_bitrate} achievable in the {location_category}. If {backhaul_capacity} is found to be a limiting factor, append a simulation of the expected performance gains from a potential capacity upgrade.",
-                "Generate a report to verify that all VNF/CNF images currently in use match their expected and approved versions. This report must cross-reference the running instances against the management system's catalog. Include a check on {integrity} hashes where available.",
-                "Use {ai_prediction_model} to report on the likelihood of SLA violations for {sla_type} in the next 7 days. The prediction should be based on current trends in resource usage and network congestion. If the likelihood exceeds 75%, trigger a proactive resource {vertical_scaling} recommendation.",
-                "Request a report detailing all manual interventions performed on the network infrastructure over the past quarter. The report should categorize these interventions and identify prime candidates for future automation using {iac_tool}.",
-                "Generate a comparative report on resource efficiency between {memory_type} DD4 and DDR5 for the {network_function}. The report should analyze if the upgrade to DDR5 resulted in a measurable improvement in {latency_req} under heavy load conditions.",
-                "Create a compliance report that confirms all network traffic within the {slice_category} is properly isolated from other slices. The report should include verification of network policies, VLANs, and routing tables to ensure separation.",
-                "Report on the primary causes of {mttr} for the {network_function}. Use {anomaly_detection} on logs and metrics to correlate failures with specific events (e.g., software updates, traffic spikes). Suggest improvements to the {rollback_strategy} based on these findings.",
-                "Produce a report summarizing all active QoS flows with a {priority_level_num} of 1. For each flow, list the associated service and its currently configured {guaranteed_bitrate}.",
-                "Initiate a report to find silent failures within the {architecture}. Use {predictive_analytics} to analyze subtle performance degradations that do not trigger standard alarms but could indicate an impending {mtbf} event. Escalate these findings to {escalation_l3}.",
-                "Compile a capacity planning report for {storage_type} resources. Project the storage needs for the next 12 months based on current data growth trends. The report should factor in the {retention_period} for all collected monitoring and log data.",
-                "Create a report analyzing the efficiency of the {auto_scaling_policy}. The report should answer: Are we scaling out too aggressively or too late? Compare the timing of {horizontal_scaling} events with the actual load on {cpu_cores}.",
-                "Document all instances where {preemption_capability} was used to de-allocate resources from lower-priority flows. The report must verify that this action was justified and followed the predefined policies for the {slice_category}.",
-                "Run a report using the {optimization_algorithm} to identify underutilized resources in our cloud-native environment. The report should suggest specific {vertical_scaling} actions (e.g., reducing {memory_size}) for idle instances of {network_function} to save costs.",
-                "I need a detailed report on {jitter_tolerance} performance for real-time services in the {slice_category}. If jitter exceeds the SLA threshold, the report must include a snapshot of the network state captured via {distributed_tracing} at the time of the event.",
-                "Produce a report verifying that all deployed network functions are running on infrastructure that meets the {architecture} specifications (e.g., CPU instruction sets). Flag any function running on non-compliant or deprecated hardware.",
-                "Create a report that predicts the impact of a potential {backhaul_capacity} failure at {location_category}. Use the {ai_prediction_model} to simulate the re-routing of traffic and forecast the resulting increase in {latency_req} for affected services.",
-                "Assess the {packet_error_rate} for the {slice_category}. If the rate is above the acceptable threshold, the report must include an analysis correlating the errors with specific network segments or functions.",
-                "Please provide a report confirming that all management interfaces for the {network_function} are secured using the approved {auth_method} and {encryption} protocols. Any exceptions must be highlighted.",
-                "Use {predictive_analytics} to report on the \"health score\" of each network slice. The score should be a composite metric derived from {availability_req}, {latency_req}, {throughput_req}, and user-reported issues, indicating overall service quality.",
-                "I need a report listing all configured {sla_type} contracts and their primary parameters ({guaranteed_bitrate}, {latency_req}).",
-                "Can you generate a report showing the impact of {horizontal_scaling} events on {memory_type} consumption patterns? I want to see if scaling out causes unexpected memory pressure on the underlying hypervisors.",
-                "Run a report to verify that the {anti_affinity} rules are preventing critical and redundant instances of {network_function} from being placed on the same physical host.",
-                "Generate a report identifying the root cause of intermittent {jitter_tolerance} violations. Use {distributed_tracing} combined with {anomaly_detection} to find correlations that are not obvious from standard metrics.",
-                "Report on the end-to-end {packet_delay} for {flow_id}. The report must use an {averaging_window} of 5 minutes and highlight any spikes that exceed the {sla_type} definition."
-            ],
-            
-            "Modification": [
-                "Initiate a vertical scaling modification for {network_function} of {vnf_version}. Augment the existing {deployment_flavor} by increasing compute resources to {cpu_cores} cores and {memory_size} of {memory_type} RAM. This modification is intended to maintain the {availability_req}% SLA under projected load increases. The {rollback_strategy} must be pre-configured to revert changes if monitoring detects a breach of the {mttr} objective.",
-                "Modify the QoS profile for {flow_id} to meet stringent URLLC requirements. Adjust the QoS Flow to enforce a maximum {packet_delay} and a {packet_error_rate} of 10-5. This change must be compliant with the 5QI characteristics for low latency services. Validate that the {preemption_capability} is enabled to prioritize this flow over non-critical traffic.",
-                "Update the orchestration policy for {network_function} to implement a new {auto_scaling_policy}. The scaling limits are to be adjusted to a range of {min_instances} to {max_instances}. Scaling actions will be triggered by the {optimization_algorithm} when {connection_density} metrics exceed predefined thresholds. All scaling operations must adhere to the {anti_affinity} rules specified for this service.",
-                "Reconfigure the gNBs in the {deployment_scenario} to utilize advanced {beamforming} techniques. This modification applies to the {mid_band} frequency range and aims to improve spectral efficiency. The change should be coordinated by the orchestration platform to minimize service disruption. Monitor the impact on cell edge performance and overall sector throughput.",
-                "Implement a cross-domain service modification to optimize the data path between the RAN and the data network. Increase {backhaul_capacity} and re-route traffic to ensure the end-to-end {latency_requirement} is met. This requires coordinated changes in both transport network and the core {network_function} (e.g., UPF). Ensure the {reliability_req} is not compromised during this transition.",
-                "Update the security context for the {slice_category} slice by enforcing a new {key_rotation} policy. Modify the NFs to use {auth_method} for all internal communications. This security enhancement must be rolled out without impacting the {availability_req} of the service. Log all configuration changes for audit purposes.",
-                "Modify the existing horizontal scaling policy for {network_function} to be predictive. Use the {ai_prediction_model} to forecast traffic patterns and preemptively trigger {horizontal_scaling} actions. The model must achieve an {accuracy_level} of 95% to avoid resource over-provisioning. The {adaptation_speed} of the scaling mechanism should be less than the predicted traffic ramp-up time.",
-                "Adjust the SLA for tenant {tenant_id} by modifying the {guaranteed_bitrate} for {flow_id}. The new GBR should be set to {guaranteed_bitrate}, with a peak of {maximum_bitrate}. The Policy Control Function (PCF) should enforce this change. Monitor the flow to ensure compliance and use {reflective_qos} where applicable.",
-                "Execute a VNF modification by changing the {deployment_flavor} for all instances of {network_function}. This involves a planned migration to instances with {storage_capacity} of {storage_type} to support increased logging and state storage. The process must be executed within the {execution_timeout} window and use the {rollback_strategy} upon failure.",
-                "Adapt the deployment of {network_function} to a {hybrid_strategy}, distributing new instances across on-premise VIM and {cloud_providers}. This modification requires updating the {workflow_engine} with {workflow_version} to manage multi-cloud resources. Use {load_balancing} to distribute traffic according to the defined policy.",
-                "Modify the monitoring policy by adjusting the {sampling_rate} and {aggregation_interval} for performance metrics related to {network_function}. Enable {anomaly_detection} with a higher sensitivity to track jitter. The data {retention_period} for these high-granularity metrics should be set to {retention_period}.",
-                "Refine the QoS profile for a real-time communication service by setting the {jitter_tolerance} parameter. This modification is critical for maintaining voice and video quality for the {slice_category}. The network must ensure that packet delay variation remains within this new bound.",
-                "Initiate a rolling upgrade of {network_function} to {vnf_version}. The upgrade shall be managed by the {workflow_engine} using a blue-green deployment to ensure zero downtime. The new version must maintain or improve upon the existing {reliability_req}. If post-deployment checks fail, trigger an automated rollback to the previous version.",
-                "Increase the dedicated {bandwidth_allocation} for the network slice serving {tenant_id}. This is to support a higher {connection_density} and ensure the {guaranteed_bitrate} can be met during peak hours. The modification should be applied at both the transport and core network layers.",
-                "Modify the RAN configuration to implement a new {sectorization} strategy, increasing the number of sectors per cell site. This change is aimed at increasing capacity in a dense {deployment_scenario}. Concurrently, ensure the {backhaul_capacity} is sufficient to handle the increased aggregated traffic from the new sectors.",
-                "Adjust the {circuit_breaker} parameters for the microservices within {network_function}. The intent is to make the function more resilient to transient downstream failures. Modify the failure threshold and reset timeout to align with the target {mtbf} for the service.",
-                "Update the security policy to mandate the use of a new {integrity} protection algorithm for user plane traffic within the {slice_category} slice. This change must be propagated to all relevant NFs (e.g., UPF, gNB). This is a compliance requirement to protect against data tampering.",
-                "Enable {reflective_qos} for specific services to allow the UE to mirror downlink QoS for uplink traffic. This modification simplifies QoS management for symmetric services. The change must be authorized by the PCF and applied at the UPF.",
-                "Expand the {storage_capacity} for {network_function} to accommodate a longer data {retention_period} for analytics. The new {storage_type} should be optimized for high-throughput reads. The expansion should be performed live without impacting the function's operation.",
-                "Trigger a re-evaluation and potential modification of the resources allocated to a network slice. If {predictive_analytics} indicates a sustained increase in demand, automatically adjust {cpu_cores}, {memory_size}, and {bandwidth_allocation} to meet the {sla_type}.",
-                "Modify the RAN configuration to activate the {low_band} spectrum for wide-area coverage. This change is intended to improve indoor penetration and cell-edge performance. Ensure UEs capable of carrier aggregation can utilize this new band in conjunction with existing {mid_band} carriers.",
-                "Modify the {execution_timeout} for orchestration workflows related to {network_function} scaling. The current timeout is too aggressive and causes false positives. A longer timeout will improve the reliability of scaling operations during high load. The {rollback_on_failure} policy remains in effect.",
-                "Modify the security configuration to enhance {location_privacy} for subscribers. This involves tighter controls on how location information is exposed to third-party applications via the NEF. The change must align with regulatory requirements.",
-                "Change the active {optimization_algorithm} used for RAN resource management. The new algorithm leverages an {ai_prediction_model} to dynamically allocate resources, aiming to reduce inter-cell interference. The goal is to improve the overall {throughput_req} across the network.",
-                "Adjust the {auto_scaling_policy} for {network_function} by increasing the {max_instances} parameter. This modification will provide greater elasticity to handle unexpected traffic surges. Ensure the underlying {orchestration_platform} has sufficient resource headroom to support this new upper limit.",
-                "Change the {load_balancing} algorithm for traffic entering the {network_function} service mesh from round-robin to least-connections. This modification is intended to provide a more even distribution of load across instances. Monitor instance CPU utilization to verify the effectiveness of the change.",
-                "Update the service commitment for a slice by modifying its {availability_req} and {reliability_req} parameters. This reflects a new {sla_type} agreement. The orchestrator must verify that the current resource allocation and resilience mechanisms can support these new, stricter targets.",
-                "Modify the inventory database to reflect an upgrade of {antenna_type} at specific cell sites. This information is critical for the accuracy of network planning and optimization tools. The change should trigger a re-evaluation of beamforming patterns for the affected cells.",
-                "Initiate a modification to rebalance instances of {network_function} across multiple VIMs, including {cloud_providers}. The goal is to optimize for geographic latency and improve resilience. This requires a {workflow_engine} capable of cross-site orchestration and state management.",
-                "Modify the QoS configuration to make {flow_id} subject to preemption by higher-priority traffic by disabling its {preemption_capability}. This change is intended to free up resources for critical services like emergency calls during network congestion.",
-                "Update the lifecycle management {workflow_version} to support the deployment and configuration of {vnf_version} of {network_function}. The new workflow must include updated configuration steps and health checks specific to the new version. The old workflow should be deprecated but retained for rollback purposes.",
-                "Trigger a {vertical_scaling} operation on {network_function} to increase its {memory_size}. This is in response to monitoring alerts indicating high memory pressure that could impact performance. The change should be applied with minimal service impact.",
-                "Modify the RAN configuration to activate {high_band} (mmWave) spectrum for a Fixed Wireless Access (FWA) {deployment_scenario}. This requires enabling specific {beamforming} procedures for stationary users. Ensure the core network's UPF has the capacity to handle the resulting {maximum_bitrate}.",
-                "Modify the monitoring configuration to use a different {compression_ratio} for performance data sent to the analytics engine. The goal is to reduce the load on the management network without losing essential information needed by the {anomaly_detection} system.",
-                "Change the {rollback_strategy} for {network_function} from a full revert to a stateful, canary-based rollback. This allows for more granular failure recovery during phased rollouts. The new strategy should be tested in a staging environment before being applied to production.",
-                "Modify an existing network slice to align with a new service profile, which mandates a lower {latency_requirement} and a higher {guaranteed_bitrate}. This will likely trigger a full re-evaluation of the slice's resource allocation and configuration by the orchestrator.",
-                "Create and apply a new {deployment_flavor} for {network_function} instances at the network edge. This flavor will be optimized for low resource consumption ({cpu_cores}, {memory_size}) to fit edge hardware constraints, supporting the operator's {edge_strategy}.",
-                "Modify the network access policies to support {auth_method} as a new primary authentication mechanism. This requires configuration changes on the AUSF and UDM ({network_function}). The change should be rolled out progressively to different subscriber groups.",
-                "Alter the service function chain for a specific data flow by inserting a new VNF for traffic inspection. This requires the orchestrator to update the network forwarding paths and ensure the new chain does not violate the end-to-end {latency_requirement}.",
-                "Update the resilience objectives for the {slice_category} slice by modifying the target {mtbf} (Mean Time Between Failures) and {mttr} (Mean Time To Repair). The orchestrator must confirm that the current {redundancy} model and {rollback_strategy} can meet these new targets.",
-                "Decommission and re-provision {network_function} to migrate it to a new {storage_type} (e.g., from HDD to SSD). This modification is intended to resolve an I/O bottleneck that is impacting service performance. The migration must be performed within a scheduled maintenance window.",
-                "Modify the NFVO/VIM configuration to add a new public {cloud_providers} as a valid resource pool. This involves updating the {workflow_engine} with the appropriate APIs and image repositories. The intent is to enable a {hybrid_strategy} for bursting capacity.",
-                "Fine-tune the {auto_scaling_policy} by adjusting the {horizontal_scaling} step size and cooldown period. The intent is to make the scaling response more aggressive to quickly adapt to flash crowd scenarios, while avoiding flapping.",
-                "Modify the QoS target for a massive IoT service by relaxing the {packet_error_rate} requirement. This allows for more efficient radio resource utilization for devices that are tolerant to some data loss.",
-                "Push a runtime configuration change to all instances of {network_function}. The change involves updating an internal application parameter (e.g., cache size) to improve performance. This modification should be applied via the VNFM without requiring a full restart of the instances.",
-                "Enhance the resilience of a cell site by provisioning a secondary, diverse {backhaul_type} path. The modification should ensure that failover between the primary and secondary paths is automatic and occurs within the service's {mttr} objective.",
-                "Replace the current {ai_prediction_model} used for network slice load forecasting with an updated version. The new model promises a higher {accuracy_level} and better handling of seasonal traffic variations. The NWDAF ({network_function}) should be updated to use this new model for its analytics services."
-            ],
-                    
-            "Performance Assurance":  [
-                "Continuously assure that the service maintains a {throughput_req} and stays below a {latency_req} threshold. This performance assurance intent is critical for maintaining the {sla_type}. Activate {anomaly_detection} to identify deviations in real-time. Should performance degrade, automatically adjust the {load_balancing} strategy to reroute traffic and maintain stability.",
-                "Enforce a strict {sla_type} by monitoring for {availability_req}% uptime and a {reliability_req}% success rate. Track {mttr} and {mtbf} metrics continuously over a {retention_period}. Use {predictive_analytics} to forecast potential SLA breaches. If a breach is predicted with {accuracy_level}% confidence, trigger the {auto_scaling_policy} to preemptively add resources.",
-                "This intent focuses on ultra-low latency optimization, targeting a maximum {latency_req} and a minimal {jitter_tolerance}. Implement a high-frequency {sampling_rate} for packet delay measurements. Engage {distributed_tracing} to pinpoint sources of latency across the service chain. Any packet delay exceeding the {packet_delay} threshold must trigger an immediate re-optimization of the network path.",
-                "Maximize service throughput by assuring a {guaranteed_bitrate} and allowing bursts up to {maximum_bitrate}. Monitor the data flow over a defined {averaging_window} to ensure compliance. If the guaranteed bitrate is not met, dynamically re-allocate network resources. The {preemption_capability} for this flow is set to {priority_level_num} to ensure resource availability.",
-                "Implement an AI-driven assurance loop for this service. Use {predictive_analytics} to forecast throughput demand and potential latency spikes with {accuracy_level}% accuracy. The model should have an {adaptation_speed} capable of responding to real-time changes. If a degradation is predicted, the system must automatically initiate a corrective workflow.",
-                "Assure performance by maintaining a {throughput_req} and {packet_error_rate} below the specified limits. The {monitoring_interval} shall be set to {aggregation_interval}. Any detected anomaly via {anomaly_detection} should trigger an alert and a data capture for root cause analysis. This is essential for maintaining the core {sla_type} agreement.",
-                "This intent is to guarantee the {sla_type} for a mission-critical service, focusing on an {availability_req}% target. Continuously verify that {mtbf} is high and {mttr} is low. The system must automatically failover in case of a component failure. All performance data will be stored for a {retention_period} for compliance auditing.",
-                "Optimize for consistent low latency by ensuring the end-to-end {packet_delay} does not exceed {latency_req}. Monitor {jitter_tolerance} to guarantee smooth real-time communication. If jitter exceeds the threshold, prioritize the traffic flow to {priority_level_num}. This is crucial for interactive services like cloud gaming or AR/VR.",
-                "Ensure the service can consistently achieve a {maximum_bitrate} during peak demand by monitoring traffic patterns. Apply an aggressive {auto_scaling_policy} to rapidly scale resources when throughput demand nears the {throughput_req} ceiling. Use {load_balancing} to distribute the increased load efficiently across all available instances.",
-                "Deploy an AI-powered performance assurance model, {predictive_analytics}, to maintain the service's health. The model must predict {packet_error_rate} trends with {accuracy_level}% accuracy. Based on predictions, the system should dynamically adjust resource allocation with a high {adaptation_speed}. This ensures proactive, closed-loop service assurance.",
-                "Maintain a constant watch on the {guaranteed_bitrate} for this flow, ensuring it never drops below the specified {sla_type} value. Data will be measured using a {sampling_rate} of 1 per second. If performance degrades, {anomaly_detection} must trigger a workflow to investigate the cause, referencing the required {reliability_req}.",
-                "The primary goal is to assure the {availability_req}% SLA commitment. The system's performance will be evaluated against {mtbf} and {mttr} goals. In the event of an outage, the recovery process must be completed within the {mttr} window. All assurance data is subject to a {retention_period} for review.",
-                "This intent is to minimize latency fluctuations by enforcing a strict {jitter_tolerance}. Monitor the network path continuously for any increase in delay variation. If the {averaging_window} shows a negative trend, re-route the traffic through a more stable path. This is vital for high-quality voice and video services.",
-                "Assure that the aggregated service throughput consistently meets or exceeds {throughput_req}. Use {load_balancing} across multiple instances to achieve this goal. If the total throughput drops, the {auto_scaling_policy} should be invoked to horizontally scale the service and meet demand.",
-                "Leverage {predictive_analytics} to proactively manage QoS. The AI model will forecast potential {jitter_tolerance} violations based on current network conditions. If a violation is predicted with {accuracy_level}% confidence, the system will apply corrective measures with a defined {adaptation_speed} before the user experience is impacted.",
-                "The performance assurance intent is to monitor the {packet_delay} for a specific flow with {priority_level_num}. If the delay exceeds the target, activate {distributed_tracing} to identify the bottleneck. This granular level of observability is required to meet the stringent {sla_type}.",
-                "This SLA assurance intent mandates a {reliability_req}% for the service. The system must adhere to the agreed {mtbf} and {mttr} values. The monitoring system will aggregate data every {aggregation_interval} and will trigger alerts if the reliability metric trends downwards.",
-                "To ensure a superior real-time experience, this intent targets a {latency_req} and a low {packet_error_rate}. The network must be configured to prioritize this traffic. If contention occurs, the {preemption_capability} will be used to secure the necessary resources.",
-                "Assure that the service can handle burst traffic up to {maximum_bitrate} without performance degradation. The {auto_scaling_policy} must be sensitive enough to react to sudden spikes in demand. Monitor resource utilization and throughput to ensure the scaling actions are effective.",
-                "In case of a link failure scenario, this intent ensures service continuity with a minimal {mttr}. The {mesh_technology} should provide at least two redundant paths. The system must automatically switch to the backup path and report the failover event, ensuring the {availability_req} is not compromised.",
-                "Utilize an AI model for intelligent service assurance. The {predictive_analytics} engine will analyze monitoring data to predict impending failures that could impact the {reliability_req}. The system's {adaptation_speed} must be fast enough to take corrective action, such as migrating a service, before the failure occurs.",
-                "Assure performance by ensuring the {guaranteed_bitrate} is always met, measured over a sliding {averaging_window}. The {anomaly_detection} system will check for any prolonged dips in performance. A sustained dip will trigger a resource evaluation and potential vertical scaling.",
-                "The SLA for this service requires {availability_req}% uptime. To achieve this, the assurance system will monitor health checks at a high {sampling_rate}. In case of failure, the {mttr} must be strictly adhered to, with automated recovery scripts in place.",
-                "This intent is focused on optimizing latency for edge computing applications, targeting a {latency_req}. Use {distributed_tracing} to monitor the service mesh performance. If latency increases, adjust the {load_balancing} to favor edge nodes closer to the user.",
-                "Guarantee sufficient bandwidth by monitoring the {throughput_req}. If traffic demand consistently exceeds 80% of the allocated capacity, the {auto_scaling_policy} will be triggered to provision additional resources. This proactive scaling ensures the {maximum_bitrate} is always achievable.",
-                "Simulate a network congestion scenario and verify that the service maintains its QoS. The {priority_level_num} traffic must still meet its {guaranteed_bitrate} and {latency_req}. The {preemption_capability} must function correctly to shed lower-priority traffic.",
-                "This AI-driven intent is to minimize service downtime. The {predictive_analytics} model will forecast hardware failures that could impact {mtbf}. If a failure is predicted with {accuracy_level}% confidence, the system will automatically trigger a migration of services off the at-risk hardware.",
-                "Monitor and assure the end-to-end {packet_delay} and {packet_error_rate} for the specified flow. This is critical for meeting the {sla_type}. Data will be collected with a {compression_ratio} to optimize storage over the {retention_period}.",
-                "This intent is to enforce the {reliability_req}% target defined in the {sla_type}. The assurance system will track all service-affecting incidents to calculate {mtbf} and {mttr} accurately. Any deviation from the agreed reliability metrics will result in a compliance violation report.",
-                "For this latency-sensitive service, maintain a {jitter_tolerance} of less than 2ms. The monitoring system will use a high {sampling_rate} to detect micro-bursts and jitter. If jitter increases, the network fabric will be instructed to prioritize these packets.",
-                "The primary assurance goal is to ensure the {throughput_req} is consistently met. The system will use an {auto_scaling_policy} based on CPU and memory utilization to scale horizontally. This ensures that as user load increases, throughput performance remains stable.",
-                "Implement an AI assurance loop with a fast {adaptation_speed}. The system will use {predictive_analytics} to foresee SLA violations related to {latency_req}. Upon prediction, it will automatically adjust QoS parameters to prevent the violation from occurring, ensuring a consistent user experience.",
-                "Assure a {guaranteed_bitrate} and {maximum_bitrate} as per the service agreement. The performance will be monitored over a {aggregation_interval} of 5 minutes. If the guaranteed rate is not met, an alert will be raised to the network operations center.",
-                "This SLA assurance intent focuses on minimizing downtime by enforcing a strict {mttr}. Upon failure detection, automated recovery workflows must be initiated immediately. The success of these workflows is measured against the {availability_req} target.",
-                "The intent is to provide a stable, low-latency connection by limiting {packet_delay}. Use {distributed_tracing} to continuously monitor every hop in the service chain. If any component introduces excessive latency, it will be flagged for investigation.",
-                "To assure high throughput, this intent activates an aggressive {auto_scaling_policy}. The system will scale out when traffic exceeds 75% of {throughput_req}. This ensures that the service can always handle loads up to the {maximum_bitrate} without packet loss.",
-                "Use an AI model to dynamically manage service performance. The {predictive_analytics} engine will forecast user demand and preemptively trigger the {auto_scaling_policy}. This model must maintain an {accuracy_level} of over 95% to be effective.",
-                "Enforce the {availability_req}% SLA by monitoring the health of all service components. The {mtbf} for each component must meet the specified target. The assurance system will use this data to calculate the overall service availability.",
-                "This intent is to optimize for the lowest possible latency by ensuring {packet_delay} stays within the defined threshold. The network will use traffic shaping to prioritize these packets, reflecting their {priority_level_num}. Any increase in delay will be investigated immediately.",
-                "Assure that the service's throughput can scale from a baseline of {guaranteed_bitrate} to a peak of {maximum_bitrate}. The {auto_scaling_policy} will manage the required resources based on real-time demand, ensuring a smooth and responsive user experience.",
-                "In a network slice failover scenario, this intent is to assure that the service is restored within the {mttr} window. The backup slice must meet the same {latency_req} and {throughput_req} as the primary. This ensures seamless service continuity and maintains the {availability_req}.",
-                "This AI-driven intent focuses on proactive reliability assurance. The {predictive_analytics} model will identify patterns that lead to service failures. Based on these predictions, it will recommend or automate actions to prevent the failure from occurring, thereby improving the {mtbf}.",
-                "Continuously monitor the {jitter_tolerance} for a real-time video stream. If jitter exceeds the acceptable level, dynamically increase buffer sizes or re-route the stream over a more stable network path. This is key to maintaining a high-quality, uninterrupted viewing experience.",
-                "Assure the {reliability_req}% of the service by implementing a resilient architecture with {mesh_technology}. The system must tolerate single-component failures without impacting the end-user. The {mttr} for any automated recovery action must be less than 60 seconds."
-            ],
-            
-            "Regular Notification": [
-                "Generate a comprehensive performance report for the {network_function} operating within the {slice_category}. The report must detail the {throughput_req} and {latency_req} over the last 24 hours. Correlate these KPIs with the underlying resource utilization, specifically {cpu_cores} and {memory_size}. If {availability_req} drops below the defined threshold, automatically include {mtbf} and {mttr} metrics.",
-                "Produce a security compliance audit for the {slice_category} network slice. This report must verify that configured {encryption} and {integrity} protection policies are consistently enforced. Confirm that the {key_rotation} schedule is being followed as per security guidelines. The report's data must be stored for the specified {retention_period}.",
-                "Initiate a predictive analytics report for {network_function} using the {ai_prediction_model}. Forecast the resource demand for {cpu_cores} and {bandwidth_allocation} based on historical consumption patterns. The model must achieve an {accuracy_level} of 95% or higher. If a resource shortfall is predicted, suggest an alternative {optimization_algorithm} for traffic management.",
-                "Create a daily SLA report for {sla_type} agreements. The report should summarize the {guaranteed_bitrate} and {maximum_bitrate} for {flow_id}. It must also include statistics on {packet_delay} and {packet_error_rate} averaged over a {averaging_window}. Attach all logs where {preemption_capability} was invoked.",
-                "Assess the performance impact of the current {auto_scaling_policy} for the {network_function}. The report should analyze the time taken for {horizontal_scaling} events to complete versus the {execution_timeout} limit. Correlate scaling events with fluctuations in {jitter_tolerance}. Does the current {workflow_engine} meet the {adaptation_speed} required to prevent SLA breaches?",
-                "Generate a report verifying adherence to our {zero_trust_identity} framework for all devices connecting to the {network_function}. The report must list all successful and failed {auth_method} attempts. Additionally, verify that {location_privacy} mechanisms are active for all UEs in the {location_category}.",
-                "Run an anomaly detection report on the {slice_category}. Use {anomaly_detection} algorithms to identify unusual patterns in {packet_error_rate} and {connection_density}. If an anomaly is detected with high confidence, trigger a deeper analysis using {distributed_tracing} to pinpoint the root cause and notify {escalation_l2}.",
-                "Provide a resource utilization summary for the {network_function} instances. The report should detail the average and peak usage of {memory_size} ({memory_type}) and {storage_capacity} ({storage_type}). Compare this utilization against the configured {deployment_flavor} to identify optimization opportunities.",
-                "Generate a Quality of Service (QoS) trend report for {flow_id} over the past month. Track {jitter_tolerance}, {packet_delay}, and {guaranteed_bitrate}. If performance degrades by more than 10%, the report should automatically recommend adjusting the {priority_level_num}.",
-                "Produce a report detailing all orchestration actions executed by {iac_tool} for the {network_function}. The report must verify that every change was authorized and logged. Confirm that any failed deployment correctly triggered the configured {rollback_strategy}.",
-                "Create a forecast report predicting potential {backhaul_capacity} bottlenecks in the {location_category}. Use {predictive_analytics} to model traffic growth over the next quarter. If a future bottleneck is identified, evaluate the effectiveness of {load_balancing} as a proactive mitigation strategy.",
-                "Compile a monthly reliability report for the {architecture}. The report must feature {mtbf} and {mttr} statistics for critical network functions. Include a summary of all {circuit_breaker} events and their resulting impact on the overall {availability_req}.",
-                "Provide a report on the effectiveness of our current {load_balancing} algorithm. The report must show the distribution of traffic and resource load across all active instances. Correlate this with {latency_req} metrics to ensure the algorithm is not introducing unforeseen delays under peak load.",
-                "Generate a data privacy compliance report. Confirm that {location_privacy} is enabled for all relevant services as per policy. The report must also verify that the {retention_period} for user-specific data complies with regulatory requirements.",
-                "Develop a report that uses {predictive_analytics} to identify subscribers experiencing degraded Quality of Experience. The model should analyze {packet_error_rate} and {throughput_req} deviations. If a group of users is affected, escalate to {escalation_l1} with a list of potential causes.",
-                "Generate a report on the efficiency of the {workflow_engine} running {workflow_version}. The report should focus on {execution_timeout} successes and failures. Include the average time-to-execute for common orchestration tasks like {horizontal_scaling}.",
-                "Create a report analyzing the end-to-end latency for the {slice_category}. Use data from {distributed_tracing} to break down latency contributions from different network segments. This report must verify compliance with the overall {latency_req} defined in the {sla_type}.",
-                "Audit the {affinity} and {anti_affinity} rules for all deployed instances of {network_function}. The report must confirm that these rules are correctly enforced by the orchestrator to ensure high availability. Flag any violations found during the audit period.",
-                "Initiate a report to determine the optimal {sampling_rate} and {aggregation_interval} for monitoring the {network_function}. Use an {optimization_algorithm} to balance monitoring granularity against resource overhead. The goal is to detect anomalies without overburdening the system.",
-                "Provide a high-level executive summary of network slice performance for the {slice_category}. The report should visualize key metrics like {availability_req} and {reliability_req} against targets. Include a section on major incidents and their resolution times.",
-                "Report on the correlation between {backhaul_capacity} and the {maximum_bitrate} achievable in the {location_category}. If {backhaul_capacity} is found to be a limiting factor, append a simulation of the expected performance gains from a potential capacity upgrade.",
-                "Generate a report to verify that all VNF/CNF images currently in use match their expected and approved versions. This report must cross-reference the running instances against the management system's catalog. Include a check on {integrity} hashes where available.",
-                "Use {ai_prediction_model} to report on the likelihood of SLA violations for {sla_type} in the next 7 days. The prediction should be based on current trends in resource usage and network congestion. If the likelihood exceeds 75%, trigger a proactive resource {vertical_scaling} recommendation.",
-                "Request a report detailing all manual interventions performed on the network infrastructure over the past quarter. The report should categorize these interventions and identify prime candidates for future automation using {iac_tool}.",
-                "Create a compliance report that confirms all network traffic within the {slice_category} is properly isolated from other slices. The report should include verification of network policies, VLANs, and routing tables to ensure separation.",
-                "Report on the primary causes of {mttr} for the {network_function}. Use {anomaly_detection} on logs and metrics to correlate failures with specific events (e.g., software updates, traffic spikes). Suggest improvements to the {rollback_strategy} based on these findings.",
-                "Produce a report summarizing all active QoS flows with a {priority_level_num} of 1. For each flow, list the associated service and its currently configured {guaranteed_bitrate}.",
-                "I need a report that shows the performance of our {mesh_technology}. Please include metrics on path selection latency and failover time. How does this performance map to our {reliability_req} target of 99.999%?",
-                "Generate an access control report for the orchestration platform. List all users and systems with administrative privileges. The report must verify that the principle of least privilege is being followed, as required by our {zero_trust_identity} policy.",
-                "Initiate a report to find silent failures within the {architecture}. Use {predictive_analytics} to analyze subtle performance degradations that do not trigger standard alarms but could indicate an impending {mtbf} event. Escalate these findings to {escalation_l3}.",
-                "Compile a capacity planning report for {storage_type} resources. Project the storage needs for the next 12 months based on current data growth trends. The report should factor in the {retention_period} for all collected monitoring and log data.",
-                "Create a report analyzing the efficiency of the {auto_scaling_policy}. The report should answer: Are we scaling out too aggressively or too late? Compare the timing of {horizontal_scaling} events with the actual load on {cpu_cores}.",
-                "Document all instances where {preemption_capability} was used to de-allocate resources from lower-priority flows. The report must verify that this action was justified and followed the predefined policies for the {slice_category}.",
-                "Run a report using the {optimization_algorithm} to identify underutilized resources in our cloud-native environment. The report should suggest specific {vertical_scaling} actions (e.g., reducing {memory_size}) for idle instances of {network_function} to save costs.",
-                "Generate a simple daily status report for the {network_function}. It should contain only three key metrics: {availability_req} percentage for the day, number of active instances, and total throughput processed.",
-                "I need a detailed report on {jitter_tolerance} performance for real-time services in the {slice_category}. If jitter exceeds the SLA threshold, the report must include a snapshot of the network state captured via {distributed_tracing} at the time of the event.",
-                "Produce a report verifying that all deployed network functions are running on infrastructure that meets the {architecture} specifications (e.g., CPU instruction sets). Flag any function running on non-compliant or deprecated hardware.",
-                "Create a report that predicts the impact of a potential {backhaul_capacity} failure at {location_category}. Use the {ai_prediction_model} to simulate the re-routing of traffic and forecast the resulting increase in {latency_req} for affected services.",
-                "Generate an orchestration workflow failure report for {workflow_id} ({workflow_version}). For each failure, list the step that failed, the error message, and whether the {rollback_strategy} was executed successfully.",
-                "Assess the {packet_error_rate} for the {slice_category}. If the rate is above the acceptable threshold, the report must include an analysis correlating the errors with specific network segments or functions.",
-                "Please provide a report confirming that all management interfaces for the {network_function} are secured using the approved {auth_method} and {encryption} protocols. Any exceptions must be highlighted.",
-                "Use {predictive_analytics} to report on the \"health score\" of each network slice. The score should be a composite metric derived from {availability_req}, {latency_req}, {throughput_req}, and user-reported issues, indicating overall service quality.",
-                "I need a report listing all configured {sla_type} contracts and their primary parameters ({guaranteed_bitrate}, {latency_req}).",
-                "Can you generate a report showing the impact of {horizontal_scaling} events on {memory_type} consumption patterns? I want to see if scaling out causes unexpected memory pressure on the underlying hypervisors.",
-                "Run a report to verify that the {anti_affinity} rules are preventing critical and redundant instances of {network_function} from being placed on the same physical host.",
-                "Generate a report identifying the root cause of intermittent {jitter_tolerance} violations. Use {distributed_tracing} combined with {anomaly_detection} to find correlations that are not obvious from standard metrics.",
-                "Provide a summary report of all {circuit_breaker} trips in the last 7 days. Include the duration of the open state and the service that was protected.",
-                "Report on the end-to-end {packet_delay} for {flow_id}. The report must use an {averaging_window} of 5 minutes and highlight any spikes that exceed the {sla_type} definition.",
-                "I need a report that demonstrates compliance with our data {integrity} policies. The report should show regular checks have been performed on stored data and configuration files for {network_function}."
-            ]
-        }
-
-        # Create comprehensive template registry for easy access
-        self.template_registry = {
-            'Deployment Intent': templates["Deployment"],
-            'Modification Intent': templates["Modification"],
-            'Performance Assurance Intent': templates["Performance Assurance"],
-            'Intent Report Request': templates["Report Request"],
-            'Intent Feasibility Check': templates["Feasibility Check"],
-            'Regular Notification Request': templates["Regular Notification"]
-        }
+        self._rng = rng if rng is not None else random
+        
+        # Create comprehensive template registry for easy access; the template
+        # tuples themselves are module-level constants shared by all engines
+        self.template_registry: Dict[str, Sequence[str]] = dict(INTENT_TYPE_TEMPLATES)
         
         # Initialize parameter extraction patterns for intelligent parsing
-        self.parameter_patterns = self._initialize_parameter_patterns()
+        self.parameter_patterns = PARAMETER_PATTERNS
         
         # Initialize template scoring weights for optimization
-        self.scoring_weights = self._initialize_scoring_weights()
+        self.scoring_weights = SCORING_WEIGHTS
+        
+        # Per-template keyword masks and complexity scores for batch scoring
+        self._template_features: Dict[str, Tuple[int, Tuple[float, float, float]]] = {}
+        
+        # Per-template placeholder names and category coverage, parsed on first use
+        self._template_profiles: Dict[str, Tuple[frozenset, float]] = {}
+        
+        # Column-wise scoring inputs per registry template list, keyed by list
+        # identity and compiled on first use; each entry keeps its list alive
+        # so the id cannot be reused
+        self._template_arrays: Dict[int, Tuple[Sequence[str], CompiledTemplateArray]] = {}
+        
+        # Formatted text of the placeholders that depend only on the
+        # extraction, per extraction render key; published dicts are never
+        # mutated
+        self._rendered_values: "OrderedDict[Hashable, Dict[str, str]]" = OrderedDict()
+        
+        # Memoized rendered descriptions keyed by template, extraction render
+        # key and the context fields rendering reads
+        self._render_cache: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
+        
+        # Guards the caches above so engines can be shared between threads
+        self._cache_lock = threading.Lock()
         
         logger.info(f"Template engine initialized with {len(self.template_registry)} intent types")
         logger.info(f"Total templates available: {sum(len(templates) for templates in self.template_registry.values())}")
@@ -576,322 +1400,259 @@ class AdvancedTemplateEngine:
         Returns:
             tuple: (Generated network intent description, Base template used)
         """
-        logger.info(f"Generating description for {context.intent_type} with complexity {context.complexity}")
+        logger.info("Generating description for %s with complexity %d", context.intent_type, context.complexity)
         
         try:
             # Phase 1: Extract and process all available parameters
             logger.debug("Phase 1: Extracting comprehensive parameters")
             extracted_params = self._extract_comprehensive_parameters(context.parameters)
             
-            # Phase 2: Get candidate templates
+            # Phase 2: Get candidate templates (a single registry lookup)
             logger.debug("Phase 2: Retrieving candidate templates")
-            templates = self.template_registry.get(context.intent_type, [])
+            templates = self.template_registry.get(context.intent_type, ())
             if not templates:
-                logger.error(f"No templates found for intent type: {context.intent_type}")
+                logger.error("No templates found for intent type: %s", context.intent_type)
                 return self._generate_fallback_description(context), "FALLBACK_TEMPLATE"
 
             # Phase 3: Select optimal template using multi-dimensional scoring
             logger.debug("Phase 3: Selecting optimal template")
             selected_template = self._select_optimal_template(templates, context, extracted_params)
             
-            # Phase 4: Populate template with comprehensive parameter substitution
-            logger.debug("Phase 4: Populating template with parameters")
-            description = self._populate_comprehensive_template(selected_template, context, extracted_params)
+            # Phases 4-5: Populate the template and apply post-processing
+            logger.debug("Phases 4-5: Rendering template with parameters")
+            description = self._render_description(selected_template, context, extracted_params)
             
-            # Phase 5: Apply post-processing enhancements and validation
-            logger.debug("Phase 5: Applying post-processing enhancements")
-            description = self._apply_post_processing(description, context, extracted_params)
-            
-            logger.info(f"Successfully generated description with {len(description)} characters")
+            logger.info("Successfully generated description with %d characters", len(description))
             return description, selected_template
             
         except Exception as e:
-            logger.error(f"Error generating description: {str(e)}")
+            logger.error("Error generating description: %s", e)
             # Fallback to basic template
             return self._generate_fallback_description(context), "FALLBACK_TEMPLATE"
     
-    def _extract_comprehensive_parameters(self, parameters: Dict[str, Any]) -> ParameterExtraction:
+    def generate_descriptions(self, context: TemplateContext, count: int) -> List[Tuple[str, str]]:
         """
-        Extract and categorize all available parameters with enhanced error handling.
+        Generate several description variants for one context.
         
-        This method performs deep extraction of parameters from nested dictionaries,
-        applying intelligent defaults and validation to ensure robust parameter
-        availability for template generation.
+        Parameters are extracted and candidate templates scored once; each
+        variant then only draws a template and renders it, reusing the
+        extraction's formatted values. The output (and the engine's random
+        stream) matches calling generate_description count times.
         
         Args:
-            parameters: Raw parameter dictionary from intent specification
+            context: Template generation context
+            count: Number of descriptions to generate
             
         Returns:
-            ParameterExtraction: Organized parameter structure
+            list: (description, base template) tuples
         """
-        logger.debug("Starting comprehensive parameter extraction")
+        logger.info("Generating %d descriptions for %s", count, context.intent_type)
         
-        def safe_extract(data: Dict[str, Any], path: str, default: Any = None) -> Any:
-            """
-            Safely extract nested parameter values with comprehensive error handling.
-            
-            This function navigates nested dictionary structures safely,
-            providing meaningful defaults when values are not available.
-            
-            Args:
-                data: Source dictionary to extract from
-                path: Dot-separated path to desired value
-                default: Default value if path not found
-                
-            Returns:
-                Extracted value or default
-            """
+        try:
+            templates = self.template_registry.get(context.intent_type, ())
+            if not templates:
+                logger.error("No templates found for intent type: %s", context.intent_type)
+                return [(self._generate_fallback_description(context), "FALLBACK_TEMPLATE")
+                        for _ in range(count)]
+            extracted_params = self._extract_comprehensive_parameters(context.parameters)
+            top_candidates = self._rank_templates(templates, context, extracted_params)
+        except Exception as e:
+            logger.error("Error generating description: %s", e)
+            return [(self._generate_fallback_description(context), "FALLBACK_TEMPLATE")
+                    for _ in range(count)]
+        
+        results = []
+        for _ in range(count):
             try:
-                from ..validation import get_validator
-                validator = get_validator()
-                
-                keys = path.split('.')
-                current = data
-                for key in keys:
-                    if isinstance(current, dict) and key in current:
-                        current = current[key]
-                    else:
-                        logger.debug(f"Path {path} not found, using default: {default}")
-                        # Log default usage for data quality tracking
-                        validator.log_default_usage(path, default, "Path not found in parameters")
-                        return default
-                return current
+                selected_template = self._pick_weighted_candidate(top_candidates)
+                description = self._render_description(selected_template, context, extracted_params)
+                results.append((description, selected_template))
             except Exception as e:
-                logger.warning(f"Error extracting {path}: {str(e)}, using default: {default}")
-                # Log default usage for data quality tracking
-                try:
-                    from ..validation import get_validator
-                    validator = get_validator()
-                    validator.log_default_usage(path, default, f"Exception: {str(e)}")
-                except:
-                    pass  # Don't fail if validator import fails
-                return default
-        
-        # Extract network topology and infrastructure parameters
-        logger.debug("Extracting network topology parameters")
-        network_params = {
-            # Core network architecture configuration
-            'architecture': safe_extract(parameters, 'network_topology.network_architecture', 'Standalone_5G'),
-            'deployment_scenario': safe_extract(parameters, 'network_topology.deployment_scenario', 'Urban_Macro'),
-            
-            # Spectrum band allocation across frequency ranges
-            'low_band': safe_extract(parameters, 'network_topology.spectrum_bands.low_band', '700MHz'),
-            'mid_band': safe_extract(parameters, 'network_topology.spectrum_bands.mid_band', '3.5GHz'),
-            'high_band': safe_extract(parameters, 'network_topology.spectrum_bands.high_band', '28GHz'),
-            
-            # Advanced antenna system configuration
-            'antenna_type': safe_extract(parameters, 'network_topology.antenna_configuration.type', 'Massive_MIMO_64T64R'),
-            'beamforming': safe_extract(parameters, 'network_topology.antenna_configuration.beamforming_capability', '3D_Beamforming'),
-            'sectorization': safe_extract(parameters, 'network_topology.antenna_configuration.sectorization', '6_Sector'),
-            
-            # Backhaul network infrastructure
-            'backhaul_type': safe_extract(parameters, 'network_topology.backhaul.type', 'Fiber_Optic'),
-            'backhaul_capacity': safe_extract(parameters, 'network_topology.backhaul.capacity', '10Gbps'),
-            'backhaul_latency': safe_extract(parameters, 'network_topology.backhaul.latency', '1ms'),
-            'redundancy': safe_extract(parameters, 'network_topology.backhaul.redundancy', 'Active_Active')
-        }
+                logger.error("Error generating description: %s", e)
+                results.append((self._generate_fallback_description(context), "FALLBACK_TEMPLATE"))
+        return results
+    
+    def generate_descriptions_batch(self, contexts: List[TemplateContext]) -> List[Tuple[str, str]]:
+        """
+        Generate descriptions for many contexts at once.
         
-        # Extract Quality of Service parameters for traffic management
-        logger.debug("Extracting QoS parameters")
-        qos_params = {
-            # QoS flow identification and classification
-            'flow_id': safe_extract(parameters, 'qos_parameters.qos_flow_identifier', '5QI_1_Conversational_Voice'),
-            
-            # Bitrate guarantees and limits
-            'guaranteed_bitrate': safe_extract(parameters, 'qos_parameters.guaranteed_bit_rate', '100Mbps'),
-            'maximum_bitrate': safe_extract(parameters, 'qos_parameters.maximum_bit_rate', '1000Mbps'),
-            
-            # Latency and error rate requirements
-            'packet_delay': safe_extract(parameters, 'qos_parameters.packet_delay_budget', '10ms'),
-            'packet_error_rate': safe_extract(parameters, 'qos_parameters.packet_error_rate', '0.001'),
-            
-            # Priority and preemption configuration
-            'priority_level': safe_extract(parameters, 'qos_parameters.priority_level', 15),
-            'preemption_capability': safe_extract(parameters, 'qos_parameters.preemption_capability', 'MAY_PREEMPT'),
-            
-            # Advanced QoS features
-            'reflective_qos': safe_extract(parameters, 'qos_parameters.reflective_qos', 'ENABLED'),
-            'jitter_tolerance': safe_extract(parameters, 'qos_parameters.jitter_tolerance', '2ms'),
-            'averaging_window': safe_extract(parameters, 'qos_parameters.averaging_window', '5000ms')
-        }
+        Candidate templates are looked up and scored once per intent type
+        with score_batch, so template features, context masks and parameter
+        utilization scores are shared across the batch. Templates are then
+        drawn, populated and post-processed in input order, so the output
+        (and the engine's random stream) matches calling generate_description
+        on each context in turn.
         
-        # Extract comprehensive security and privacy parameters
-        logger.debug("Extracting security parameters")
-        security_params = {
-            # Authentication and access control
-            'auth_method': safe_extract(parameters, 'security_parameters.authentication_method', '5G_AKA'),
-            'encryption': safe_extract(parameters, 'security_parameters.encryption_algorithm', '256_NEA1'),
-            'integrity': safe_extract(parameters, 'security_parameters.integrity_protection', '256_NIA1'),
-            
-            # Cryptographic key management
-            'kdf': safe_extract(parameters, 'security_parameters.key_management.kdf', 'HMAC_SHA256'),
-            'key_length': safe_extract(parameters, 'security_parameters.key_management.key_length', '256_bit'),
-            'key_rotation': safe_extract(parameters, 'security_parameters.key_management.key_rotation_interval', '6hours'),
-            
-            # Privacy protection mechanisms
-            'supi_concealment': safe_extract(parameters, 'security_parameters.privacy_protection.supi_concealment', 'ENABLED'),
-            'location_privacy': safe_extract(parameters, 'security_parameters.privacy_protection.location_privacy', 'FULL_PROTECTION'),
+        Args:
+            contexts: Template generation contexts
             
-            # Zero trust architecture components
-            'zero_trust_identity': safe_extract(parameters, 'security_parameters.zero_trust_architecture.identity_verification', 'continuous_behavioral_authentication'),
-            'device_trust': safe_extract(parameters, 'security_parameters.zero_trust_architecture.device_trust', 'hardware_based_attestation')
-        }
+        Returns:
+            list: (description, base template) tuples, one per context
+        """
+        logger.info("Generating %d descriptions in batch", len(contexts))
+        
+        # Phases 1-3a: score every context against its intent type's
+        # templates, one score_batch call per intent type
+        rows_by_index: Dict[int, Any] = {}
+        indices_by_type: Dict[str, List[int]] = {}
+        for index, context in enumerate(contexts):
+            indices_by_type.setdefault(context.intent_type, []).append(index)
+        for intent_type, indices in indices_by_type.items():
+            templates = self.template_registry.get(intent_type, ())
+            if not templates:
+                continue
+            try:
+                scores = self.score_batch(templates, [contexts[index] for index in indices])
+            except Exception as e:
+                logger.error("Error scoring templates for %s: %s", intent_type, e)
+                continue
+            for index, row in zip(indices, scores):
+                rows_by_index[index] = row
+        
+        results = []
+        for index, context in enumerate(contexts):
+            row = rows_by_index.get(index)
+            if row is None:
+                results.append((self._generate_fallback_description(context), "FALLBACK_TEMPLATE"))
+                continue
+            try:
+                # Phase 3b: weighted draw from the three best templates
+                templates = self.template_registry[context.intent_type]
+                top_candidates = heapq.nlargest(3, zip(templates, [float(score) for score in row]),
+                                                key=lambda x: x[1])
+                selected_template = self._pick_weighted_candidate(top_candidates)
+                
+                # Phases 4-5: populate and post-process
+                extracted_params = self._extract_comprehensive_parameters(context.parameters)
+                description = self._render_description(selected_template, context, extracted_params)
+                results.append((description, selected_template))
+            except Exception as e:
+                logger.error("Error generating description: %s", e)
+                results.append((self._generate_fallback_description(context), "FALLBACK_TEMPLATE"))
         
-        # Extract compute, storage, and network resource parameters
-        logger.debug("Extracting resource allocation parameters")
-        resource_params = {
-            # Compute resource specifications
-            'cpu_arch': safe_extract(parameters, 'resource_allocation.compute_resources.cpu_architecture', 'x86_64'),
-            'cpu_cores': safe_extract(parameters, 'resource_allocation.compute_resources.cpu_cores', 8),
-            'cpu_frequency': safe_extract(parameters, 'resource_allocation.compute_resources.cpu_frequency', '3.0GHz'),
-            
-            # Memory subsystem configuration
-            'memory_size': safe_extract(parameters, 'resource_allocation.compute_resources.memory_size', '32GB'),
-            'memory_type': safe_extract(parameters, 'resource_allocation.compute_resources.memory_type', 'DDR4'),
-            
-            # Storage subsystem specifications
-            'storage_capacity': safe_extract(parameters, 'resource_allocation.compute_resources.storage_capacity', '1000GB'),
-            'storage_type': safe_extract(parameters, 'resource_allocation.compute_resources.storage_type', 'NVMe_SSD'),
-            
-            # Network resource allocation
-            'bandwidth_allocation': safe_extract(parameters, 'resource_allocation.network_resources.bandwidth_allocation', '1000Mbps'),
-            'latency_requirement': safe_extract(parameters, 'resource_allocation.network_resources.latency_requirement', '5ms'),
-            'connection_density': safe_extract(parameters, 'resource_allocation.network_resources.connection_density', '100000_devices_per_km2'),
-            
-            # Virtualization platform configuration
-            'hypervisor': safe_extract(parameters, 'resource_allocation.virtualization_parameters.hypervisor', 'KVM'),
-            'container_runtime': safe_extract(parameters, 'resource_allocation.virtualization_parameters.container_runtime', 'Docker'),
-            'orchestration_platform': safe_extract(parameters, 'resource_allocation.virtualization_parameters.orchestration_platform', 'Kubernetes'),
-            
-            # AI-driven resource optimization
-            'ai_prediction_model': safe_extract(parameters, 'resource_allocation.ai_driven_resource_allocation.prediction_model', 'lstm_with_attention_mechanism'),
-            'optimization_algorithm': safe_extract(parameters, 'resource_allocation.ai_driven_resource_allocation.optimization_algorithm', 'multi_objective_genetic_algorithm'),
-            'adaptation_speed': safe_extract(parameters, 'resource_allocation.ai_driven_resource_allocation.adaptation_speed', '500ms'),
-            'accuracy_level': safe_extract(parameters, 'resource_allocation.ai_driven_resource_allocation.accuracy_level', '95%')
-        }
+        return results
+    
+    def generate_descriptions_parallel(self, contexts: List[TemplateContext], workers: Optional[int] = None,
+                                       seed: Optional[int] = None,
+                                       chunk_size: int = PARALLEL_CHUNK_SIZE) -> List[Tuple[str, str]]:
+        """
+        Generate descriptions for a large batch across worker processes.
         
-        # Extract monitoring, analytics, and observability parameters
-        logger.debug("Extracting monitoring parameters")
-        monitoring_params = {
-            # Data collection and aggregation configuration
-            'sampling_rate': safe_extract(parameters, 'monitoring_parameters.analytics_configuration.data_collection.sampling_rate', '50%'),
-            'aggregation_interval': safe_extract(parameters, 'monitoring_parameters.analytics_configuration.data_collection.aggregation_interval', '30seconds'),
-            'retention_period': safe_extract(parameters, 'monitoring_parameters.analytics_configuration.data_collection.retention_period', '90days'),
-            'compression_ratio': safe_extract(parameters, 'monitoring_parameters.analytics_configuration.data_collection.compression_ratio', '5:1'),
-            
-            # Machine learning and AI analytics models
-            'anomaly_detection': safe_extract(parameters, 'monitoring_parameters.analytics_configuration.ml_models.anomaly_detection', 'Isolation_Forest'),
-            'predictive_analytics': safe_extract(parameters, 'monitoring_parameters.analytics_configuration.ml_models.predictive_analytics', 'LSTM_Autoencoder'),
-            'optimization_algo': safe_extract(parameters, 'monitoring_parameters.analytics_configuration.ml_models.optimization_algorithm', 'Genetic_Algorithm'),
-            
-            # Alert escalation and notification policies
-            'escalation_l1': safe_extract(parameters, 'monitoring_parameters.alerting_configuration.escalation_policy.level1', '2minutes'),
-            'escalation_l2': safe_extract(parameters, 'monitoring_parameters.alerting_configuration.escalation_policy.level2', '10minutes'),
-            'escalation_l3': safe_extract(parameters, 'monitoring_parameters.alerting_configuration.escalation_policy.level3', '30minutes'),
-            'notification_channels': safe_extract(parameters, 'monitoring_parameters.alerting_configuration.notification_channels', 'REST_API')
-        }
+        Contexts are split into chunks of chunk_size. Each chunk is generated
+        with generate_descriptions_batch by a worker engine that shares this
+        engine's template registry, and whose RNG is reseeded with seed plus
+        the chunk index. The results therefore do not depend on the number
+        of workers or on scheduling, and come back in input order. They do
+        not match generate_descriptions_batch on this engine, which draws from
+        this engine's own RNG.
         
-        # Extract orchestration and lifecycle management parameters
-        logger.debug("Extracting orchestration parameters")
-        orchestration_params = {
-            # ETSI NFV MANO component identifiers
-            'nfvo_id': safe_extract(parameters, 'orchestration_parameters.nfvo_id', 'nfvo_default'),
-            'vnfm_id': safe_extract(parameters, 'orchestration_parameters.vnfm_id', 'vnfm_default'),
-            'vim_id': safe_extract(parameters, 'orchestration_parameters.vim_id', 'vim_default'),
-            
-            # Workflow orchestration configuration
-            'workflow_id': safe_extract(parameters, 'orchestration_parameters.orchestration_workflow.workflow_id', 'workflow_default'),
-            'workflow_version': safe_extract(parameters, 'orchestration_parameters.orchestration_workflow.workflow_version', '1.0'),
-            'execution_timeout': safe_extract(parameters, 'orchestration_parameters.orchestration_workflow.execution_timeout', '1800seconds'),
-            'rollback_strategy': safe_extract(parameters, 'orchestration_parameters.orchestration_workflow.rollback_strategy', 'AUTOMATIC'),
-            
-            # VNF descriptor and deployment specifications
-            'vnf_provider': safe_extract(parameters, 'deployment_specification.vnf_descriptor.vnf_provider', 'Ericsson'),
-            'vnf_version': safe_extract(parameters, 'deployment_specification.vnf_descriptor.vnf_software_version', 'SW_1.0.0'),
-            'deployment_flavor': safe_extract(parameters, 'deployment_specification.deployment_flavor.description', 'High_Performance_Compute_Optimized'),
+        Args:
+            contexts: Template generation contexts (must be picklable)
+            workers: Number of worker processes (defaults to the CPU count)
+            seed: Base seed for the chunk RNGs; drawn from this engine's RNG
+                when omitted
+            chunk_size: Number of contexts per chunk
             
-            # Instance scaling configuration
-            'min_instances': safe_extract(parameters, 'deployment_specification.deployment_flavor.vdu_profile.min_number_of_instances', 2),
-            'max_instances': safe_extract(parameters, 'deployment_specification.deployment_flavor.vdu_profile.max_number_of_instances', 20),
-            'network_function': safe_extract(parameters, 'deployment_specification.network_function', 'AMF')
-        }
+        Returns:
+            list: (description, base template) tuples, one per context
+        """
+        if seed is None:
+            seed = self._rng.getrandbits(32)
+        chunks = [
+            (seed + index, contexts[start:start + chunk_size])
+            for index, start in enumerate(range(0, len(contexts), chunk_size))
+        ]
+        if not chunks:
+            return []
+        workers = min(workers or multiprocessing.cpu_count(), len(chunks))
+        logger.info("Generating %d descriptions in %d chunks on %d workers",
+                    len(contexts), len(chunks), workers)
+        
+        results: List[Tuple[str, str]] = []
+        with multiprocessing.Pool(workers, initializer=_init_parallel_worker,
+                                  initargs=(self.template_registry,)) as pool:
+            # imap keeps chunk order, so results line up with contexts
+            for chunk_results in pool.imap(_generate_parallel_chunk, chunks):
+                results.extend(chunk_results)
+        return results
+    
+    def _extract_comprehensive_parameters(self, parameters: Dict[str, Any]) -> ParameterExtraction:
+        """
+        Extract and categorize all available parameters with enhanced error handling.
         
-        # Extract performance requirements and SLA parameters
-        logger.debug("Extracting performance parameters")
-        performance_params = {
-            # Core performance requirements
-            'throughput_req': safe_extract(parameters, 'performance_requirements.throughput_requirement', '1000Mbps'),
-            'latency_req': safe_extract(parameters, 'performance_requirements.latency_requirement', '5ms'),
-            'availability_req': safe_extract(parameters, 'performance_requirements.availability_requirement', '99.99%'),
-            'reliability_req': safe_extract(parameters, 'performance_requirements.reliability_requirement', '99.9%'),
-            
-            # Scalability and elasticity requirements
-            'horizontal_scaling': safe_extract(parameters, 'performance_requirements.scalability_requirement.horizontal_scaling', '100instances'),
-            'vertical_scaling': safe_extract(parameters, 'performance_requirements.scalability_requirement.vertical_scaling', '32cores'),
-            'auto_scaling_policy': safe_extract(parameters, 'performance_requirements.scalability_requirement.auto_scaling_policy', 'CPU_BASED'),
-            
-            # Service level agreement specifications
-            'sla_type': safe_extract(parameters, 'performance_objectives.service_level.sla_type', 'GOLD_TIER'),
-            'mttr': safe_extract(parameters, 'performance_objectives.service_level.commitments.mean_time_to_repair', '60minutes'),
-            'mtbf': safe_extract(parameters, 'performance_objectives.service_level.commitments.mean_time_between_failures', '2160hours')
-        }
+        This method performs deep extraction of parameters from nested dictionaries,
+        applying intelligent defaults and validation to ensure robust parameter
+        availability for template generation.
         
-        # Extract deployment-specific configuration parameters
-        logger.debug("Extracting deployment parameters")
-        deployment_params = {
-            # Service and tenant identification
-            'service_level': safe_extract(parameters, 'service_level', 'PLATINUM'),
-            'tenant_id': safe_extract(parameters, 'tenant_id', 'TENANT_12345'),
-            'correlation_id': safe_extract(parameters, 'correlation_id', 'CORR_default'),
-            
-            # Lifecycle management operation configuration
-            'instantiation_timeout': safe_extract(parameters, 'deployment_specification.additional_params.lcm_operations_configuration.instantiate.timeout', '600seconds'),
-            'rollback_on_failure': safe_extract(parameters, 'deployment_specification.additional_params.lcm_operations_configuration.instantiate.rollback_on_failure', 'true'),
+        Args:
+            parameters: Raw parameter dictionary from intent specification
             
-            # Placement and affinity rules
-            'anti_affinity': safe_extract(parameters, 'deployment_specification.additional_params.affinity_rules.anti_affinity', 'HOST'),
-            'affinity': safe_extract(parameters, 'deployment_specification.additional_params.affinity_rules.affinity', 'HARD')
-        }
+        Returns:
+            ParameterExtraction: Organized parameter structure
+        """
+        logger.debug("Starting comprehensive parameter extraction")
         
-        # Extract advanced deployment and emerging technology parameters
-        logger.debug("Extracting advanced parameters")
-        advanced_params = {
-            # Multi-cloud orchestration configuration
-            'cloud_providers': safe_extract(parameters, 'advanced_orchestration_parameters.multi_cloud_orchestration.cloud_providers', ['AWS', 'Azure']),
-            'hybrid_strategy': safe_extract(parameters, 'advanced_orchestration_parameters.multi_cloud_orchestration.hybrid_cloud_strategy', 'CLOUD_FIRST'),
-            
-            # Edge computing deployment strategy
-            'edge_strategy': safe_extract(parameters, 'advanced_orchestration_parameters.edge_orchestration.edge_deployment_strategy', 'DISTRIBUTED'),
-            'workflow_engine': safe_extract(parameters, 'advanced_orchestration_parameters.workflow_orchestration.workflow_engine', 'Airflow'),
-            
-            # Cloud-native service mesh configuration
-            'mesh_technology': safe_extract(parameters, 'advanced_deployment_specification.cloud_native_features.service_mesh.mesh_technology', 'Istio'),
-            'load_balancing': safe_extract(parameters, 'advanced_deployment_specification.cloud_native_features.service_mesh.traffic_management.load_balancing', 'ROUND_ROBIN'),
-            'circuit_breaker': safe_extract(parameters, 'advanced_deployment_specification.cloud_native_features.service_mesh.traffic_management.circuit_breaker', 'ENABLED'),
-            
-            # Observability and tracing configuration
-            'distributed_tracing': safe_extract(parameters, 'advanced_deployment_specification.cloud_native_features.service_mesh.observability.distributed_tracing', 'Jaeger'),
-            
-            # Infrastructure automation configuration
-            'automation_level': safe_extract(parameters, 'advanced_deployment_specification.deployment_automation.automation_level', 'FULLY_AUTOMATED'),
-            'iac_tool': safe_extract(parameters, 'advanced_deployment_specification.deployment_automation.infrastructure_as_code.iac_tool', 'Terraform')
-        }
+        flat, defaulted = extract_flat(parameters, _PARAMETER_PATH_SPECS)
+        self._log_default_usage(defaulted)
+        extracted_params = self._build_extraction(flat)
         
         logger.debug("Parameter extraction completed successfully")
         
-        return ParameterExtraction(
-            network_params=network_params,
-            qos_params=qos_params,
-            security_params=security_params,
-            resource_params=resource_params,
-            monitoring_params=monitoring_params,
-            orchestration_params=orchestration_params,
-            performance_params=performance_params,
-            deployment_params=deployment_params,
-            advanced_params=advanced_params
+        return extracted_params
+    
+    def _log_default_usage(self, defaulted: List[Tuple[str, Any]]) -> None:
+        """
+        Report parameter paths that fell back to their defaults.
+        
+        Args:
+            defaulted: (path, default) pairs from extract_flat
+        """
+        if not defaulted:
+            return
+        try:
+            from ..validation import get_validator
+            validator = get_validator()
+        except Exception as e:
+            logger.warning("Data quality validator unavailable: %s", e)
+            validator = None
+        
+        for path, default in defaulted:
+            logger.debug("Path %s not found, using default: %s", path, default)
+            # Log default usage for data quality tracking
+            if validator is not None:
+                validator.log_default_usage(path, default, "Path not found in parameters")
+    
+    def _build_extraction(self, flat: Dict[str, Any]) -> ParameterExtraction:
+        """
+        Wrap flat extracted parameters in a ParameterExtraction.
+        
+        Args:
+            flat: Flat parameters from extract_flat (interned in place)
+            
+        Returns:
+            ParameterExtraction: Organized parameter structure
+        """
+        # Share one string object per categorical value across extractions
+        for key in INTERNED_PARAMETER_KEYS:
+            value = flat[key]
+            if type(value) is str:
+                flat[key] = sys.intern(value)
+        
+        # List leaves (e.g. cloud providers) are snapshotted as tuples so
+        # later in-place changes to them do not alter the key
+        values = flat.values()
+        content_key: Optional[Hashable] = (
+            tuple([tuple(value) if type(value) is list else value for value in values]),
+            tuple(map(type, values)),
         )
+        try:
+            hash(content_key)
+        except TypeError:
+            # Unhashable leaves (e.g. nested dicts) fall back to identity
+            content_key = None
+        return ParameterExtraction(flat=flat, content_key=content_key)
     
-    def _select_optimal_template(self, templates: List[str], context: TemplateContext, 
+    def _select_optimal_template(self, templates: Sequence[str], context: TemplateContext, 
                                 extracted_params: ParameterExtraction) -> str:
         """
         Select the optimal template using sophisticated multi-dimensional scoring.
@@ -901,7 +1662,7 @@ class AdvancedTemplateEngine:
         complexity appropriateness to select the best template.
         
         Args:
-            templates: List of candidate templates
+            templates: Candidate templates
             context: Template generation context
             extracted_params: Extracted parameter structure
             
@@ -912,64 +1673,246 @@ class AdvancedTemplateEngine:
             logger.warning("No templates available, using fallback")
             return "Execute advanced {intent_type} deployment with comprehensive parameter utilization across {architecture} infrastructure using {orchestration_platform} orchestration and {ai_prediction_model} intelligence"
         
-        logger.debug(f"Evaluating {len(templates)} candidate templates")
-        
-        # Score each template across multiple dimensions
-        scored_templates = []
+        # Select from top candidates with some randomization
+        return self._pick_weighted_candidate(self._rank_templates(templates, context, extracted_params))
+    
+    def _rank_templates(self, templates: Sequence[str], context: TemplateContext,
+                        extracted_params: ParameterExtraction) -> List[Tuple[str, float]]:
+        """
+        Score candidate templates and return the three best.
         
-        for template in templates:
-            # Calculate comprehensive template score
-            param_score = self._score_template_parameter_utilization(template, extracted_params)
-            context_score = self._score_template_context_alignment(template, context)
-            complexity_score = self._score_template_complexity_match(template, context.complexity)
-            
-            # Weighted total score
-            total_score = (
-                param_score * 0.4 +      # 40% weight on parameter utilization
-                context_score * 0.35 +   # 35% weight on context alignment
-                complexity_score * 0.25  # 25% weight on complexity match
-            )
+        Args:
+            templates: Non-empty sequence of candidate templates
+            context: Template generation context
+            extracted_params: Extracted parameter structure
             
-            scored_templates.append((template, total_score, {
-                'param_score': param_score,
-                'context_score': context_score,
-                'complexity_score': complexity_score
-            }))
+        Returns:
+            list: (template, total score) tuples, best first
+        """
+        logger.debug("Evaluating %d candidate templates", len(templates))
         
-        # Sort templates by total score (descending)
-        scored_templates.sort(key=lambda x: x[1], reverse=True)
+        # Score all templates column-wise from the compiled array; context
+        # alignment and complexity match come from cached per-template
+        # features (see score_batch), so templates are not rescanned per call
+        array = self._get_template_array(templates)
+        context_mask = self._get_context_mask(context)
+        complexity_scores = array.bucket_scores[self._get_complexity_bucket(context.complexity)]
+        
+        all_params = extracted_params.get_all_parameters()
+        if all_params:
+            param_count = len(all_params)
+            param_scores = [
+                min(1.0, (sum(1 for name in placeholders if name in all_params) / param_count * 0.7)
+                    + (category_score * 0.3))
+                for placeholders, category_score in zip(array.placeholders, array.category_scores)
+            ]
+        else:
+            param_scores = [0.0] * len(array.texts)
+        context_scores = [min(1.0, (context_mask & mask).bit_count() * 0.2) for mask in array.masks]
+        
+        # Weighted total score of parameter utilization, context alignment
+        # and complexity match (see SCORING_WEIGHTS)
+        total_scores = [
+            param_score * PARAMETER_WEIGHT + context_score * CONTEXT_WEIGHT
+            + complexity_score * COMPLEXITY_WEIGHT
+            for param_score, context_score, complexity_score
+            in zip(param_scores, context_scores, complexity_scores)
+        ]
+        
+        # Keep the three best templates by total score (descending); nlargest
+        # matches a stable sort, so ties still favour registry order
+        top_indices = heapq.nlargest(3, range(len(total_scores)), key=total_scores.__getitem__)
+        top_candidates = [(array.texts[i], total_scores[i]) for i in top_indices]
         
         # Log top candidates for debugging
-        for i, (template, score, breakdown) in enumerate(scored_templates[:3]):
-            logger.debug(f"Template {i+1}: Score={score:.3f}, "
-                        f"Param={breakdown['param_score']:.3f}, "
-                        f"Context={breakdown['context_score']:.3f}, "
-                        f"Complexity={breakdown['complexity_score']:.3f}")
+        if logger.isEnabledFor(logging.DEBUG):
+            for rank, i in enumerate(top_indices):
+                logger.debug("Template %d: Score=%.3f, Param=%.3f, Context=%.3f, Complexity=%.3f",
+                             rank + 1, total_scores[i], param_scores[i],
+                             context_scores[i], complexity_scores[i])
         
-        # Select from top candidates with some randomization
-        top_candidates = scored_templates[:min(3, len(scored_templates))]
+        return top_candidates
+    
+    def _pick_weighted_candidate(self, top_candidates: List[Tuple]) -> str:
+        """
+        Draw one template from the top candidates, weighted by score.
         
-        # Weighted random selection from top candidates
+        Args:
+            top_candidates: (template, score, ...) tuples, best first
+            
+        Returns:
+            str: Selected template
+        """
+        # Weighted random selection from top candidates; choices bisects the
+        # cumulative scores with a single random() draw
         if len(top_candidates) > 1:
-            weights = [score for _, score, _ in top_candidates]
-            total_weight = sum(weights)
+            cum_weights = list(accumulate(candidate[1] for candidate in top_candidates))
             
-            if total_weight > 0:
-                import random
-                rand_val = random.uniform(0, total_weight)
-                cumulative_weight = 0
-                
-                for template, score, _ in top_candidates:
-                    cumulative_weight += score
-                    if rand_val <= cumulative_weight:
-                        logger.info(f"Selected template with score: {score:.3f}")
-                        return template
+            if cum_weights[-1] > 0:
+                template, score = self._rng.choices(top_candidates, cum_weights=cum_weights)[0][:2]
+                logger.info("Selected template with score: %.3f", score)
+                return template
         
         # Return the highest-scored template
         selected_template = top_candidates[0][0]
-        logger.info(f"Selected highest-scored template: {top_candidates[0][1]:.3f}")
+        logger.info("Selected highest-scored template: %.3f", top_candidates[0][1])
         return selected_template
     
+    def score_batch(self, templates: Sequence[str], contexts: List[TemplateContext]) -> np.ndarray:
+        """
+        Score every template against every context in a single pass.
+        
+        Each template is reduced once to a keyword bitmask, a parameter
+        utilization score and per-complexity-bucket scores, so the
+        (context, template) grid only needs mask intersections, computed
+        with NumPy broadcasting.
+        
+        Args:
+            templates: Candidate templates (columns)
+            contexts: Template generation contexts (rows)
+            
+        Returns:
+            np.ndarray: Scores of shape (len(contexts), len(templates))
+        """
+        features = [self._get_template_features(template) for template in templates]
+        
+        # Parameter utilization only depends on which parameter keys were
+        # extracted, so it is computed once per distinct key set
+        param_scores_by_keys: Dict[frozenset, List[float]] = {}
+        param_rows = []
+        for context in contexts:
+            extracted_params = self._extract_comprehensive_parameters(context.parameters)
+            keys = frozenset(extracted_params.get_all_parameters())
+            if keys not in param_scores_by_keys:
+                param_scores_by_keys[keys] = [
+                    self._score_template_parameter_utilization(template, extracted_params)
+                    for template in templates
+                ]
+            param_rows.append(param_scores_by_keys[keys])
+        
+        context_masks = [self._get_context_mask(context) for context in contexts]
+        buckets = [self._get_complexity_bucket(context.complexity) for context in contexts]
+        
+        template_masks = np.array([mask for mask, _ in features], dtype=np.uint32)
+        complexity_table = np.array([bucket_scores for _, bucket_scores in features], dtype=np.float64)
+        hits = np.unpackbits(
+            (np.array(context_masks, dtype=np.uint32)[:, None] & template_masks[None, :])
+            .astype('>u4').view(np.uint8).reshape(len(contexts), len(templates), 4),
+            axis=-1
+        ).sum(axis=-1)
+        context_scores = np.minimum(1.0, hits * 0.2)
+        complexity_scores = complexity_table.reshape(len(templates), 3).T[np.array(buckets, dtype=np.intp)]
+        param_scores = np.array(param_rows, dtype=np.float64).reshape(len(contexts), len(templates))
+        return (param_scores * PARAMETER_WEIGHT + context_scores * CONTEXT_WEIGHT
+                + complexity_scores * COMPLEXITY_WEIGHT)
+    
+    def _get_template_array(self, templates: Sequence[str]) -> CompiledTemplateArray:
+        """
+        Get the column-wise scoring inputs for a sequence of templates.
+        
+        Registry values are compiled once, on first use, so creating an
+        engine stays cheap; any other sequence is compiled on the fly from the
+        per-template caches.
+        
+        Args:
+            templates: Candidate templates, usually a template_registry value
+            
+        Returns:
+            CompiledTemplateArray: Scoring inputs parallel to templates
+        """
+        entry = self._template_arrays.get(id(templates))
+        if entry is not None and entry[0] is templates:
+            return entry[1]
+        array = self._compile_template_array(templates)
+        if any(templates is registered for registered in self.template_registry.values()):
+            self._template_arrays[id(templates)] = (templates, array)
+        return array
+    
+    def _compile_template_array(self, templates: Sequence[str]) -> CompiledTemplateArray:
+        """Build the column-wise scoring inputs for a sequence of templates."""
+        features = [self._get_template_features(template) for template in templates]
+        profiles = []
+        for template in templates:
+            profile = self._template_profiles.get(template)
+            if profile is None:
+                profile = self._template_profiles[template] = self._profile_template(template)
+            profiles.append(profile)
+        return CompiledTemplateArray(
+            texts=tuple(templates),
+            placeholders=tuple(placeholders for placeholders, _ in profiles),
+            category_scores=tuple(category_score for _, category_score in profiles),
+            masks=tuple(mask for mask, _ in features),
+            bucket_scores=(
+                tuple(bucket_scores[0] for _, bucket_scores in features),
+                tuple(bucket_scores[1] for _, bucket_scores in features),
+                tuple(bucket_scores[2] for _, bucket_scores in features),
+            ),
+        )
+    
+    def _get_template_features(self, template: str) -> Tuple[int, Tuple[float, float, float]]:
+        """
+        Get the cached keyword bitmask and complexity-bucket scores for a template.
+        
+        Args:
+            template: Template string to analyze
+            
+        Returns:
+            tuple: (keyword bitmask, scores for the low/medium/high complexity buckets)
+        """
+        features = self._template_features.get(template)
+        if features is None:
+            template_lower = template.lower()
+            mask = 0
+            for (dimension, key), bit in CONTEXT_KEYWORD_BITS.items():
+                if any(keyword in template_lower for keyword in CONTEXT_KEYWORD_TABLES[dimension][key]):
+                    mask |= bit
+            features = (mask, (
+                self._score_template_complexity_match(template, 1),
+                self._score_template_complexity_match(template, 5),
+                self._score_template_complexity_match(template, 8),
+            ))
+            self._template_features[template] = features
+        return features
+    
+    @staticmethod
+    def _get_context_mask(context: TemplateContext) -> int:
+        """Build the keyword bitmask a template must intersect to align with a context."""
+        complexity_tier = context.metadata.get('complexity_tier', 'STANDARD')
+        return (
+            CONTEXT_KEYWORD_BITS.get(('priority', context.priority), 0)
+            | CONTEXT_KEYWORD_BITS.get(('slice', context.slice_category), 0)
+            | CONTEXT_KEYWORD_BITS.get(('intent', context.intent_type), 0)
+            | CONTEXT_KEYWORD_BITS.get(('complexity_tier', complexity_tier), 0)
+        )
+    
+    @staticmethod
+    def _get_complexity_bucket(complexity: int) -> int:
+        """Map complexity to the low (0), medium (1) or high (2) scoring bucket."""
+        if complexity >= 8:
+            return 2
+        elif complexity >= 5:
+            return 1
+        return 0
+    
+    @staticmethod
+    def _profile_template(template: str) -> Tuple[frozenset, float]:
+        """
+        Parse the template-only inputs of parameter utilization scoring.
+        
+        Args:
+            template: Template string to analyze
+            
+        Returns:
+            tuple: (placeholder names used, fraction of parameter categories covered)
+        """
+        template_lower = template.lower()
+        category_matches = sum(
+            1 for keywords in PARAMETER_CATEGORY_KEYWORDS.values()
+            if any(keyword in template_lower for keyword in keywords)
+        )
+        placeholders = frozenset(_PLACEHOLDER_NAME_RE.findall(template))
+        return placeholders, category_matches / len(PARAMETER_CATEGORY_KEYWORDS)
+    
     def _score_template_parameter_utilization(self, template: str, extracted_params: ParameterExtraction) -> float:
         """
         Score template based on its potential to utilize available parameters.
@@ -986,36 +1929,16 @@ class AdvancedTemplateEngine:
         if not all_params:
             return 0.0
         
-        # Count direct parameter placeholders
-        direct_matches = 0
-        for param_key in all_params.keys():
-            if f'{{{param_key}}}' in template:
-                direct_matches += 1
-        
-        # Count category-based matches
-        category_matches = 0
-        category_keywords = {
-            'network': ['network', 'topology', 'architecture', 'spectrum', 'antenna'],
-            'qos': ['qos', 'quality', 'bitrate', 'latency', 'delay'],
-            'security': ['security', 'auth', 'encryption', 'privacy', 'trust'],
-            'resource': ['resource', 'compute', 'memory', 'storage', 'cpu'],
-            'monitoring': ['monitor', 'analytics', 'anomaly', 'alert', 'trace'],
-            'orchestration': ['orchestrat', 'workflow', 'vnf', 'nfv', 'deploy'],
-            'performance': ['performance', 'sla', 'throughput', 'availability'],
-            'advanced': ['ai', 'intelligent', 'cognitive', 'autonomous', 'mesh']
-        }
+        profile = self._template_profiles.get(template)
+        if profile is None:
+            profile = self._template_profiles[template] = self._profile_template(template)
+        placeholders, category_score = profile
         
-        template_lower = template.lower()
-        for category, keywords in category_keywords.items():
-            for keyword in keywords:
-                if keyword in template_lower:
-                    category_matches += 1
-                    break
+        # Count direct parameter placeholders
+        direct_matches = sum(1 for name in placeholders if name in all_params)
         
         # Calculate normalized score
-        max_possible_matches = len(all_params)
-        direct_score = direct_matches / max_possible_matches if max_possible_matches > 0 else 0
-        category_score = category_matches / len(category_keywords)
+        direct_score = direct_matches / len(all_params)
         
         # Combine scores with weighting
         final_score = (direct_score * 0.7) + (category_score * 0.3)
@@ -1037,62 +1960,30 @@ class AdvancedTemplateEngine:
         template_lower = template.lower()
         
         # Priority alignment scoring
-        priority_keywords = {
-            'EMERGENCY': ['emergency', 'critical', 'urgent', 'immediate'],
-            'CRITICAL': ['critical', 'mission', 'essential', 'vital'],
-            'HIGH': ['high', 'priority', 'important', 'advanced'],
-            'MEDIUM': ['standard', 'normal', 'regular', 'typical'],
-            'LOW': ['basic', 'simple', 'minimal', 'standard']
-        }
-        
-        if context.priority in priority_keywords:
-            for keyword in priority_keywords[context.priority]:
+        if context.priority in PRIORITY_KEYWORDS:
+            for keyword in PRIORITY_KEYWORDS[context.priority]:
                 if keyword in template_lower:
                     score += 0.2
                     break
         
         # Slice category alignment scoring
-        slice_keywords = {
-            'eMBB': ['broadband', 'throughput', 'capacity', 'bandwidth'],
-            'URLLC': ['reliable', 'latency', 'critical', 'deterministic'],
-            'mMTC': ['massive', 'iot', 'density', 'connectivity'],
-            'V2X': ['vehicle', 'mobility', 'automotive', 'transport']
-        }
-        
-        if context.slice_category in slice_keywords:
-            for keyword in slice_keywords[context.slice_category]:
+        if context.slice_category in SLICE_KEYWORDS:
+            for keyword in SLICE_KEYWORDS[context.slice_category]:
                 if keyword in template_lower:
                     score += 0.2
                     break
         
         # Intent type alignment
-        intent_keywords = {
-            'Deployment Intent': ['deploy', 'provision', 'instantiate', 'launch'],
-            'Modification Intent': ['modify', 'update', 'adjust', 'reconfigure'],
-            'Performance Assurance Intent': ['performance', 'assurance', 'optimize', 'monitor'],
-            'Intent Report Request': ['report', 'analyze', 'generate', 'compile'],
-            'Intent Feasibility Check': ['feasibility', 'assess', 'evaluate', 'analyze'],
-            'Regular Notification Request': ['notification', 'alert', 'monitor', 'notify']
-        }
-        
-        if context.intent_type in intent_keywords:
-            for keyword in intent_keywords[context.intent_type]:
+        if context.intent_type in INTENT_KEYWORDS:
+            for keyword in INTENT_KEYWORDS[context.intent_type]:
                 if keyword in template_lower:
                     score += 0.2
                     break
         
         # Complexity tier alignment
-        complexity_keywords = {
-            'RESEARCH_GRADE': ['research', 'sophisticated', 'advanced', 'cognitive'],
-            'ENTERPRISE_CLASS': ['enterprise', 'production', 'comprehensive'],
-            'PRODUCTION_READY': ['production', 'ready', 'optimized'],
-            'STANDARD': ['standard', 'typical', 'normal'],
-            'BASIC': ['basic', 'simple', 'minimal']
-        }
-        
         complexity_tier = context.metadata.get('complexity_tier', 'STANDARD')
-        if complexity_tier in complexity_keywords:
-            for keyword in complexity_keywords[complexity_tier]:
+        if complexity_tier in COMPLEXITY_TIER_KEYWORDS:
+            for keyword in COMPLEXITY_TIER_KEYWORDS[complexity_tier]:
                 if keyword in template_lower:
                     score += 0.2
                     break
@@ -1141,6 +2032,42 @@ class AdvancedTemplateEngine:
         else:  # Low complexity
             return (low_count * 0.5 + medium_count * 0.3) / max(1, high_count + medium_count + low_count)
     
+    def _render_description(self, template: str, context: TemplateContext,
+                            extracted_params: ParameterExtraction) -> str:
+        """
+        Populate and post-process a template, memoized.
+        
+        Rendering only reads the template, the extraction and a few context
+        fields, so the finished description is cached on exactly those. The
+        extraction enters the key through its render key, so repeated
+        parameter sets (e.g. retries) hit the cache.
+        
+        Args:
+            template: Selected template string
+            context: Template generation context
+            extracted_params: Extracted parameter structure
+            
+        Returns:
+            str: Final description
+        """
+        key = (template, extracted_params.render_key, context.intent_type, context.complexity,
+               context.priority, context.slice_category, context.location_key)
+        cache = self._render_cache
+        with self._cache_lock:
+            description = cache.get(key)
+            if description is not None:
+                cache.move_to_end(key)
+                return description
+        
+        description = self._populate_comprehensive_template(template, context, extracted_params)
+        description = self._apply_post_processing(description, context, extracted_params)
+        
+        with self._cache_lock:
+            cache[key] = description
+            if len(cache) > RENDER_CACHE_SIZE:
+                cache.popitem(last=False)
+        return description
+    
     def _populate_comprehensive_template(self, template: str, context: TemplateContext, 
                                        extracted_params: ParameterExtraction) -> str:
         """
@@ -1160,192 +2087,82 @@ class AdvancedTemplateEngine:
         """
         logger.debug("Starting comprehensive template population")
         
-        description = template
-        
-        # Create comprehensive substitution dictionary with intelligent defaults
-        substitutions = self._create_comprehensive_substitutions(context, extracted_params)
-        
-        # Apply substitutions with error handling
-        for placeholder, value in substitutions.items():
-            if placeholder in description:
-                try:
-                    # Ensure value is string and handle special cases
-                    str_value = self._format_parameter_value(value, placeholder)
-                    description = description.replace(placeholder, str_value)
-                    logger.debug(f"Substituted {placeholder} with {str_value}")
-                except Exception as e:
-                    logger.warning(f"Error substituting {placeholder}: {str(e)}")
-                    description = description.replace(placeholder, 'advanced')
+        # Substitution values are resolved only for placeholders the template
+        # uses; no per-call substitution mapping is built
+        params = extracted_params.flat
+        
+        # Work on a private copy of the extraction's formatted values and
+        # publish it under the lock if this template added any
+        render_key = extracted_params.render_key
+        with self._cache_lock:
+            cached = self._rendered_values.get(render_key)
+            if cached is not None:
+                self._rendered_values.move_to_end(render_key)
+        rendered = dict(cached) if cached else {}
+        cached_count = len(rendered)
+        
+        def substitute(placeholder: str) -> str:
+            # Parameter-backed placeholders are formatted once per extraction
+            text = rendered.get(placeholder)
+            if text is not None:
+                return text
+            value = self._resolve_substitution(placeholder, context, params)
+            if value is _MISSING:
+                # Unknown placeholders get the same generic filler that
+                # post-processing would scrub them to, without a second pass
+                return 'advanced'
+            try:
+                # Ensure value is string and handle special cases
+                text = self._format_parameter_value(value, placeholder)
+            except Exception as e:
+                logger.warning("Error substituting %s: %s", placeholder, e)
+                text = 'advanced'
+            if placeholder in self._EXTRACTION_PLACEHOLDERS:
+                rendered[placeholder] = text
+            return text
+        
+        # Render from the pre-split template; only placeholders it uses are
+        # formatted and unknown ones are filled in the same pass
+        literals, placeholders = _compile_template(template)
+        description = render_template(literals, placeholders, substitute)
+        
+        if len(rendered) > cached_count:
+            with self._cache_lock:
+                self._rendered_values[render_key] = rendered
+                self._rendered_values.move_to_end(render_key)
+                if len(self._rendered_values) > EXTRACTION_CACHE_SIZE:
+                    self._rendered_values.popitem(last=False)
         
         logger.debug("Template population completed")
         return description
     
-    def _create_comprehensive_substitutions(self, context: TemplateContext, 
-                                          extracted_params: ParameterExtraction) -> Dict[str, Any]:
+    def _resolve_substitution(self, placeholder: str, context: TemplateContext,
+                              params: Dict[str, Any]) -> Any:
         """
-        Create comprehensive substitution dictionary with intelligent parameter mapping.
+        Resolve the substitution value of a single placeholder.
+        
+        Parameter placeholders take their extracted value or their default
+        from PARAMETER_PATHS; context placeholders are computed from the
+        context.
         
         Args:
+            placeholder: Placeholder including braces, e.g. '{architecture}'
             context: Template generation context
-            extracted_params: Extracted parameter structure
+            params: Flat extracted parameters
             
         Returns:
-            Dict[str, Any]: Comprehensive substitution mapping
+            The raw substitution value, or _MISSING for unknown placeholders
         """
-        substitutions = {}
-        
-        # Context-based substitutions
-        substitutions.update({
-            '{intent_type}': context.intent_type.lower().replace('_', ' '),
-            '{complexity_level}': self._get_complexity_description(context.complexity),
-            '{priority_level}': context.priority.lower(),
-            '{slice_category}': self._get_slice_description(context.slice_category),
-            '{location_category}': self._get_location_description(context.location_category),
-        })
-        
-        # Network parameter substitutions
-        substitutions.update({
-            '{architecture}': extracted_params.network_params.get('architecture', 'Standalone_5G'),
-            '{deployment_scenario}': extracted_params.network_params.get('deployment_scenario', 'Urban_Macro'),
-            '{low_band}': extracted_params.network_params.get('low_band', '700MHz'),
-            '{mid_band}': extracted_params.network_params.get('mid_band', '3.5GHz'),
-            '{high_band}': extracted_params.network_params.get('high_band', '28GHz'),
-            '{antenna_type}': extracted_params.network_params.get('antenna_type', 'Massive_MIMO_64T64R'),
-            '{beamforming}': extracted_params.network_params.get('beamforming', '3D_Beamforming'),
-            '{sectorization}': extracted_params.network_params.get('sectorization', '6_Sector'),
-            '{backhaul_type}': extracted_params.network_params.get('backhaul_type', 'Fiber_Optic'),
-            '{backhaul_capacity}': extracted_params.network_params.get('backhaul_capacity', '10Gbps'),
-            '{backhaul_latency}': extracted_params.network_params.get('backhaul_latency', '1ms'),
-            '{redundancy}': extracted_params.network_params.get('redundancy', 'Active_Active'),
-        })
-        
-        # QoS parameter substitutions
-        substitutions.update({
-            '{flow_id}': extracted_params.qos_params.get('flow_id', '5QI_1_Conversational_Voice'),
-            '{guaranteed_bitrate}': extracted_params.qos_params.get('guaranteed_bitrate', '100Mbps'),
-            '{maximum_bitrate}': extracted_params.qos_params.get('maximum_bitrate', '1000Mbps'),
-            '{packet_delay}': extracted_params.qos_params.get('packet_delay', '10ms'),
-            '{packet_error_rate}': extracted_params.qos_params.get('packet_error_rate', '0.001'),
-            '{priority_level_num}': str(extracted_params.qos_params.get('priority_level', 15)),
-            '{preemption_capability}': extracted_params.qos_params.get('preemption_capability', 'MAY_PREEMPT'),
-            '{reflective_qos}': extracted_params.qos_params.get('reflective_qos', 'ENABLED'),
-            '{jitter_tolerance}': extracted_params.qos_params.get('jitter_tolerance', '2ms'),
-            '{averaging_window}': extracted_params.qos_params.get('averaging_window', '5000ms'),
-        })
-        
-        # Security parameter substitutions
-        substitutions.update({
-            '{auth_method}': extracted_params.security_params.get('auth_method', '5G_AKA'),
-            '{encryption}': extracted_params.security_params.get('encryption', '256_NEA1'),
-            '{integrity}': extracted_params.security_params.get('integrity', '256_NIA1'),
-            '{kdf}': extracted_params.security_params.get('kdf', 'HMAC_SHA256'),
-            '{key_length}': extracted_params.security_params.get('key_length', '256_bit'),
-            '{key_rotation}': extracted_params.security_params.get('key_rotation', '6hours'),
-            '{supi_concealment}': extracted_params.security_params.get('supi_concealment', 'ENABLED'),
-            '{location_privacy}': extracted_params.security_params.get('location_privacy', 'FULL_PROTECTION'),
-            '{zero_trust_identity}': extracted_params.security_params.get('zero_trust_identity', 'continuous_behavioral_authentication'),
-            '{device_trust}': extracted_params.security_params.get('device_trust', 'hardware_based_attestation'),
-        })
-        
-        # Resource parameter substitutions
-        substitutions.update({
-            '{cpu_arch}': extracted_params.resource_params.get('cpu_arch', 'x86_64'),
-            '{cpu_cores}': str(extracted_params.resource_params.get('cpu_cores', 8)),
-            '{cpu_frequency}': extracted_params.resource_params.get('cpu_frequency', '3.0GHz'),
-            '{memory_size}': extracted_params.resource_params.get('memory_size', '32GB'),
-            '{memory_type}': extracted_params.resource_params.get('memory_type', 'DDR4'),
-            '{storage_capacity}': extracted_params.resource_params.get('storage_capacity', '1000GB'),
-            '{storage_type}': extracted_params.resource_params.get('storage_type', 'NVMe_SSD'),
-            '{bandwidth_allocation}': extracted_params.resource_params.get('bandwidth_allocation', '1000Mbps'),
-            '{latency_requirement}': extracted_params.resource_params.get('latency_requirement', '5ms'),
-            '{connection_density}': extracted_params.resource_params.get('connection_density', '100000_devices_per_km2'),
-            '{hypervisor}': extracted_params.resource_params.get('hypervisor', 'KVM'),
-            '{container_runtime}': extracted_params.resource_params.get('container_runtime', 'Docker'),
-            '{orchestration_platform}': extracted_params.resource_params.get('orchestration_platform', 'Kubernetes'),
-            '{ai_prediction_model}': extracted_params.resource_params.get('ai_prediction_model', 'lstm_with_attention_mechanism'),
-            '{optimization_algorithm}': extracted_params.resource_params.get('optimization_algorithm', 'multi_objective_genetic_algorithm'),
-            '{adaptation_speed}': extracted_params.resource_params.get('adaptation_speed', '500ms'),
-            '{accuracy_level}': extracted_params.resource_params.get('accuracy_level', '95%'),
-        })
-        
-        # Monitoring parameter substitutions
-        substitutions.update({
-            '{sampling_rate}': extracted_params.monitoring_params.get('sampling_rate', '50%'),
-            '{aggregation_interval}': extracted_params.monitoring_params.get('aggregation_interval', '30seconds'),
-            '{retention_period}': extracted_params.monitoring_params.get('retention_period', '90days'),
-            '{compression_ratio}': extracted_params.monitoring_params.get('compression_ratio', '5:1'),
-            '{anomaly_detection}': extracted_params.monitoring_params.get('anomaly_detection', 'Isolation_Forest'),
-            '{predictive_analytics}': extracted_params.monitoring_params.get('predictive_analytics', 'LSTM_Autoencoder'),
-            '{optimization_algo}': extracted_params.monitoring_params.get('optimization_algo', 'Genetic_Algorithm'),
-            '{escalation_l1}': extracted_params.monitoring_params.get('escalation_l1', '2minutes'),
-            '{escalation_l2}': extracted_params.monitoring_params.get('escalation_l2', '10minutes'),
-            '{escalation_l3}': extracted_params.monitoring_params.get('escalation_l3', '30minutes'),
-            '{notification_channels}': extracted_params.monitoring_params.get('notification_channels', 'REST_API'),
-        })
-        
-        # Orchestration parameter substitutions
-        substitutions.update({
-            '{nfvo_id}': extracted_params.orchestration_params.get('nfvo_id', 'nfvo_default'),
-            '{vnfm_id}': extracted_params.orchestration_params.get('vnfm_id', 'vnfm_default'),
-            '{vim_id}': extracted_params.orchestration_params.get('vim_id', 'vim_default'),
-            '{workflow_id}': extracted_params.orchestration_params.get('workflow_id', 'workflow_default'),
-            '{workflow_version}': extracted_params.orchestration_params.get('workflow_version', '1.0'),
-            '{execution_timeout}': extracted_params.orchestration_params.get('execution_timeout', '1800seconds'),
-            '{rollback_strategy}': extracted_params.orchestration_params.get('rollback_strategy', 'AUTOMATIC'),
-            '{vnf_provider}': extracted_params.orchestration_params.get('vnf_provider', 'Ericsson'),
-            '{vnf_version}': extracted_params.orchestration_params.get('vnf_version', 'SW_1.0.0'),
-            '{deployment_flavor}': extracted_params.orchestration_params.get('deployment_flavor', 'High_Performance_Compute_Optimized'),
-            '{min_instances}': str(extracted_params.orchestration_params.get('min_instances', 2)),
-            '{max_instances}': str(extracted_params.orchestration_params.get('max_instances', 20)),
-            '{network_function}': extracted_params.orchestration_params.get('network_function', 'AMF'),
-        })
-        
-        # Performance parameter substitutions
-        substitutions.update({
-            '{throughput_req}': extracted_params.performance_params.get('throughput_req', '1000Mbps'),
-            '{latency_req}': extracted_params.performance_params.get('latency_req', '5ms'),
-            '{availability_req}': extracted_params.performance_params.get('availability_req', '99.99%'),
-            '{reliability_req}': extracted_params.performance_params.get('reliability_req', '99.9%'),
-            '{horizontal_scaling}': extracted_params.performance_params.get('horizontal_scaling', '100instances'),
-            '{vertical_scaling}': extracted_params.performance_params.get('vertical_scaling', '32cores'),
-            '{auto_scaling_policy}': extracted_params.performance_params.get('auto_scaling_policy', 'CPU_BASED'),
-            '{sla_type}': extracted_params.performance_params.get('sla_type', 'GOLD_TIER'),
-            '{mttr}': extracted_params.performance_params.get('mttr', '60minutes'),
-            '{mtbf}': extracted_params.performance_params.get('mtbf', '2160hours'),
-        })
-        
-        # Deployment parameter substitutions
-        substitutions.update({
-            '{service_level}': extracted_params.deployment_params.get('service_level', 'PLATINUM'),
-            '{tenant_id}': extracted_params.deployment_params.get('tenant_id', 'TENANT_12345'),
-            '{correlation_id}': extracted_params.deployment_params.get('correlation_id', 'CORR_default'),
-            '{instantiation_timeout}': extracted_params.deployment_params.get('instantiation_timeout', '600seconds'),
-            '{rollback_on_failure}': extracted_params.deployment_params.get('rollback_on_failure', 'true'),
-            '{anti_affinity}': extracted_params.deployment_params.get('anti_affinity', 'HOST'),
-            '{affinity}': extracted_params.deployment_params.get('affinity', 'HARD'),
-        })
-        
-        # Advanced parameter substitutions
-        cloud_providers = extracted_params.advanced_params.get('cloud_providers', ['AWS', 'Azure'])
-        if isinstance(cloud_providers, list):
-            cloud_providers_str = ', '.join(cloud_providers)
-        else:
-            cloud_providers_str = str(cloud_providers)
-        
-        substitutions.update({
-            '{cloud_providers}': cloud_providers_str,
-            '{hybrid_strategy}': extracted_params.advanced_params.get('hybrid_strategy', 'CLOUD_FIRST'),
-            '{edge_strategy}': extracted_params.advanced_params.get('edge_strategy', 'DISTRIBUTED'),
-            '{workflow_engine}': extracted_params.advanced_params.get('workflow_engine', 'Airflow'),
-            '{mesh_technology}': extracted_params.advanced_params.get('mesh_technology', 'Istio'),
-            '{load_balancing}': extracted_params.advanced_params.get('load_balancing', 'ROUND_ROBIN'),
-            '{circuit_breaker}': extracted_params.advanced_params.get('circuit_breaker', 'ENABLED'),
-            '{distributed_tracing}': extracted_params.advanced_params.get('distributed_tracing', 'Jaeger'),
-            '{automation_level}': extracted_params.advanced_params.get('automation_level', 'FULLY_AUTOMATED'),
-            '{iac_tool}': extracted_params.advanced_params.get('iac_tool', 'Terraform'),
-        })
-        
-        return substitutions
+        spec = self._PARAMETER_PLACEHOLDERS.get(placeholder)
+        if spec is not None:
+            _, key, default = spec
+            return params.get(key, default)
+        resolve = self._CONTEXT_RESOLVERS.get(placeholder)
+        if resolve is not None:
+            return resolve(context)
+        if placeholder == self._CLOUD_PROVIDERS_PLACEHOLDER:
+            return _join_cloud_providers(params)
+        return _MISSING
     
     def _format_parameter_value(self, value: Any, placeholder: str) -> str:
         """
@@ -1358,24 +2175,9 @@ class AdvancedTemplateEngine:
         Returns:
             str: Formatted parameter value
         """
-        if value is None:
-            return 'advanced'
-        
-        # Handle different value types
-        if isinstance(value, bool):
-            return 'enabled' if value else 'disabled'
-        elif isinstance(value, (int, float)):
-            return str(value)
-        elif isinstance(value, list):
-            return ', '.join(str(item) for item in value)
-        elif isinstance(value, dict):
-            return str(value)
-        else:
-            # String handling with cleanup
-            str_value = str(value).strip()
-            if not str_value or str_value.lower() in ['none', 'null', 'undefined']:
-                return 'advanced'
-            return str_value
+        # Dispatch on the exact type; anything unlisted is treated as text
+        formatter = _VALUE_FORMATTERS.get(type(value), _format_text_value)
+        return formatter(value)
     
     def _apply_post_processing(self, description: str, context: TemplateContext, 
                              extracted_params: ParameterExtraction) -> str:
@@ -1395,68 +2197,29 @@ class AdvancedTemplateEngine:
         """
         logger.debug("Applying post-processing enhancements")
         
-        # Clean up any remaining placeholders
-        description = re.sub(r'\{[^}]+\}', 'advanced', description)
-        
-        # Apply complexity-specific enhancements
-        if context.complexity >= 9:
-            description = description.replace('advanced', 'research-grade sophisticated')
-            description = description.replace('standard', 'cutting-edge')
-        elif context.complexity >= 8:
-            description = description.replace('advanced', 'enterprise-class advanced')
-            description = description.replace('standard', 'production-grade')
-        elif context.complexity >= 7:
-            description = description.replace('advanced', 'production-ready comprehensive')
-        
-        # Apply priority-specific language enhancements
-        if context.priority in ['CRITICAL', 'EMERGENCY']:
-            description = description.replace('with', 'with mission-critical')
-            description = description.replace('using', 'using fault-tolerant')
-        elif context.priority == 'HIGH':
-            description = description.replace('with', 'with high-priority')
-        
-        # Apply slice-specific enhancements
-        slice_enhancements = {
-            'URLLC': {
-                'latency': 'ultra-low latency',
-                'reliable': 'ultra-reliable',
-                'performance': 'deterministic performance'
-            },
-            'eMBB': {
-                'throughput': 'high-throughput',
-                'capacity': 'high-capacity',
-                'bandwidth': 'broadband'
-            },
-            'mMTC': {
-                'connectivity': 'massive connectivity',
-                'density': 'high-density',
-                'iot': 'massive IoT'
-            },
-            'V2X': {
-                'mobility': 'vehicular mobility',
-                'latency': 'automotive-grade latency',
-                'safety': 'safety-critical'
-            }
-        }
-        
-        if context.slice_category in slice_enhancements:
-            for original, enhanced in slice_enhancements[context.slice_category].items():
-                description = description.replace(original, enhanced)
-        
-        # Ensure proper capitalization and formatting
-        description = description.strip()
-        if description and not description[0].isupper():
+        # Clean up any remaining placeholders (population already fills unknown
+        # ones, so these can only come from brace-like parameter values);
+        # descriptions without braces (the common case) skip the regex scan
+        if '{' in description:
+            description = _PLACEHOLDER_RE.sub('advanced', description)
+        
+        # Apply complexity, priority and slice-specific enhancements, then
+        # remove duplicate words and collapse whitespace
+        rewrite = _build_rewriter(context.complexity, context.priority, context.slice_category)
+        description = rewrite(description)
+        
+        # Ensure proper capitalization (templates are ASCII). The rewrite has
+        # already stripped surrounding whitespace, and every registry template
+        # starts with a capital, so this only allocates for ad-hoc text
+        if description and 'a' <= description[0] <= 'z':
             description = description[0].upper() + description[1:]
         
-        # Remove duplicate words and clean up spacing
-        description = re.sub(r'\s+', ' ', description)  # Multiple spaces to single
-        description = re.sub(r'\b(\w+)\s+\1\b', r'\1', description)  # Remove duplicate words
-        
-        # Ensure description ends properly
-        if description and not description.endswith(('.', '!', '?')):
+        # Ensure description ends properly; an empty slice is "in" any string,
+        # so empty descriptions are left untouched
+        if description[-1:] not in '.!?':
             description += '.'
         
-        logger.debug(f"Post-processing completed, final length: {len(description)}")
+        logger.debug("Post-processing completed, final length: %d", len(description))
         return description
     
     def _generate_fallback_description(self, context: TemplateContext) -> str:
@@ -1471,171 +2234,33 @@ class AdvancedTemplateEngine:
         """
         logger.warning("Generating fallback description")
         
-        fallback_templates = [
-            f"Execute {context.complexity_level} {context.intent_type.lower()} for {context.slice_category} slice with {context.priority.lower()} priority in {context.location_category} environment.",
-            f"Deploy advanced {context.slice_category} network service with comprehensive orchestration and monitoring capabilities.",
-            f"Implement {context.priority.lower()} priority {context.intent_type.lower()} with intelligent resource allocation and security controls.",
-            f"Provision {context.complexity_level} network infrastructure supporting {context.slice_category} requirements with automated lifecycle management."
-        ]
-        
-        return random.choice(fallback_templates)
-    
-    def _get_location_description(self, location_category: str) -> str:
-        """
-        Get enhanced location description with comprehensive mapping.
-        
-        Args:
-            location_category: Location category identifier
-            
-        Returns:
-            str: Enhanced location description
-        """
-        location_descriptions = {
-            'urban': 'high-density metropolitan zone with complex RF environment',
-            'rural': 'extended coverage rural area with challenging propagation conditions',
-            'highway': 'high-mobility corridor requiring seamless handover capabilities',
-            'industrial': 'industrial automation facility with deterministic communication needs',
-            'campus': 'enterprise campus environment with diverse service requirements',
-            'stadium': 'high-capacity venue supporting massive user density',
-            'airport': 'critical transport hub with stringent reliability requirements',
-            'smart_city': 'intelligent urban ecosystem with integrated IoT infrastructure',
-            'port': 'maritime logistics facility with specialized connectivity needs',
-            'mining': 'remote mining operation requiring robust and reliable connectivity',
-            'healthcare': 'medical facility with ultra-reliable communication requirements',
-            'education': 'educational institution supporting diverse digital learning needs'
-        }
-        
-        return location_descriptions.get(
-            location_category.lower(), 
-            f'advanced deployment location ({location_category})'
-        )
-    
-    def _get_slice_description(self, slice_category: str) -> str:
-        """
-        Get enhanced slice description with comprehensive characteristics.
-        
-        Args:
-            slice_category: Network slice category
-            
-        Returns:
-            str: Enhanced slice description
-        """
-        slice_descriptions = {
-            'eMBB': 'enhanced mobile broadband with high-throughput data services',
-            'URLLC': 'ultra-reliable low-latency communications for mission-critical applications',
-            'mMTC': 'massive machine-type communications supporting IoT ecosystems',
-            'V2X': 'vehicle-to-everything connectivity enabling autonomous transportation',
-            'AR_VR': 'immersive reality services requiring ultra-low latency and high bandwidth',
-            'IoT': 'internet of things connectivity with diverse device requirements',
-            'Mission_Critical': 'mission-critical services with stringent reliability requirements',
-            'Private_Network': 'private network slice with dedicated resources and security',
-            'Edge_Computing': 'edge computing slice with distributed processing capabilities',
-            'Smart_Manufacturing': 'smart manufacturing slice supporting Industry 4.0 applications',
-            'Public_Safety': 'public safety communications with priority access and reliability',
-            'Energy_Utilities': 'energy and utilities slice supporting smart grid applications'
-        }
-        
-        return slice_descriptions.get(
-            slice_category, 
-            f'advanced network slice ({slice_category})'
-        )
-    
-    def _get_complexity_description(self, complexity: int) -> str:
-        """
-        Get enhanced complexity description with detailed characterization.
-        
-        Args:
-            complexity: Complexity level (1-10)
-            
-        Returns:
-            str: Enhanced complexity description
-        """
-        complexity_descriptions = {
-            10: 'research-grade sophisticated with cutting-edge innovations',
-            9: 'research-grade sophisticated with advanced AI integration',
-            8: 'enterprise-class advanced with comprehensive automation',
-            7: 'production-ready comprehensive with intelligent optimization',
-            6: 'production-ready comprehensive with standard automation',
-            5: 'standard optimized with enhanced monitoring capabilities',
-            4: 'standard optimized with basic automation features',
-            3: 'basic streamlined with essential monitoring',
-            2: 'basic streamlined with minimal complexity',
-            1: 'basic streamlined with fundamental capabilities'
-        }
-        
-        return complexity_descriptions.get(
-            complexity, 
-            f'complexity-level-{complexity} optimized'
+        # Pick first so only the chosen format is rendered
+        return self._rng.choice(self._FALLBACK_FORMATS).format(
+            complexity_level=_get_complexity_description(context.complexity),
+            intent_type=context.intent_type.lower(),
+            slice_category=context.slice_category,
+            priority=context.priority.lower(),
+            location_category=context.location_category
         )
-    
-    def _initialize_parameter_patterns(self) -> Dict[str, List[str]]:
-        """
-        Initialize comprehensive parameter extraction patterns for intelligent parsing.
-        
-        Returns:
-            Dict mapping pattern categories to extraction paths
-        """
-        return {
-            'network_topology': [
-                'network_topology.network_architecture',
-                'network_topology.deployment_scenario',
-                'network_topology.spectrum_bands.*',
-                'network_topology.antenna_configuration.*',
-                'network_topology.backhaul.*'
-            ],
-            'qos_parameters': [
-                'qos_parameters.qos_flow_identifier',
-                'qos_parameters.*_bit_rate',
-                'qos_parameters.packet_delay_budget',
-                'qos_parameters.packet_error_rate',
-                'qos_parameters.priority_level',
-                'qos_parameters.preemption_capability',
-                'qos_parameters.reflective_qos'
-            ],
-            'security_parameters': [
-                'security_parameters.authentication_method',
-                'security_parameters.encryption_algorithm',
-                'security_parameters.integrity_protection',
-                'security_parameters.key_management.*',
-                'security_parameters.privacy_protection.*',
-                'security_parameters.zero_trust_architecture.*'
-            ],
-            'resource_allocation': [
-                'resource_allocation.compute_resources.*',
-                'resource_allocation.network_resources.*',
-                'resource_allocation.virtualization_parameters.*',
-                'resource_allocation.ai_driven_resource_allocation.*'
-            ],
-            'monitoring_parameters': [
-                'monitoring_parameters.analytics_configuration.*',
-                'monitoring_parameters.alerting_configuration.*'
-            ],
-            'orchestration_parameters': [
-                'orchestration_parameters.*',
-                'deployment_specification.*'
-            ],
-            'performance_requirements': [
-                'performance_requirements.*',
-                'performance_objectives.*'
-            ],
-            'advanced_parameters': [
-                'advanced_orchestration_parameters.*',
-                'advanced_deployment_specification.*'
-            ]
-        }
-    
-    def _initialize_scoring_weights(self) -> Dict[str, float]:
-        """
-        Initialize template scoring weights for optimization algorithms.
-        
-        Returns:
-            Dict mapping scoring criteria to weights
-        """
-        return {
-            'parameter_utilization': 0.4,
-            'context_alignment': 0.35,
-            'complexity_match': 0.25,
-            'priority_bonus': 0.1,
-            'slice_specificity': 0.1,
-            'advanced_features': 0.05
-        }
+
+
+# Engine owned by each generate_descriptions_parallel worker process
+_parallel_engine: Optional[AdvancedTemplateEngine] = None
+
+
+def _init_parallel_worker(template_registry: Dict[str, Sequence[str]]) -> None:
+    """Create the worker's engine with the parent engine's template registry."""
+    global _parallel_engine
+    engine = AdvancedTemplateEngine(rng=random.Random())
+    engine.template_registry = template_registry
+    _parallel_engine = engine
+
+
+def _generate_parallel_chunk(chunk: Tuple[int, List[TemplateContext]]) -> List[Tuple[str, str]]:
+    """Generate one (seed, contexts) chunk with the worker's engine."""
+    engine = _parallel_engine
+    if engine is None:
+        raise RuntimeError("Parallel worker engine is not initialized")
+    seed, contexts = chunk
+    engine._rng.seed(seed)
+    return engine.generate_descriptions_batch(contexts)
@@ -0,0 +1,112 @@
+"""
+Hot-path kernels for the Advanced Template Engine
+
+This module holds the small, fully typed loops that dominate description
+generation time: walking parameter paths during extraction, joining
+pre-split templates with their values and cleaning up rendered
+descriptions. It deliberately depends on nothing but the standard library
+so it can be compiled to a C extension with mypyc (requires mypy at build
+time):
+
+    pip install mypy
+    IBN_COMPILE_KERNELS=1 pip install -e .
+
+When no compiled build is present, Python imports this file as-is, so the
+kernels always behave identically with or without compilation.
+"""
+from typing import Any, Callable, Dict, List, Tuple
+
+# Extraction spec: (parameter key, dotted path, path split into keys, default)
+PathSpec = Tuple[str, str, Tuple[str, ...], Any]
+
+
+class _Missing:
+    """Marker type for parameter paths that are not present."""
+
+
+# Sentinel distinguishing missing keys from explicit None values
+MISSING = _Missing()
+
+
+def extract_flat(parameters: Dict[str, Any],
+                 specs: Tuple[PathSpec, ...]) -> Tuple[Dict[str, Any], List[Tuple[str, Any]]]:
+    """
+    Resolve every extraction spec against a nested parameter dictionary.
+
+    Args:
+        parameters: Raw parameter dictionary from intent specification
+        specs: Extraction specs, with dotted paths already split into keys
+
+    Returns:
+        tuple: (flat parameter dict keyed by parameter name,
+                (path, default) pairs for every path that fell back to its default)
+    """
+    flat: Dict[str, Any] = {}
+    defaulted: List[Tuple[str, Any]] = []
+    for key, path, keys, default in specs:
+        # Walk the pre-split path with plain subscripts; a missing key or a
+        # level that is not a mapping (e.g. a string) ends the walk
+        current: Any = parameters
+        try:
+            for part in keys:
+                current = current[part]
+        except (KeyError, TypeError):
+            defaulted.append((path, default))
+            current = default
+        flat[key] = current
+    return flat, defaulted
+
+
+def dedupe_tokens(description: str) -> str:
+    """
+    Collapse whitespace and drop immediately repeated words in one linear pass.
+    
+    A token is dropped when the next token repeats it, either exactly or as
+    the start of a compound or punctuated word ('high high-throughput'
+    becomes 'high-throughput').
+    """
+    tokens = description.split()
+    if not tokens:
+        return ''
+    out = [tokens[0]]
+    prev = tokens[0]
+    for token in tokens[1:]:
+        if token != prev:
+            if _repeats_word(prev, token):
+                out[-1] = token
+            else:
+                out.append(token)
+        prev = token
+    return ' '.join(out)
+
+
+def _is_word_char(char: str) -> bool:
+    """Return whether char is a regex word character (\\w)."""
+    return char.isalnum() or char == '_'
+
+
+def _repeats_word(word: str, token: str) -> bool:
+    """Return whether token starts with word followed by a non-word character."""
+    size = len(word)
+    return (len(token) > size and token.startswith(word)
+            and _is_word_char(word[-1]) and not _is_word_char(token[size]))
+
+
+def render_template(literals: Tuple[str, ...], placeholders: Tuple[str, ...],
+                    substitute: Callable[[str], str]) -> str:
+    """
+    Join a pre-split template's literals with its substituted placeholders.
+
+    Args:
+        literals: Literal segments, one more than there are placeholders
+        placeholders: Placeholders in template order
+        substitute: Returns the text for a placeholder
+
+    Returns:
+        str: Rendered template
+    """
+    parts: List[str] = [literals[0]]
+    for i in range(len(placeholders)):
+        parts.append(substitute(placeholders[i]))
+        parts.append(literals[i + 1])
+    return ''.join(parts)
@@ -2,7 +2,10 @@ import uuid
 import time
 import random
 from datetime import datetime, timedelta
-from typing import List, Any
+from typing import List, Any, Dict, Tuple
+
+# Marks a missing key in get_nested without allocating a default per level
+_MISSING = object()
 
 def generate_unique_id(prefix: str = "IBN") -> str:
     """Generate a unique identifier for intent records."""
@@ -10,6 +13,16 @@ def generate_unique_id(prefix: str = "IBN") -> str:
     random_part = uuid.uuid4().hex[:12]
     return f"{prefix}_{timestamp}_{random_part}"
 
+def get_nested(data: Dict[str, Any], path: Tuple[str, ...], default: Any = None) -> Any:
+    """Look up a nested key path, returning default if any level is missing or not a dict."""
+    for key in path:
+        if not isinstance(data, dict):
+            return default
+        data = data.get(key, _MISSING)
+        if data is _MISSING:
+            return default
+    return data
+
 def random_choice(items: List[Any]) -> Any:
     """Select a random item from a list."""
     return random.choice(items)
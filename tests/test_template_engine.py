@@ -0,0 +1,432 @@
+"""
+Unit tests for Template_Engine.
+"""
+import dataclasses
+import random
+import sys
+
+import pytest
+from src.Intents_Generators.Template_Engine import (
+    AdvancedTemplateEngine,
+    COMPLEXITY_ENHANCEMENTS,
+    PRIORITY_ENHANCEMENTS,
+    ParameterExtraction,
+    SLICE_ENHANCEMENTS,
+    TemplateContext,
+    _build_rewriter,
+    _compile_template,
+    _get_complexity_description,
+)
+from src.Intents_Generators.Template_Kernels import MISSING
+
+
+def make_context(**overrides):
+    """Build a TemplateContext with sensible defaults."""
+    values = {
+        'intent_type': 'Deployment Intent',
+        'complexity': 7,
+        'priority': 'high',
+        'slice_category': 'URLLC',
+        'location_category': 'urban',
+        'parameters': {},
+    }
+    values.update(overrides)
+    return TemplateContext(**values)
+
+
+class TestTemplateContext:
+    """Test suite for TemplateContext."""
+
+    def test_normalization(self):
+        """Test that complexity is clamped and priority normalized."""
+        context = make_context(complexity=42, priority='bogus')
+        assert context.complexity == 10
+        assert context.priority == 'MEDIUM'
+        assert context.metadata['complexity_tier'] == 'RESEARCH_GRADE'
+
+    def test_location_key(self):
+        """Test that the location key is canonicalized once and not compared."""
+        context = make_context(location_category='Urban')
+        assert context.location_key == 'urban'
+        assert context == make_context(location_category='Urban')
+
+    def test_slots(self):
+        """Test that contexts use slots instead of a per-instance __dict__."""
+        context = make_context()
+        assert not hasattr(context, '__dict__')
+        assert 'location_key' in TemplateContext.__slots__
+
+    def test_frozen(self):
+        """Test that context fields cannot be reassigned."""
+        context = make_context()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            context.complexity = 3
+
+    def test_hashable(self):
+        """Test that equal contexts hash equally despite dict fields."""
+        first = make_context(parameters={'tenant_id': 'T1'})
+        second = make_context(parameters={'tenant_id': 'T1'})
+        assert first == second
+        assert hash(first) == hash(second)
+        assert len({first, second}) == 1
+
+
+class TestParameterExtraction:
+    """Test suite for ParameterExtraction."""
+
+    def test_identity_hash(self):
+        """Test that extractions hash by identity."""
+        first = ParameterExtraction.from_categories(network_params={'architecture': 'NSA'})
+        second = ParameterExtraction.from_categories(network_params={'architecture': 'NSA'})
+        assert first != second
+        assert len({first, second}) == 2
+
+    def test_slots(self):
+        """Test that extractions use slots instead of a per-instance __dict__."""
+        extraction = ParameterExtraction()
+        assert not hasattr(extraction, '__dict__')
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            extraction.flat = {}
+
+    def test_get_all_parameters(self):
+        """Test that all categories are merged."""
+        extraction = ParameterExtraction.from_categories(
+            network_params={'architecture': 'NSA'},
+            qos_params={'flow_id': '5QI_9'},
+        )
+        assert extraction.get_all_parameters() == {'architecture': 'NSA', 'flow_id': '5QI_9'}
+        assert extraction.get_parameter_count()['network'] == 1
+        assert extraction.get_parameter_count()['security'] == 0
+        assert extraction.qos_params == {'flow_id': '5QI_9'}
+
+    def test_get_all_parameters_cached(self):
+        """Test that the merged parameters are built only once."""
+        extraction = ParameterExtraction.from_categories(network_params={'architecture': 'NSA'})
+        assert extraction.get_all_parameters() is extraction.get_all_parameters()
+
+
+class TestAdvancedTemplateEngine:
+    """Test suite for AdvancedTemplateEngine."""
+
+    @pytest.fixture
+    def engine(self):
+        """Create an engine instance for testing."""
+        return AdvancedTemplateEngine()
+
+    def test_generate_description(self, engine):
+        """Test that a description is generated from a registered template."""
+        description, template = engine.generate_description(make_context())
+        assert description
+        assert template != "FALLBACK_TEMPLATE"
+        assert '{' not in description
+        assert description.endswith(('.', '!', '?'))
+
+    def test_all_intent_types(self, engine):
+        """Test that every registered intent type produces a description."""
+        for intent_type in engine.template_registry:
+            description, template = engine.generate_description(make_context(intent_type=intent_type))
+            assert description
+            assert template in engine.template_registry[intent_type]
+
+    def test_templates_start_capitalized(self, engine):
+        """Test that registry templates need no runtime capitalization."""
+        for templates in engine.template_registry.values():
+            for template in templates:
+                assert template[:1].isupper()
+    
+    def test_extract_parameters(self, engine):
+        """Test nested path extraction with defaults for missing or non-dict levels."""
+        extracted = engine._extract_comprehensive_parameters({
+            'network_topology': {'network_architecture': 'NSA', 'spectrum_bands': 'n78'},
+            'qos_parameters': {'priority_level': None},
+        })
+        assert extracted.network_params['architecture'] == 'NSA'
+        assert extracted.network_params['low_band'] == '700MHz'
+        assert extracted.qos_params['priority_level'] is None
+        assert extracted.advanced_params['cloud_providers'] == ['AWS', 'Azure']
+    
+    def test_extract_interns_categorical_values(self, engine):
+        """Test that categorical string values are interned at extraction."""
+        architecture = ''.join(['N', 'SA'])
+        extracted = engine._extract_comprehensive_parameters(
+            {'network_topology': {'network_architecture': architecture}}
+        )
+        assert extracted.network_params['architecture'] is sys.intern('NSA')
+
+    def test_render_key(self, engine):
+        """Test that extractions with the same extracted content share a render key."""
+        parameters = {'network_topology': {'network_architecture': 'NSA'}}
+        key = engine._extract_comprehensive_parameters(parameters).render_key
+        retry = dict(parameters, variation_seed=1)
+        assert engine._extract_comprehensive_parameters(retry).render_key == key
+        assert engine._extract_comprehensive_parameters({'network_topology': {'network_architecture': 'NSA'}}).render_key == key
+        parameters['network_topology']['network_architecture'] = 'SA'
+        assert engine._extract_comprehensive_parameters(parameters).render_key != key
+        manual = ParameterExtraction.from_categories(network_params={'architecture': 'NSA'})
+        assert manual.content_key is None and manual.render_key is manual
+
+    def test_render_key_tracks_list_leaves_and_types(self, engine):
+        """Test that in-place list changes and value types are part of the render key."""
+        providers = ['GCP']
+        parameters = {'advanced_orchestration_parameters': {'multi_cloud_orchestration': {'cloud_providers': providers}}}
+        key = engine._extract_comprehensive_parameters(parameters).render_key
+        providers.append('OCI')
+        assert engine._extract_comprehensive_parameters(parameters).render_key != key
+        assert engine._extract_comprehensive_parameters({'tenant_id': 1}).render_key != \
+            engine._extract_comprehensive_parameters({'tenant_id': 1.0}).render_key
+        unhashable = engine._extract_comprehensive_parameters({'tenant_id': {'id': 1}})
+        assert unhashable.render_key is unhashable
+
+    def test_extraction_logs_defaults(self, engine, monkeypatch):
+        """Test that default usage is reported on every extraction."""
+        from src import validation
+        logged = []
+        monkeypatch.setattr(validation.get_validator(), 'log_default_usage',
+                            lambda path, default, reason='': logged.append(path))
+        engine._extract_comprehensive_parameters({'tenant_id': 'T1'})
+        first = len(logged)
+        engine._extract_comprehensive_parameters({'tenant_id': 'T1'})
+        assert first > 0 and len(logged) == 2 * first
+
+    def test_render_cache(self, engine, monkeypatch):
+        """Test that rendered descriptions are reused for the same template, extraction and context."""
+        template = engine.template_registry['Deployment Intent'][0]
+        context = make_context()
+        extracted = engine._extract_comprehensive_parameters(context.parameters)
+        description = engine._render_description(template, context, extracted)
+        monkeypatch.setattr(engine, '_populate_comprehensive_template', None)
+        assert engine._render_description(template, make_context(), extracted) is description
+        retry = engine._extract_comprehensive_parameters(dict(context.parameters))
+        assert engine._render_description(template, make_context(), retry) is description
+        monkeypatch.undo()
+        other = engine._render_description(template, make_context(complexity=2), extracted)
+        assert other == engine._apply_post_processing(
+            engine._populate_comprehensive_template(template, make_context(complexity=2), extracted),
+            make_context(complexity=2), extracted
+        )
+    
+    def test_score_batch_matches_individual_scores(self, engine):
+        """Test that batch scoring agrees with the per-template scorers."""
+        templates = engine.template_registry['Deployment Intent'][:6]
+        contexts = [
+            make_context(),
+            make_context(complexity=2, priority='LOW', slice_category='eMBB'),
+            make_context(complexity=9, priority='CRITICAL', intent_type='Modification Intent'),
+        ]
+        scores = engine.score_batch(templates, contexts)
+        for row, context in enumerate(contexts):
+            extracted = engine._extract_comprehensive_parameters(context.parameters)
+            for column, template in enumerate(templates):
+                expected = (
+                    engine._score_template_parameter_utilization(template, extracted) * 0.4
+                    + engine._score_template_context_alignment(template, context) * 0.35
+                    + engine._score_template_complexity_match(template, context.complexity) * 0.25
+                )
+                assert scores[row][column] == pytest.approx(expected)
+
+    def test_template_array_columns(self, engine):
+        """Test that compiled template arrays are parallel to the registry lists."""
+        templates = engine.template_registry['Intent Report Request']
+        array = engine._get_template_array(templates)
+        assert array is engine._get_template_array(templates)
+        assert array.texts == tuple(templates)
+        for i, template in enumerate(templates):
+            mask, bucket_scores = engine._get_template_features(template)
+            assert array.masks[i] == mask
+            assert tuple(column[i] for column in array.bucket_scores) == bucket_scores
+            assert (array.placeholders[i], array.category_scores[i]) == engine._template_profiles[template]
+    
+    def test_post_processing_cleanup(self, engine):
+        """Test placeholder scrubbing, whitespace collapsing and word dedupe."""
+        context = make_context(complexity=3, priority='LOW', slice_category='Private_Network')
+        extracted = ParameterExtraction()
+        description = engine._apply_post_processing(
+            'deploy  the the   core on {unknown} nodes', context, extracted
+        )
+        assert description == 'Deploy the core on advanced nodes.'
+
+    def test_post_processing_enhancements(self, engine):
+        """Test that context rewrites apply once and only to whole words."""
+        context = make_context(complexity=9, priority='CRITICAL', slice_category='URLLC')
+        description = engine._apply_post_processing(
+            'deploy advanced slice with low latency within budget', context, ParameterExtraction()
+        )
+        assert description == (
+            'Deploy research-grade sophisticated slice with mission-critical '
+            'low ultra-low latency within budget.'
+        )
+
+    def test_slice_rewrites_single_pass(self):
+        """Test that slice rewrites are compiled once per context and never chain."""
+        rewrite = _build_rewriter(3, 'LOW', 'eMBB')
+        assert rewrite is _build_rewriter(3, 'LOW', 'eMBB')
+        text = ' '.join(SLICE_ENHANCEMENTS['eMBB'])
+        assert rewrite(text) == ' '.join(SLICE_ENHANCEMENTS['eMBB'].values())
+
+    def test_rewrites_idempotent(self):
+        """Test that already-enhanced phrases are not enhanced again."""
+        rewrite = _build_rewriter(8, 'CRITICAL', 'URLLC')
+        once = rewrite('run advanced checks with low latency using spare nodes')
+        assert once == (
+            'run enterprise-class advanced checks with mission-critical low '
+            'ultra-low latency using fault-tolerant spare nodes'
+        )
+        assert rewrite(once) == once
+
+        # Every table entry, including hyphenated ones, is a fixed point
+        rewriters = [(_build_rewriter(level, '', ''), table)
+                     for level, table in enumerate(COMPLEXITY_ENHANCEMENTS)]
+        rewriters += [(_build_rewriter(0, priority, ''), table)
+                      for priority, table in PRIORITY_ENHANCEMENTS.items()]
+        rewriters += [(_build_rewriter(0, '', slice_category), table)
+                      for slice_category, table in SLICE_ENHANCEMENTS.items()]
+        for rewrite, table in rewriters:
+            for word, phrase in table.items():
+                sentence = f'keep {word} and {phrase} here'
+                once = rewrite(sentence)
+                assert rewrite(once) == once, (word, phrase)
+                assert rewrite(phrase) == phrase, (word, phrase)
+
+    def test_rewrite_does_not_stutter_hyphenated_phrases(self):
+        """Test that a rewrite into a hyphenated phrase absorbs the repeated word."""
+        rewrite = _build_rewriter(5, 'HIGH', 'eMBB')
+        assert rewrite('To assure high throughput, this intent activates an aggressive policy.') == \
+            'To assure high-throughput, this intent activates an aggressive policy.'
+
+    def test_fractional_complexity(self, engine):
+        """Test that fractional complexities render a template and use the level thresholds."""
+        for complexity in (7.5, 10.0):
+            description, template = engine.generate_description(make_context(complexity=complexity))
+            assert template != 'FALLBACK_TEMPLATE'
+        assert _build_rewriter(8.5, 'LOW', 'eMBB')('advanced') == 'enterprise-class advanced'
+        assert _build_rewriter(6.9, 'LOW', 'eMBB')('advanced') == 'advanced'
+
+    def test_compile_template(self):
+        """Test that templates are split once into literals and ordered placeholders."""
+        literals, placeholders = _compile_template('Run {a} on {b} then {a}.')
+        assert literals == ('Run ', ' on ', ' then ', '.')
+        assert placeholders == ('{a}', '{b}', '{a}')
+        assert _compile_template('Run {a} on {b} then {a}.') is _compile_template('Run {a} on {b} then {a}.')
+        assert _compile_template('No placeholders') == (('No placeholders',), ())
+    
+    def test_registry_templates_pre_split(self, engine):
+        """Test that registry templates are split at import, not on first render."""
+        misses = _compile_template.cache_info().misses
+        for templates in engine.template_registry.values():
+            for template in templates:
+                _compile_template(template)
+        assert _compile_template.cache_info().misses == misses
+    
+    def test_resolve_substitution(self, engine):
+        """Test that placeholders resolve to extracted values, defaults or context values."""
+        context = make_context()
+        extracted = engine._extract_comprehensive_parameters(
+            {'tenant_id': 'T1',
+             'advanced_orchestration_parameters': {'multi_cloud_orchestration': {'cloud_providers': ['GCP']}}}
+        )
+        resolve = lambda placeholder: engine._resolve_substitution(placeholder, context, extracted.flat)
+        assert resolve('{tenant_id}') == 'T1'
+        assert resolve('{architecture}') == 'Standalone_5G'
+        assert resolve('{priority_level_num}') == 15
+        assert resolve('{priority_level}') == 'high'
+        assert resolve('{intent_type}') == 'deployment intent'
+        assert resolve('{location_category}') == 'high-density metropolitan zone with complex RF environment'
+        assert resolve('{cloud_providers}') == 'GCP'
+        assert resolve('{unknown}') is MISSING
+        assert engine._populate_comprehensive_template(
+            'Run {tenant_id} on {cloud_providers} with {architecture} at {priority_level_num} in {unknown}',
+            context, extracted
+        ) == 'Run T1 on GCP with Standalone_5G at 15 in advanced'
+
+    def test_rendered_values_cached_per_extraction(self, engine):
+        """Test that only extraction-backed placeholders are cached per extraction."""
+        extracted = engine._extract_comprehensive_parameters({'tenant_id': 'T1'})
+        template = 'Deploy {tenant_id} on {cloud_providers} for {priority_level}'
+        assert engine._populate_comprehensive_template(template, make_context(priority='LOW'), extracted) == \
+            'Deploy T1 on AWS, Azure for low'
+        assert engine._rendered_values[extracted.render_key] == {'{tenant_id}': 'T1', '{cloud_providers}': 'AWS, Azure'}
+        assert engine._populate_comprehensive_template(template, make_context(priority='HIGH'), extracted) == \
+            'Deploy T1 on AWS, Azure for high'
+    
+    def test_cloud_providers_joined_once_per_extraction(self, engine, monkeypatch):
+        """Test that the cloud provider list is joined once and then reused."""
+        from src.Intents_Generators import Template_Engine
+        calls = []
+        join = Template_Engine._join_cloud_providers
+        monkeypatch.setattr(Template_Engine, '_join_cloud_providers', lambda params: calls.append(1) or join(params))
+        extracted = engine._extract_comprehensive_parameters(
+            {'advanced_orchestration_parameters': {'multi_cloud_orchestration': {'cloud_providers': ['GCP', 'OCI']}}}
+        )
+        for priority in ('LOW', 'HIGH'):
+            assert engine._populate_comprehensive_template(
+                'Burst onto {cloud_providers}', make_context(priority=priority), extracted
+            ) == 'Burst onto GCP, OCI'
+        assert len(calls) == 1
+    
+    def test_format_parameter_value(self, engine):
+        """Test value formatting for each supported type."""
+        assert engine._format_parameter_value(None, '{x}') == 'advanced'
+        assert engine._format_parameter_value(True, '{x}') == 'enabled'
+        assert engine._format_parameter_value(False, '{x}') == 'disabled'
+        assert engine._format_parameter_value(8, '{x}') == '8'
+        assert engine._format_parameter_value(['AWS', 'GCP'], '{x}') == 'AWS, GCP'
+        assert engine._format_parameter_value('  null ', '{x}') == 'advanced'
+        assert engine._format_parameter_value(' NVMe ', '{x}') == 'NVMe'
+
+    def test_fallback_description(self, engine):
+        """Test that fallback descriptions render without leftover fields."""
+        context = make_context(intent_type='Unknown Intent')
+        description, template = engine.generate_description(context)
+        assert template == "FALLBACK_TEMPLATE"
+        assert description in {
+            fmt.format(
+                complexity_level=_get_complexity_description(7),
+                intent_type='unknown intent',
+                slice_category='URLLC',
+                priority='high',
+                location_category='urban',
+            )
+            for fmt in engine._FALLBACK_FORMATS
+        }
+
+    def test_dedicated_rng_is_reproducible(self):
+        """Test that engines sharing a seed pick the same templates."""
+        first = AdvancedTemplateEngine(rng=random.Random(7))
+        second = AdvancedTemplateEngine(rng=random.Random(7))
+        contexts = [make_context(complexity=c) for c in range(1, 11)]
+        assert [first.generate_description(c) for c in contexts] == \
+            [second.generate_description(c) for c in contexts]
+
+    def test_generate_descriptions_batch_matches_sequential(self):
+        """Test that batch generation matches per-context generation."""
+        contexts = [
+            make_context(complexity=c, intent_type=intent_type)
+            for c in (2, 5, 9)
+            for intent_type in ('Deployment Intent', 'Modification Intent', 'Unknown Intent')
+        ]
+        batch = AdvancedTemplateEngine(rng=random.Random(3)).generate_descriptions_batch(contexts)
+        single = AdvancedTemplateEngine(rng=random.Random(3))
+        assert batch == [single.generate_description(context) for context in contexts]
+
+    def test_generate_descriptions_parallel_matches_seeded_chunks(self):
+        """Test that parallel generation matches per-chunk seeded batches."""
+        contexts = [
+            make_context(complexity=c, intent_type=intent_type)
+            for c in (2, 5, 9)
+            for intent_type in ('Deployment Intent', 'Modification Intent', 'Unknown Intent')
+        ]
+        engine = AdvancedTemplateEngine()
+        parallel = engine.generate_descriptions_parallel(contexts, workers=2, seed=11, chunk_size=4)
+        expected = []
+        for index, start in enumerate(range(0, len(contexts), 4)):
+            chunk_engine = AdvancedTemplateEngine(rng=random.Random(11 + index))
+            expected.extend(chunk_engine.generate_descriptions_batch(contexts[start:start + 4]))
+        assert parallel == expected
+
+    def test_generate_descriptions_matches_repeated_calls(self):
+        """Test that variant generation matches repeated single calls."""
+        for intent_type in ('Deployment Intent', 'Unknown Intent'):
+            context = make_context(intent_type=intent_type)
+            variants = AdvancedTemplateEngine(rng=random.Random(5)).generate_descriptions(context, 6)
+            single = AdvancedTemplateEngine(rng=random.Random(5))
+            assert variants == [single.generate_description(context) for _ in range(6)]
@@ -0,0 +1,61 @@
+"""
+Unit tests for Template_Kernels.
+"""
+from src.Intents_Generators.Template_Kernels import dedupe_tokens, extract_flat, render_template
+
+
+class TestExtractFlat:
+    """Test suite for extract_flat."""
+
+    SPECS = (
+        ('architecture', 'network_topology.network_architecture', ('network_topology', 'network_architecture'), 'SA'),
+        ('low_band', 'network_topology.spectrum_bands.low_band', ('network_topology', 'spectrum_bands', 'low_band'), '700MHz'),
+        ('tenant_id', 'tenant_id', ('tenant_id',), 'TENANT'),
+    )
+
+    def test_resolves_nested_paths(self):
+        """Test that present values are returned, including explicit None."""
+        flat, defaulted = extract_flat(
+            {'network_topology': {'network_architecture': 'NSA',
+                                  'spectrum_bands': {'low_band': None}},
+             'tenant_id': 'T1'},
+            self.SPECS,
+        )
+        assert flat == {'architecture': 'NSA', 'low_band': None, 'tenant_id': 'T1'}
+        assert defaulted == []
+
+    def test_reports_defaults(self):
+        """Test that missing or non-dict levels fall back and are reported."""
+        flat, defaulted = extract_flat({'network_topology': {'spectrum_bands': 'n78'}}, self.SPECS)
+        assert flat == {'architecture': 'SA', 'low_band': '700MHz', 'tenant_id': 'TENANT'}
+        assert [path for path, _ in defaulted] == [spec[1] for spec in self.SPECS]
+
+
+class TestDedupeTokens:
+    """Test suite for dedupe_tokens."""
+
+    def test_collapses_repeats_and_whitespace(self):
+        """Test that runs of repeated tokens and whitespace collapse."""
+        assert dedupe_tokens('  the the  the core\tcore nodes ') == 'the core nodes'
+
+    def test_drops_word_repeated_as_compound_start(self):
+        """Test that a word repeated at the start of a hyphenated or punctuated word is dropped."""
+        assert dedupe_tokens('To assure high high-throughput') == 'To assure high-throughput'
+        assert dedupe_tokens('store data data. Then') == 'store data. Then'
+        assert dedupe_tokens('high highway') == 'high highway'
+
+    def test_empty(self):
+        """Test that blank input yields an empty string."""
+        assert dedupe_tokens('   ') == ''
+
+
+class TestRenderTemplate:
+    """Test suite for render_template."""
+
+    def test_interleaves_literals_and_values(self):
+        """Test that substituted values are placed between the literals."""
+        assert render_template(('Run ', ' on ', '.'), ('{a}', '{b}'), str.upper) == 'Run {A} on {B}.'
+
+    def test_no_placeholders(self):
+        """Test that a template without placeholders renders as its literal."""
+        assert render_template(('Static text',), (), str.upper) == 'Static text'
@@ -5,6 +5,7 @@ import pytest
 import uuid
 from src.Intents_Generators.utils_generator import (
     generate_unique_id,
+    get_nested,
     random_choice,
     random_int,
     current_timestamp,
@@ -37,6 +38,22 @@ class TestGenerateUniqueId:
             assert False, f"ID {result} is not a valid hex string"
 
 
+class TestGetNested:
+    """Test nested key path lookup."""
+    
+    def test_returns_nested_value(self):
+        """Test that a present path returns its value, including None."""
+        data = {'a': {'b': {'c': 1}, 'n': None}}
+        assert get_nested(data, ('a', 'b', 'c'), 0) == 1
+        assert get_nested(data, ('a', 'n'), 0) is None
+    
+    def test_missing_or_non_dict_level_returns_default(self):
+        """Test that missing keys and non-dict levels fall back to the default."""
+        data = {'a': {'b': 'leaf'}}
+        assert get_nested(data, ('x', 'y'), 'default') == 'default'
+        assert get_nested(data, ('a', 'b', 'c'), 'default') == 'default'
+
+
 class TestRandomChoice:
     """Test random_choice function."""
     